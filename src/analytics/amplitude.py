@@ -1,13 +1,14 @@
 import functools
-import json
 
 import requests
 from ipware import get_client_ip
 
+from analytics.event_queue import enqueue_amplitude_event
 from researchhub.settings import AMPLITUDE_API_KEY, DEVELOPMENT
-from utils.parsers import json_serial
 from utils.sentry import log_info
 
+AMPLITUDE_REQUEST_TIMEOUT = 10
+
 
 class Amplitude:
     api_key = AMPLITUDE_API_KEY
@@ -84,20 +85,20 @@ class Amplitude:
         if extra_data := getattr(res, "amplitude_data", None):
             data["event_properties"].update(extra_data)
 
-        hit = {
-            "api_key": self.api_key,
-            "events": [data],
-        }
-        hit = json.dumps(hit, default=json_serial)
-        self.forward_event(hit)
+        # Shipped in batches by analytics.tasks.ship_amplitude_events_task
+        enqueue_amplitude_event(data)
 
     def forward_event(self, hit):
         headers = {"Content-Type": "application/json", "Accept": "*/*"}
-        request = requests.post(self.api_url, data=hit, headers=headers)
-        res = request.json()
-        if request.status_code != 200:
-            log_info(res)
-        return res
+        response = requests.post(
+            self.api_url,
+            data=hit,
+            headers=headers,
+            timeout=AMPLITUDE_REQUEST_TIMEOUT,
+        )
+        if response.status_code != 200:
+            log_info(response.text)
+        return response
 
 
 def track_event(func):
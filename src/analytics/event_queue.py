@@ -0,0 +1,182 @@
+import json
+
+from django.core.cache import cache
+
+from utils.cache import incr_cache_counter
+from utils.cache_queue import CacheQueue
+from utils.parsers import json_serial
+
+AMPLITUDE_QUEUE_MAX_SIZE = 50000
+AMPLITUDE_QUEUE_SLOT_TIMEOUT = 60 * 60 * 24
+AMPLITUDE_QUEUE_LOCK_TIMEOUT = 60 * 5
+AMPLITUDE_BATCH_SIZE = 500
+AMPLITUDE_MAX_BATCHES_PER_RUN = 20
+AMPLITUDE_BACKOFF_BASE_SECONDS = 30
+AMPLITUDE_BACKOFF_MAX_SECONDS = 60 * 60
+
+AMPLITUDE_QUEUE_METRICS = ("enqueued", "dropped", "shipped", "rejected", "failed")
+
+# Fields of a 400 response listing the indices of the offending events
+AMPLITUDE_INVALID_EVENT_FIELDS = (
+    "events_with_invalid_fields",
+    "events_with_missing_fields",
+)
+
+amplitude_queue = CacheQueue(
+    "amplitude_queue",
+    AMPLITUDE_QUEUE_METRICS,
+    slot_timeout=AMPLITUDE_QUEUE_SLOT_TIMEOUT,
+    lock_timeout=AMPLITUDE_QUEUE_LOCK_TIMEOUT,
+)
+
+
+def incr_amplitude_queue_metric(metric, delta=1):
+    return amplitude_queue.incr_metric(metric, delta)
+
+
+def get_amplitude_queue_metrics():
+    return amplitude_queue.get_metrics()
+
+
+def reset_amplitude_queue_metrics():
+    amplitude_queue.reset_metrics()
+
+
+def get_amplitude_queue_size():
+    return amplitude_queue.size()
+
+
+def enqueue_amplitude_event(event):
+    """
+    Buffers an Amplitude event for the periodic shipper. Events are
+    dropped, not queued, once the backlog is full so an Amplitude outage
+    cannot grow the cache without bound.
+    """
+    if get_amplitude_queue_size() >= AMPLITUDE_QUEUE_MAX_SIZE:
+        incr_amplitude_queue_metric("dropped")
+        return False
+
+    amplitude_queue.push(json.dumps(event, default=json_serial))
+    incr_amplitude_queue_metric("enqueued")
+    return True
+
+
+class AmplitudeUnavailable(Exception):
+    pass
+
+
+def get_invalid_event_indices(response):
+    """Returns the indices of the events a 400 response names as invalid."""
+    try:
+        body = response.json()
+    except ValueError:
+        return set()
+    if not isinstance(body, dict):
+        return set()
+
+    indices = set()
+    for field in AMPLITUDE_INVALID_EVENT_FIELDS:
+        for field_indices in (body.get(field) or {}).values():
+            indices.update(field_indices)
+    return indices
+
+
+class AmplitudeEventShipper:
+    """
+    Sends buffered events to Amplitude in batches. A failed batch stays
+    in the queue and shipping pauses with an exponential backoff.
+
+    Only the events Amplitude rejects are dropped. When a rejection does
+    not name them, the batch is split and the halves are sent on their
+    own until the invalid events are isolated. Events carry an insert_id,
+    so Amplitude deduplicates parts of a batch that are sent again after
+    a backoff.
+    """
+
+    def __init__(self, amplitude, batch_size=AMPLITUDE_BATCH_SIZE):
+        self.amplitude = amplitude
+        self.batch_size = batch_size
+
+    def _back_off(self):
+        attempts = incr_cache_counter(amplitude_queue.get_key("attempts"))
+        timeout = min(
+            AMPLITUDE_BACKOFF_BASE_SECONDS * 2 ** (attempts - 1),
+            AMPLITUDE_BACKOFF_MAX_SECONDS,
+        )
+        cache.set(amplitude_queue.get_key("backoff"), True, timeout=timeout)
+        incr_amplitude_queue_metric("failed")
+
+    def _build_hit(self, events):
+        # Events are stored serialized, so join them instead of decoding
+        return (
+            f'{{"api_key": {json.dumps(self.amplitude.api_key)}, '
+            f'"events": [{",".join(events)}]}}'
+        )
+
+    def _send(self, events):
+        """
+        Sends `events` and returns how many were accepted. Raises
+        AmplitudeUnavailable when the request should be retried later.
+        """
+        try:
+            response = self.amplitude.forward_event(self._build_hit(events))
+        except Exception as e:
+            raise AmplitudeUnavailable() from e
+
+        if response.status_code == 429 or response.status_code >= 500:
+            raise AmplitudeUnavailable()
+        elif response.status_code == 200:
+            incr_amplitude_queue_metric("shipped", len(events))
+            return len(events)
+
+        invalid = get_invalid_event_indices(response)
+        if invalid:
+            valid = [event for i, event in enumerate(events) if i not in invalid]
+            incr_amplitude_queue_metric("rejected", len(events) - len(valid))
+            return self._send(valid) if valid else 0
+        elif len(events) == 1:
+            incr_amplitude_queue_metric("rejected")
+            return 0
+
+        middle = len(events) // 2
+        return self._send(events[:middle]) + self._send(events[middle:])
+
+    def ship_batch(self):
+        """
+        Returns the number of events sent, or None when shipping should
+        stop for this run.
+        """
+        head, tail = amplitude_queue.get_range(self.batch_size)
+        if tail <= head:
+            return None
+
+        events = amplitude_queue.read(head, tail)
+        sent = 0
+        if events:
+            try:
+                sent = self._send(events)
+            except AmplitudeUnavailable:
+                self._back_off()
+                return None
+
+        amplitude_queue.advance(head, tail)
+        cache.delete(amplitude_queue.get_key("attempts"))
+        return sent
+
+    def ship(self, max_batches=AMPLITUDE_MAX_BATCHES_PER_RUN):
+        if cache.get(amplitude_queue.get_key("backoff")):
+            return 0
+
+        shipped = 0
+        for _ in range(max_batches):
+            sent = self.ship_batch()
+            if sent is None:
+                break
+            shipped += sent
+        return shipped
+
+
+def ship_amplitude_events():
+    from analytics.amplitude import Amplitude
+
+    return amplitude_queue.run_exclusively(AmplitudeEventShipper(Amplitude()).ship)
@@ -0,0 +1,10 @@
+from analytics.event_queue import (
+    get_amplitude_queue_metrics,
+    reset_amplitude_queue_metrics,
+)
+from utils.management import MetricsCommand
+
+
+class Command(MetricsCommand):
+    get_metrics = staticmethod(get_amplitude_queue_metrics)
+    reset_metrics = staticmethod(reset_amplitude_queue_metrics)
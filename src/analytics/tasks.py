@@ -0,0 +1,14 @@
+from celery.decorators import periodic_task
+from celery.task.schedules import crontab
+
+from analytics.event_queue import ship_amplitude_events
+from researchhub.celery import QUEUE_EXTERNAL_REPORTING
+
+
+@periodic_task(
+    run_every=crontab(minute="*"),
+    priority=3,
+    queue=QUEUE_EXTERNAL_REPORTING,
+)
+def ship_amplitude_events_task():
+    ship_amplitude_events()
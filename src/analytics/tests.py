@@ -1,3 +1,65 @@
+import json
+
+from django.core.cache import cache
 from django.test import TestCase
 
-# Create your tests here.
+from analytics.event_queue import (
+    AmplitudeEventShipper,
+    amplitude_queue,
+    enqueue_amplitude_event,
+    get_amplitude_queue_metrics,
+)
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=None):
+        self.status_code = status_code
+        self.body = body or {}
+
+    def json(self):
+        return self.body
+
+
+class FakeAmplitude:
+    """Rejects every batch that contains an event marked invalid."""
+
+    api_key = "key"
+
+    def __init__(self, name_invalid_events=False):
+        self.name_invalid_events = name_invalid_events
+        self.received = []
+
+    def forward_event(self, hit):
+        events = json.loads(hit)["events"]
+        invalid = [i for i, event in enumerate(events) if event.get("invalid")]
+        if not invalid:
+            self.received.extend(event["id"] for event in events)
+            return FakeResponse(200)
+        if self.name_invalid_events:
+            return FakeResponse(400, {"events_with_invalid_fields": {"id": invalid}})
+        return FakeResponse(413)
+
+
+class AmplitudeEventShipperTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        for i in range(6):
+            enqueue_amplitude_event({"id": i, "invalid": i == 3})
+
+    def test_drops_only_named_invalid_events(self):
+        amplitude = FakeAmplitude(name_invalid_events=True)
+        self.assertEqual(AmplitudeEventShipper(amplitude).ship(), 5)
+        self.assertEqual(amplitude.received, [0, 1, 2, 4, 5])
+        self.assertEqual(get_amplitude_queue_metrics()["rejected"], 1)
+
+    def test_splits_batches_rejected_without_details(self):
+        amplitude = FakeAmplitude()
+        self.assertEqual(AmplitudeEventShipper(amplitude).ship(), 5)
+        self.assertEqual(sorted(amplitude.received), [0, 1, 2, 4, 5])
+        self.assertEqual(get_amplitude_queue_metrics()["backlog"], 0)
+
+    def test_missing_slots_are_counted_as_lost(self):
+        cache.delete(amplitude_queue.get_slot_key(2))
+        amplitude = FakeAmplitude(name_invalid_events=True)
+        self.assertEqual(AmplitudeEventShipper(amplitude).ship(), 4)
+        self.assertEqual(get_amplitude_queue_metrics()["lost"], 1)
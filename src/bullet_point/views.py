@@ -37,11 +37,7 @@ from utils.http import DELETE, POST, PATCH, PUT
 from utils.permissions import CreateOrUpdateIfAllowed
 from utils.throttles import THROTTLE_CLASSES
 
-from utils.siftscience import (
-    events_api,
-    decisions_api,
-    update_user_risk_score
-)
+from utils.siftscience import events_api, decisions_api
 
 from reputation.models import Contribution
 from reputation.tasks import create_contribution
@@ -112,12 +108,11 @@ class BulletPointViewSet(viewsets.ModelViewSet, ActionableViewSet):
             context=context
         ).data
 
-        tracked_bullet_point = events_api.track_content_bullet_point(
+        events_api.track_content_bullet_point(
             bullet_point.created_by,
             bullet_point,
             request,
         )
-        update_user_risk_score(bullet_point.created_by, tracked_bullet_point)
 
         # Deprecating bulletpoint contributions until(?)
         # we bring bulletpoints back
@@ -234,13 +229,12 @@ class BulletPointViewSet(viewsets.ModelViewSet, ActionableViewSet):
             bullet_point.remove_from_head()
             bullet_point.save()
 
-            tracked_bullet_point = events_api.track_content_bullet_point(
+            events_api.track_content_bullet_point(
                 head_bullet_point.created_by,
                 head_bullet_point,
                 request,
                 update=True
             )
-            update_user_risk_score(head_bullet_point.created_by, tracked_bullet_point)
 
         serialized = self.get_serializer(instance=head_bullet_point)
         return Response(serialized.data, status=status.HTTP_201_CREATED)
@@ -16,10 +16,10 @@ from discussion.reaction_serializers import (
     FlagSerializer,
     VoteSerializer,
 )
+from discussion.vote_score import update_vote_score
 from reputation.models import Contribution
 from reputation.tasks import create_contribution
 from researchhub_comment.models import RhCommentModel
-from researchhub_document.related_models.constants.document_type import SORT_UPVOTED
 from researchhub_document.related_models.constants.filters import (
     DISCUSSED,
     HOT,
@@ -29,7 +29,7 @@ from researchhub_document.utils import get_doc_type_key, reset_unified_document_
 from utils.models import SoftDeletableModel
 from utils.permissions import CreateOrUpdateIfAllowed
 from utils.sentry import log_error
-from utils.siftscience import decisions_api, events_api, update_user_risk_score
+from utils.siftscience import decisions_api, events_api
 
 
 def censor(requestor, item):
@@ -185,7 +185,6 @@ class ReactionViewActionMixin:
                     "This vote already exists", status=status.HTTP_400_BAD_REQUEST
                 )
             response = update_or_create_vote(request, user, item, Vote.UPVOTE)
-            item.unified_document.update_filter(SORT_UPVOTED)
             return response
 
     @action(
@@ -224,7 +223,6 @@ class ReactionViewActionMixin:
                     "This vote already exists", status=status.HTTP_400_BAD_REQUEST
                 )
             response = update_or_create_vote(request, user, item, Vote.DOWNVOTE)
-            item.unified_document.update_filter(SORT_UPVOTED)
             return response
 
     @action(detail=True, methods=["get"])
@@ -283,19 +281,17 @@ class ReactionViewActionMixin:
         self, request, response, model, is_thread=False
     ):
         item = model.objects.get(pk=response.data["id"])
-        tracked_comment = events_api.track_content_comment(
+        events_api.track_content_comment(
             item.created_by, item, request, is_thread=is_thread
         )
-        update_user_risk_score(item.created_by, tracked_comment)
 
     def sift_track_update_content_comment(
         self, request, response, model, is_thread=False
     ):
         item = model.objects.get(pk=response.data["id"])
-        tracked_comment = events_api.track_content_comment(
+        events_api.track_content_comment(
             item.created_by, item, request, is_thread=is_thread, update=True
         )
-        update_user_risk_score(item.created_by, tracked_comment)
 
 
 def retrieve_endorsement(user, item):
@@ -384,24 +380,12 @@ def update_or_create_vote(request, user, item, vote_type):
 
     """UPDATE VOTE"""
     vote = retrieve_vote(user, item)
-    if vote_type == Vote.UPVOTE and vote and vote.vote_type == vote.DOWNVOTE:
-        item.score += 2
-    elif vote_type == Vote.DOWNVOTE and vote and vote.vote_type == vote.UPVOTE:
-        item.score -= 2
-    elif vote_type == Vote.UPVOTE:
-        item.score += 1
-    elif vote_type == Vote.DOWNVOTE:
-        item.score -= 1
-    elif vote_type == Vote.NEUTRAL and vote and vote.vote_type == Vote.UPVOTE:
-        item.score -= 1
-    elif vote_type == Vote.NEUTRAL and vote and vote.vote_type == Vote.DOWNVOTE:
-        item.score += 1
-
-    item.save()
+    score_delta = get_vote_score_delta(vote, vote_type)
 
     if vote is not None:
         vote.vote_type = vote_type
         vote.save(update_fields=["updated_date", "vote_type"])
+        update_vote_score(item, score_delta, vote.created_date)
         if has_unified_doc:
             update_relavent_doc_caches_on_vote(
                 cache_filters_to_reset=cache_filters_to_reset,
@@ -414,6 +398,7 @@ def update_or_create_vote(request, user, item, vote_type):
 
     """CREATE VOTE"""
     vote = create_vote(user, item, vote_type)
+    update_vote_score(item, score_delta, vote.created_date)
     if has_unified_doc:
         update_relavent_doc_caches_on_vote(
             cache_filters_to_reset=cache_filters_to_reset,
@@ -445,6 +430,15 @@ def update_or_create_vote(request, user, item, vote_type):
     return get_vote_response(vote, 201)
 
 
+def get_vote_score_delta(previous_vote, vote_type):
+    """Returns the change in score when `previous_vote` becomes `vote_type`."""
+    vote_values = {Vote.UPVOTE: 1, Vote.DOWNVOTE: -1, Vote.NEUTRAL: 0}
+    previous_value = 0
+    if previous_vote is not None:
+        previous_value = vote_values.get(previous_vote.vote_type, 0)
+    return vote_values.get(vote_type, 0) - previous_value
+
+
 def update_relavent_doc_caches_on_vote(cache_filters_to_reset, hub_ids, target_vote):
     item = target_vote.item
     doc_type = get_doc_type_key(item.unified_document)
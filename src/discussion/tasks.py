@@ -0,0 +1,11 @@
+from django.apps import apps
+
+from researchhub.celery import QUEUE_HOT_SCORE, app
+
+
+@app.task(queue=QUEUE_HOT_SCORE)
+def flush_vote_score_delta(app_label, model_name, pk, bucket):
+    from discussion.vote_score import flush_buffered_vote_score
+
+    model = apps.get_model(app_label, model_name)
+    flush_buffered_vote_score(model, pk, bucket)
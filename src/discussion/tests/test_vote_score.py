@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta
+
+import pytz
+from rest_framework.test import APITestCase
+
+from discussion.vote_score import (
+    VOTE_SCORE_HOT_THRESHOLD,
+    flush_buffered_vote_score,
+    update_vote_score,
+)
+from paper.models import Paper
+from paper.tests.helpers import create_paper
+from researchhub_document.related_models.document_filter_model import (
+    get_activity_bucket_start,
+)
+from user.tests.helpers import create_random_default_user
+
+
+class VoteScoreTests(APITestCase):
+    def setUp(self):
+        self.user = create_random_default_user("vote_score_user")
+        self.paper = create_paper(uploaded_by=self.user)
+        self.now = datetime.now(pytz.UTC)
+
+    def test_update_applies_delta_atomically(self):
+        stale = Paper.objects.get(id=self.paper.id)
+        update_vote_score(self.paper, 1, self.now)
+        update_vote_score(stale, 1, self.now)
+
+        self.paper.refresh_from_db()
+        self.assertEqual(self.paper.score, 2)
+        self.assertEqual(self.paper.unified_document.document_filter.upvoted_all, 2)
+
+    def test_hot_item_deltas_are_flushed_once(self):
+        for _ in range(VOTE_SCORE_HOT_THRESHOLD + 3):
+            update_vote_score(self.paper, 1, self.now)
+
+        self.paper.refresh_from_db()
+        self.assertEqual(self.paper.score, VOTE_SCORE_HOT_THRESHOLD)
+
+        bucket = int(get_activity_bucket_start(self.now).timestamp())
+        self.assertEqual(flush_buffered_vote_score(Paper, self.paper.id, bucket), 3)
+        self.assertEqual(flush_buffered_vote_score(Paper, self.paper.id, bucket), 0)
+        self.paper.refresh_from_db()
+        self.assertEqual(self.paper.score, VOTE_SCORE_HOT_THRESHOLD + 3)
+
+    def test_filters_count_the_vote_at_its_creation_date(self):
+        # A vote changed today on a document voted on weeks ago
+        update_vote_score(self.paper, 1, self.now - timedelta(days=20))
+
+        document_filter = self.paper.unified_document.document_filter
+        document_filter.refresh_from_db()
+        self.assertEqual(document_filter.upvoted_all, 1)
+        self.assertEqual(document_filter.upvoted_month, 1)
+        self.assertEqual(document_filter.upvoted_week, 0)
+        self.assertEqual(document_filter.upvoted_today, 0)
@@ -49,7 +49,6 @@ from researchhub_document.related_models.constants.document_type import (
     FILTER_BOUNTY_OPEN,
     SORT_BOUNTY_EXPIRATION_DATE,
     SORT_BOUNTY_TOTAL_AMOUNT,
-    SORT_DISCUSSED,
 )
 from researchhub_document.related_models.constants.filters import (
     DISCUSSED,
@@ -121,7 +120,6 @@ class ThreadViewSet(viewsets.ModelViewSet, ReactionViewActionMixin):
             created_thread.review_id = request.data.get("review")
             created_thread.save()
 
-        unified_document.update_filter(SORT_DISCUSSED)
         hubs = list(unified_document.hubs.all().values_list("id", flat=True))
         discussion_id = response.data["id"]
 
@@ -360,7 +358,6 @@ class CommentViewSet(viewsets.ModelViewSet, ReactionViewActionMixin):
             request.data["created_location"] = BaseComment.CREATED_LOCATION_PROGRESS
         response = super().create(request, *args, **kwargs)
         response = self.get_self_upvote_response(request, response, Comment)
-        unified_document.update_filter(SORT_DISCUSSED)
         hubs = list(unified_document.hubs.all().values_list("id", flat=True))
         self.sift_track_create_content_comment(request, response, Comment)
 
@@ -529,7 +526,6 @@ class ReplyViewSet(viewsets.ModelViewSet, ReactionViewActionMixin):
             request.data["created_location"] = BaseComment.CREATED_LOCATION_PROGRESS
 
         response = super().create(request, *args, **kwargs)
-        unified_document.update_filter(SORT_DISCUSSED)
         hubs = list(unified_document.hubs.all().values_list("id", flat=True))
         self.sift_track_create_content_comment(request, response, Reply)
 
@@ -0,0 +1,127 @@
+from datetime import datetime
+
+import pytz
+from django.core.cache import cache
+from django.db.models import F
+
+from paper.utils import invalidate_paper_detail_cache
+from researchhub_document.related_models.document_filter_model import (
+    get_activity_bucket_start,
+)
+from researchhub_document.utils import schedule_hot_score_recalc
+from search.indexing_queue import INDEX_QUEUE_UPDATE, enqueue_index_update
+from utils.cache import incr_cache_counter
+
+# Only votes on the document itself count towards the upvoted_* filters
+UPVOTED_FILTER_MODEL_NAMES = ("paper", "researchhubpost", "hypothesis")
+
+# Items getting more votes than this within the window have their score
+# deltas buffered in the cache, per activity bucket of the votes, and
+# written by a delayed flush instead
+VOTE_SCORE_HOT_THRESHOLD = 20
+VOTE_SCORE_HOT_WINDOW_SECONDS = 60
+VOTE_SCORE_FLUSH_COUNTDOWN = 30
+
+
+def _get_item_key(prefix, app_label, model_name, pk, bucket=None):
+    key = f"vote_score_{prefix}_{app_label}_{model_name}_{pk}"
+    if bucket is not None:
+        key = f"{key}_{bucket}"
+    return key
+
+
+def _take(key):
+    delta = cache.get(key, 0)
+    if not delta:
+        return 0
+    try:
+        # Subtract rather than delete so concurrent deltas are kept
+        cache.decr(key, delta)
+    except ValueError:
+        return 0
+    return delta
+
+
+def apply_vote_score_delta(item, amount, vote_date):
+    """
+    Atomically adds `amount` to item.score and updates the consumers of
+    the score: search index, paper detail cache and upvoted_* filters.
+    The filters count the delta at `vote_date`, the creation date of the
+    vote, like the backfill and recomputes do.
+    """
+    model = item._meta.model
+    model.objects.filter(pk=item.pk).update(score=F("score") + amount)
+    # Queryset updates skip post_save, so reindex explicitly
+    enqueue_index_update(
+        INDEX_QUEUE_UPDATE, model._meta.app_label, model.__name__, item.pk
+    )
+    if model._meta.model_name == "paper":
+        invalidate_paper_detail_cache(item.pk)
+
+    unified_document = getattr(item, "unified_document", None)
+    if (
+        unified_document is None
+        or model._meta.model_name not in UPVOTED_FILTER_MODEL_NAMES
+    ):
+        return
+    document_filter = unified_document.document_filter
+    if document_filter is not None:
+        document_filter.increment_upvoted(vote_date, amount)
+
+
+def update_vote_score(item, amount, vote_date):
+    """
+    Adds the score delta of a vote created at `vote_date` to `item`.
+    Deltas for items with a burst of votes are merged in the cache and
+    written, along with their downstream updates, at most once per flush
+    countdown and activity bucket.
+    """
+    from discussion.tasks import flush_vote_score_delta
+
+    model = item._meta.model
+    app_label = model._meta.app_label
+    model_name = model.__name__
+    item.score += amount
+    if not amount:
+        return
+
+    rate_key = _get_item_key("rate", app_label, model_name, item.pk)
+    rate = incr_cache_counter(rate_key, 1, timeout=VOTE_SCORE_HOT_WINDOW_SECONDS)
+    if rate <= VOTE_SCORE_HOT_THRESHOLD:
+        apply_vote_score_delta(item, amount, vote_date)
+        return
+
+    bucket = int(get_activity_bucket_start(vote_date).timestamp())
+    delta_key = _get_item_key("delta", app_label, model_name, item.pk, bucket)
+    incr_cache_counter(delta_key, amount)
+    scheduled_key = _get_item_key("scheduled", app_label, model_name, item.pk, bucket)
+    if cache.add(scheduled_key, True, timeout=VOTE_SCORE_FLUSH_COUNTDOWN * 10):
+        flush_vote_score_delta.apply_async(
+            (app_label, model_name, item.pk, bucket),
+            countdown=VOTE_SCORE_FLUSH_COUNTDOWN,
+        )
+
+
+def flush_buffered_vote_score(model, pk, bucket):
+    """
+    Writes the deltas buffered for `pk` in the activity bucket starting at
+    the `bucket` timestamp. Returns the delta written.
+    """
+    app_label = model._meta.app_label
+    model_name = model.__name__
+    # Cleared first so deltas buffered during the flush schedule another
+    cache.delete(_get_item_key("scheduled", app_label, model_name, pk, bucket))
+
+    delta = _take(_get_item_key("delta", app_label, model_name, pk, bucket))
+    if not delta:
+        return 0
+
+    item = model.objects.filter(pk=pk).first()
+    if item is None:
+        return 0
+    apply_vote_score_delta(item, delta, datetime.fromtimestamp(bucket, tz=pytz.UTC))
+    # Votes buffered since the last recalculation moved the score after it
+    unified_document = getattr(item, "unified_document", None)
+    if unified_document is not None:
+        schedule_hot_score_recalc(unified_document.id)
+    return delta
@@ -145,6 +145,37 @@ class DynamicHypothesisSerializer(DynamicModelFieldSerializer):
     score = SerializerMethodField()
     unified_document = SerializerMethodField()
 
+    related_method_fields = {
+        "authors": (
+            (
+                "authors",
+                "hyp_dhs_get_authors",
+                "user.serializers.DynamicAuthorSerializer",
+            ),
+        ),
+        "created_by": (
+            (
+                "created_by",
+                "hyp_dhs_get_created_by",
+                "user.serializers.DynamicUserSerializer",
+            ),
+        ),
+        "hubs": (
+            (
+                "unified_document__hubs",
+                "hyp_dhs_get_hubs",
+                "hub.serializers.DynamicHubSerializer",
+            ),
+        ),
+        "unified_document": (
+            (
+                "unified_document",
+                "hyp_dhs_get_unified_document",
+                "researchhub_document.serializers.DynamicUnifiedDocumentSerializer",
+            ),
+        ),
+    }
+
     class Meta(object):
         model = Hypothesis
         fields = "__all__"
@@ -1,15 +1,38 @@
+import asyncio
+
 from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.postgres.fields import ArrayField, HStoreField
-from django.db import models
+from django.db import models, transaction
 
 from researchhub_document.related_models.researchhub_unified_document_model import (
     ResearchhubUnifiedDocument,
 )
 from user.models import User
 
+NOTIFICATION_SEND_FIELDS = [
+    "action_user",
+    "body",
+    "created_date",
+    "id",
+    "notification_type",
+    "read",
+    "read_date",
+    "recipient",
+]
+# Channel layer sends awaited together per round trip
+NOTIFICATION_SEND_BATCH_SIZE = 100
+# Notifications handed to a single delivery task
+NOTIFICATION_TASK_BATCH_SIZE = 500
+
+
+async def _group_send_many(channel_layer, messages):
+    await asyncio.gather(
+        *(channel_layer.group_send(room, message) for room, message in messages)
+    )
+
 
 class Notification(models.Model):
     DEPRECATED = "DEPRECATED"
@@ -90,38 +113,69 @@ class Notification(models.Model):
         super().save(*args, **kwargs)
 
     def send_notification(self):
+        Notification.send_notifications(Notification.objects.filter(id=self.id))
+
+    @classmethod
+    def bulk_create_and_send(cls, notifications):
+        """
+        Creates many notifications at once and delivers them from a
+        background task once the surrounding transaction commits.
+        Notifications that already have a body are created as is.
+        """
+        from notification.tasks import send_notifications_task
+
+        for notification in notifications:
+            if not notification.body:
+                notification.format_body()
+        created = cls.objects.bulk_create(
+            notifications, batch_size=NOTIFICATION_TASK_BATCH_SIZE
+        )
+
+        ids = [notification.id for notification in created]
+        for i in range(0, len(ids), NOTIFICATION_TASK_BATCH_SIZE):
+            batch_ids = ids[i : i + NOTIFICATION_TASK_BATCH_SIZE]
+            transaction.on_commit(
+                lambda batch_ids=batch_ids: send_notifications_task.apply_async(
+                    (batch_ids,), priority=5
+                )
+            )
+        return created
+
+    @classmethod
+    def send_notifications(cls, notifications):
         from notification.serializers import DynamicNotificationSerializer
         from notification.views import NotificationViewSet
 
+        notifications = list(
+            notifications.select_related(
+                "action_user__author_profile",
+                "recipient__author_profile",
+            )
+        )
         context = NotificationViewSet()._get_context()
-        notification = Notification.objects.get(id=self.id)
         serialized_data = DynamicNotificationSerializer(
-            notification,
-            _include_fields=[
-                "action_user",
-                "body",
-                "created_date",
-                "id",
-                "notification_type",
-                "read",
-                "read_date",
-                "recipient",
-            ],
+            notifications,
+            _include_fields=NOTIFICATION_SEND_FIELDS,
             context=context,
+            many=True,
         ).data
 
-        user = self.recipient
-        room = f"notification_{user.id}"
-        notification_type = self.notification_type
+        messages = [
+            (
+                f"notification_{notification.recipient_id}",
+                {
+                    "type": "send_notification",
+                    "notification_type": notification.notification_type,
+                    "data": data,
+                },
+            )
+            for notification, data in zip(notifications, serialized_data)
+        ]
         channel_layer = get_channel_layer()
-        async_to_sync(channel_layer.group_send)(
-            room,
-            {
-                "type": "send_notification",
-                "notification_type": notification_type,
-                "data": serialized_data,
-            },
-        )
+        for i in range(0, len(messages), NOTIFICATION_SEND_BATCH_SIZE):
+            async_to_sync(_group_send_many)(
+                channel_layer, messages[i : i + NOTIFICATION_SEND_BATCH_SIZE]
+            )
 
     def format_body(self):
         format_func = getattr(
@@ -0,0 +1,9 @@
+from notification.models import Notification
+from researchhub.celery import QUEUE_NOTIFICATION, app
+
+
+@app.task(queue=QUEUE_NOTIFICATION)
+def send_notifications_task(notification_ids):
+    Notification.send_notifications(
+        Notification.objects.filter(id__in=notification_ids).order_by("id")
+    )
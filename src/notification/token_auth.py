@@ -2,16 +2,25 @@ from channels.auth import AuthMiddlewareStack
 from channels.db import database_sync_to_async
 from channels.middleware import BaseMiddleware
 from django.contrib.auth.models import AnonymousUser
-from django.db import close_old_connections
-from rest_framework.authtoken.models import Token
+from django.core.cache import cache
 
 from user.models import User
+from user.utils import cache_websocket_token_user, get_websocket_token_user_cache_key
 
 
 @database_sync_to_async
 def get_user(token_key):
-    token = Token.objects.get(key=token_key)
-    return token.user
+    # database_sync_to_async closes stale connections around the query
+    user = User.objects.get(auth_token__key=token_key)
+    cache_websocket_token_user(token_key, user)
+    return user
+
+
+async def get_cached_user(token_key):
+    user = await cache.aget(get_websocket_token_user_cache_key(token_key))
+    if user is None:
+        user = await get_user(token_key)
+    return user
 
 
 class TokenAuthMiddleware(BaseMiddleware):
@@ -23,18 +32,14 @@ class TokenAuthMiddleware(BaseMiddleware):
         super().__init__(inner)
 
     async def __call__(self, scope, receive, send):
-        close_old_connections()
         headers = dict(scope["headers"])
         try:
             if b"sec-websocket-protocol" in headers:
                 token = headers[b"sec-websocket-protocol"].decode().split(", ")
                 token_name, token_key = token
                 if token_name == "Token":
-                    token = await Token.objects.aget(key=token_key)
-                    user = await User.objects.aget(auth_token=token)
-                    # user = await get_user(token_key)
-                    scope["user"] = user
-        except Token.DoesNotExist:
+                    scope["user"] = await get_cached_user(token_key)
+        except User.DoesNotExist:
             scope["user"] = AnonymousUser()
         return await super().__call__(scope, receive, send)
 
@@ -8,7 +8,7 @@ from google.auth.transport import requests
 
 from user.models import Author
 from user.utils import merge_author_profiles
-from utils.siftscience import events_api, update_user_risk_score
+from utils.siftscience import events_api
 
 
 class SocialAccountAdapter(DefaultSocialAccountAdapter):
@@ -22,8 +22,7 @@ class SocialAccountAdapter(DefaultSocialAccountAdapter):
         else:
             saved_user = super().save_user(request, sociallogin, form)
 
-        tracked_account = events_api.track_account(saved_user, request)
-        update_user_risk_score(saved_user, tracked_account)
+        events_api.track_account(saved_user, request)
         return saved_user
 
     def _generate_temporary_username(self, sociallogin):
@@ -19,7 +19,7 @@ from reputation.models import Distribution
 from researchhub.settings import REFERRAL_PROGRAM
 from user.models import User
 from utils import sentry
-from utils.siftscience import check_user_risk, events_api, update_user_risk_score
+from utils.siftscience import check_user_risk, events_api
 
 
 class SocialLoginSerializer(serializers.Serializer):
@@ -149,8 +149,7 @@ class SocialLoginSerializer(serializers.Serializer):
         except NoReverseMatch as e:
             if "account_inactive" in str(e):
                 login_user = login.account.user
-                tracked_login = events_api.track_login(login_user, "$failure", request)
-                update_user_risk_score(login_user, tracked_login)
+                events_api.track_login(login_user, "$failure", request)
                 raise LoginError(None, "Account is suspended")
         except Exception as e:
             error = LoginError(e, "Login failed")
@@ -191,8 +190,7 @@ class SocialLoginSerializer(serializers.Serializer):
 
         login_user = login.account.user
         attrs["user"] = login_user
-        tracked_login = events_api.track_login(login_user, "$success", request)
-        update_user_risk_score(login_user, tracked_login)
+        events_api.track_login(login_user, "$success", request)
 
         try:
             visits = WebsiteVisits.objects.get(uuid=attrs["uuid"])
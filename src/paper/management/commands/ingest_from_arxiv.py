@@ -1,28 +1,49 @@
 '''
-Setting up watchdog watcher to read files from arxiv.
+Ingests arxiv metadata files into papers.
 '''
 
+import os
+
 from django.core.management.base import BaseCommand
 
-from utils.arxiv.metadata_parser import (
-    extract_from_directory,
-    parse_arxiv_metadata
-)
+from utils.arxiv.bulk_ingest import ArxivBulkIngestor
 
 
 class Command(BaseCommand):
 
     def add_arguments(self, parser):
         parser.add_argument('root', type=str, help='root directory name')
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of records written per bulk insert'
+        )
+        parser.add_argument(
+            '--checkpoint',
+            type=str,
+            default=None,
+            help='Path of a checkpoint file used to resume interrupted runs'
+        )
 
     def handle(self, *args, **options):
         path = f'/{options["root"]}/preprints/arxiv/metadata'
         self.stdout.write(
-            self.style.WARNING(f'Extracting xml files from {path} ...')
+            self.style.WARNING(f'Streaming xml files from {path} ...')
+        )
+
+        xml_files = []
+        for root, dirs, files in os.walk(path):
+            for file in sorted(files):
+                # Files extracted by earlier runs sit next to their archive
+                if file.endswith('.xml') and f'{file}.gz' in files:
+                    continue
+                if file.endswith('.xml.gz') or file.endswith('.xml'):
+                    xml_files.append(os.path.join(root, file))
+
+        ingestor = ArxivBulkIngestor(
+            batch_size=options['batch_size'],
+            checkpoint_path=options['checkpoint'],
         )
-        xml_files = extract_from_directory(path)
-        for file in xml_files:
-            records = parse_arxiv_metadata(file)
-            for record in records:
-                print('Creating paper for arxiv record', record.raw_arxiv_id)
-                record.create_paper()
+        stats = ingestor.ingest(xml_files)
+        self.stdout.write(self.style.SUCCESS(f'Done: {stats}'))
@@ -1,4 +1,5 @@
 from django.core.management.base import BaseCommand
+from researchhub_document.hot_score_batch import HotScoreBatchCalculator
 from researchhub_document.models import ResearchhubUnifiedDocument
 from dateutil import parser
 
@@ -23,6 +24,12 @@ class Command(BaseCommand):
         help='Perform for date starting'
       )
 
+      parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Use the batch calculator (always saves)'
+      )
+
     def handle(self, *args, **options):
         docs = ResearchhubUnifiedDocument.objects.filter(is_removed=False).order_by('id')
 
@@ -38,6 +45,15 @@ class Command(BaseCommand):
             start_date = parser.parse(options['start_date'])
             docs = docs.filter(created_date__gte=start_date)
 
+        if options['batch']:
+            calculator = HotScoreBatchCalculator()
+            doc_ids = list(docs.values_list('id', flat=True))
+            batch_size = 1000
+            for i in range(0, len(doc_ids), batch_size):
+                changed = calculator.update(doc_ids[i:i + batch_size])
+                print(f'Updated {changed} scores - {i + batch_size}/{len(doc_ids)}')
+            return
+
         count = docs.count()
         for i, doc in enumerate(docs):
             try:
@@ -624,40 +624,47 @@ class Paper(AbstractGenericReactionModel):
             return base_score + boost_amount
         return False
 
-    def get_discussion_count(self):
+    @staticmethod
+    def get_discussion_count_aggregates():
+        """
+        Thread, comment and reply counts in a single pass over the joined
+        rows. Counting distinct ids keeps the joins from inflating the
+        counts of the outer levels.
+        """
         from discussion.models import Thread
 
         sources = [Thread.RESEARCHHUB, Thread.INLINE_ABSTRACT, Thread.INLINE_PAPER_BODY]
-
-        thread_count = self.threads.aggregate(
-            discussion_count=Count(
-                1,
+        return {
+            "thread_count": Count(
+                "id",
+                distinct=True,
                 filter=Q(
                     is_removed=False, created_by__isnull=False, source__in=sources
                 ),
-            )
-        )["discussion_count"]
-        comment_count = self.threads.aggregate(
-            discussion_count=Count(
+            ),
+            "comment_count": Count(
                 "comments",
+                distinct=True,
                 filter=Q(
                     comments__is_removed=False,
                     comments__created_by__isnull=False,
                     source__in=sources,
                 ),
-            )
-        )["discussion_count"]
-        reply_count = self.threads.aggregate(
-            discussion_count=Count(
+            ),
+            "reply_count": Count(
                 "comments__replies",
+                distinct=True,
                 filter=Q(
                     comments__replies__is_removed=False,
                     comments__replies__created_by__isnull=False,
                     source__in=sources,
                 ),
-            )
-        )["discussion_count"]
-        return thread_count + comment_count + reply_count
+            ),
+        }
+
+    def get_discussion_count(self):
+        counts = self.threads.aggregate(**self.get_discussion_count_aggregates())
+        return counts["thread_count"] + counts["comment_count"] + counts["reply_count"]
 
     def extract_figures(self, use_celery=True):
         # TODO: Make figure more consistent - temporarily removing figures
@@ -64,7 +64,7 @@ from user.serializers import (
     UserSerializer,
 )
 from utils.http import check_url_contains_pdf, get_user_from_request
-from utils.siftscience import events_api, update_user_risk_score
+from utils.siftscience import events_api
 
 
 class BasePaperSerializer(serializers.ModelSerializer, GenericReactionSerializerMixin):
@@ -458,8 +458,7 @@ class PaperSerializer(BasePaperSerializer):
 
                 update_unified_document_to_paper(paper)
 
-                tracked_paper = events_api.track_content_paper(user, paper, request)
-                update_user_risk_score(user, tracked_paper)
+                events_api.track_content_paper(user, paper, request)
 
                 create_contribution.apply_async(
                     (
@@ -579,10 +578,9 @@ class PaperSerializer(BasePaperSerializer):
                     )
 
                 if request:
-                    tracked_paper = events_api.track_content_paper(
+                    events_api.track_content_paper(
                         request.user, paper, request, update=True
                     )
-                    update_user_risk_score(request.user, tracked_paper)
                 return paper
         except Exception as e:
             error = PaperSerializerError(e, "Failed to update paper")
@@ -798,6 +796,31 @@ class DynamicPaperSerializer(
     uploaded_by = serializers.SerializerMethodField()
     user_vote = serializers.SerializerMethodField()
 
+    related_method_fields = {
+        "authors": (
+            (
+                "authors",
+                "pap_dps_get_authors",
+                "user.serializers.DynamicAuthorSerializer",
+            ),
+        ),
+        "hubs": (("hubs", "pap_dps_get_hubs", "hub.serializers.DynamicHubSerializer"),),
+        "unified_document": (
+            (
+                "unified_document",
+                "pap_dps_get_unified_document",
+                "researchhub_document.serializers.DynamicUnifiedDocumentSerializer",
+            ),
+        ),
+        "uploaded_by": (
+            (
+                "uploaded_by",
+                "pap_dps_get_uploaded_by",
+                "user.serializers.DynamicUserSerializer",
+            ),
+        ),
+    }
+
     class Meta:
         model = Paper
         fields = "__all__"
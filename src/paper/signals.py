@@ -1,12 +1,15 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 from django.utils.crypto import get_random_string
 from django.utils.text import slugify
 
+from discussion.reaction_models import Vote as GrmVote
+from paper.utils import invalidate_paper_detail_cache
 from researchhub_document.models import ResearchhubUnifiedDocument
 from researchhub_document.related_models.constants.document_type import (
     PAPER as PAPER_DOC_TYPE,
 )
+from review.models.review_model import Review
 from utils.sentry import log_error
 
 from .models import Paper
@@ -47,6 +50,53 @@ def add_unified_doc(created, instance, **kwargs):
                 log_error("EXCPETION (add_unified_doc): ", e)
 
 
+@receiver(post_save, sender=Paper, dispatch_uid="invalidate_paper_detail_cache")
+def invalidate_paper_detail_cache_on_save(sender, instance, **kwargs):
+    invalidate_paper_detail_cache(instance.id)
+
+
+@receiver(
+    m2m_changed,
+    sender=Paper.hubs.through,
+    dispatch_uid="invalidate_paper_detail_cache_hubs",
+)
+@receiver(
+    m2m_changed,
+    sender=Paper.authors.through,
+    dispatch_uid="invalidate_paper_detail_cache_authors",
+)
+def invalidate_paper_detail_cache_on_m2m(sender, instance, action, pk_set, **kwargs):
+    if not action.startswith("post_"):
+        return
+    if isinstance(instance, Paper):
+        invalidate_paper_detail_cache(instance.id)
+    elif pk_set:
+        # Reverse side, e.g. hub.papers.add(...)
+        for paper_id in pk_set:
+            invalidate_paper_detail_cache(paper_id)
+
+
+@receiver(post_save, sender=GrmVote, dispatch_uid="invalidate_paper_detail_vote")
+@receiver(post_delete, sender=GrmVote, dispatch_uid="invalidate_paper_detail_unvote")
+def invalidate_paper_detail_cache_on_vote(sender, instance, **kwargs):
+    # The cached payload carries the paper score
+    if instance.content_type.model == "paper":
+        invalidate_paper_detail_cache(instance.object_id)
+
+
+@receiver(post_save, sender=Review, dispatch_uid="invalidate_paper_detail_review")
+@receiver(post_delete, sender=Review, dispatch_uid="invalidate_paper_detail_unreview")
+def invalidate_paper_detail_cache_on_review(sender, instance, **kwargs):
+    # The cached payload carries the unified document's review details
+    if instance.unified_document_id is None:
+        return
+    paper_ids = Paper.objects.filter(
+        unified_document_id=instance.unified_document_id
+    ).values_list("id", flat=True)
+    for paper_id in paper_ids:
+        invalidate_paper_detail_cache(paper_id)
+
+
 def check_file_updated(update_fields, file):
     if update_fields is not None and file:
         return "file" in update_fields
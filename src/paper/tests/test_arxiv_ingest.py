@@ -0,0 +1,79 @@
+import gzip
+import os
+import tempfile
+
+from rest_framework.test import APITestCase
+
+from paper.models import Paper
+from researchhub_document.models import FeedEntry
+from utils.arxiv.bulk_ingest import ArxivBulkIngestor
+
+ARXIV_RECORD = """
+<record>
+  <header><identifier>oai:arXiv.org:{arxiv_id}</identifier></header>
+  <metadata>
+    <arXivRaw xmlns="http://arxiv.org/OAI/arXivRaw/">
+      <id>{arxiv_id}</id>
+      <title>Paper {arxiv_id}</title>
+      <authors>Ada Lovelace, Alan Turing</authors>
+      <categories>cs.AI</categories>
+      <abstract>Abstract</abstract>
+      <version version="v1"><date>Mon, 2 Apr 2007 19:18:42 GMT</date></version>
+    </arXivRaw>
+  </metadata>
+</record>
+"""
+
+
+class ArxivBulkIngestorTests(APITestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        records = "".join(
+            ARXIV_RECORD.format(arxiv_id=arxiv_id)
+            for arxiv_id in ("0704.0001", "0704.0002", "0704.0001")
+        )
+        self.path = os.path.join(self.tmp_dir, "metadata.xml.gz")
+        with gzip.open(self.path, "wt") as file:
+            file.write(
+                '<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">'
+                f"<ListRecords>{records}</ListRecords></OAI-PMH>"
+            )
+
+    def test_ingest_creates_papers_with_documents_and_hubs(self):
+        stats = ArxivBulkIngestor(batch_size=2).ingest([self.path])
+
+        self.assertEqual(stats["created"], 2)
+        self.assertEqual(stats["existing"], 1)
+        papers = Paper.objects.filter(external_source="arxiv")
+        self.assertEqual(papers.count(), 2)
+        for paper in papers:
+            self.assertIsNotNone(paper.unified_document)
+            self.assertIsNotNone(paper.unified_document.document_filter)
+            self.assertEqual(paper.hubs.count(), 1)
+            self.assertEqual(paper.unified_document.hubs.count(), 1)
+            self.assertTrue(
+                FeedEntry.objects.filter(
+                    unified_document=paper.unified_document
+                ).exists()
+            )
+
+    def test_existing_papers_get_unified_document_hubs(self):
+        ArxivBulkIngestor().ingest([self.path])
+        paper = Paper.objects.filter(external_source="arxiv").first()
+        paper.hubs.clear()
+        paper.unified_document.hubs.clear()
+
+        other_path = os.path.join(self.tmp_dir, "other.xml.gz")
+        os.rename(self.path, other_path)
+        ArxivBulkIngestor().ingest([other_path])
+
+        self.assertEqual(paper.hubs.count(), 1)
+        self.assertEqual(paper.unified_document.hubs.count(), 1)
+
+    def test_checkpoint_skips_completed_files(self):
+        checkpoint_path = os.path.join(self.tmp_dir, "checkpoint.json")
+        ArxivBulkIngestor(checkpoint_path=checkpoint_path).ingest([self.path])
+        stats = ArxivBulkIngestor(checkpoint_path=checkpoint_path).ingest([self.path])
+
+        self.assertEqual(stats["read"], 0)
+        self.assertEqual(Paper.objects.filter(external_source="arxiv").count(), 2)
@@ -3,10 +3,13 @@ from unittest import skip
 
 from django.test import Client, TestCase
 
+from discussion.reaction_models import Vote as GrmVote
 from paper.tests.helpers import create_paper
+from review.models.review_model import Review
 from user.tests.helpers import create_random_authenticated_user
 from utils.test_helpers import (
     get_authenticated_delete_response,
+    get_authenticated_get_response,
     get_authenticated_post_response,
 )
 
@@ -179,6 +182,41 @@ class PaperViewsTests(TestCase):
         response = get_authenticated_post_response(self.user, url, data)
         self.assertContains(response, "Double check that URL", status_code=400)
 
+    def test_paper_detail_cache_overlays_user_vote(self):
+        url = self.base_url + f"{self.paper.id}/"
+        response = get_authenticated_get_response(self.user, url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["score"], 0)
+        self.assertIsNone(response.data["user_vote"])
+
+        GrmVote.objects.create(
+            item=self.paper, created_by=self.user, vote_type=GrmVote.UPVOTE
+        )
+
+        # Voting invalidates the shared payload
+        response = get_authenticated_get_response(self.user, url)
+        self.assertEqual(response.data["score"], 1)
+        self.assertEqual(response.data["user_vote"]["vote_type"], GrmVote.UPVOTE)
+
+        # The cached payload is shared, the vote overlay is not
+        response = get_authenticated_get_response(self.trouble_maker, url)
+        self.assertEqual(response.data["score"], 1)
+        self.assertIsNone(response.data["user_vote"])
+
+    def test_paper_detail_cache_refreshes_reviews(self):
+        url = self.base_url + f"{self.paper.id}/"
+        response = get_authenticated_get_response(self.user, url)
+        self.assertEqual(response.data["unified_document"]["reviews"]["count"], 0)
+
+        Review.objects.create(
+            score=7,
+            created_by=self.user,
+            unified_document=self.paper.unified_document,
+        )
+
+        response = get_authenticated_get_response(self.user, url)
+        self.assertEqual(response.data["unified_document"]["reviews"]["count"], 1)
+
     def get_bookmark_post_response(self, user):
         url = self.base_url + f"{self.paper.id}/bookmark/"
         data = None
@@ -60,6 +60,7 @@ MANUBOT_PAPER_TYPES = [
     "article-journal",
 ]
 SIMILARITY_THRESHOLD = 0.9
+PAPER_DETAIL_CACHE_TIMEOUT = 60 * 60
 MAX_TITLE_PAGES = 5
 IGNORE_PAPER_TITLES = [
     "editorial",
@@ -597,6 +598,10 @@ def merge_paper_bulletpoints(original_paper, new_paper):
                 new_bullet_point.delete()
 
 
+def invalidate_paper_detail_cache(paper_id):
+    cache.delete(get_cache_key("paper", paper_id))
+
+
 def reset_paper_cache(cache_key, data):
     cache.set(cache_key, data, timeout=60 * 60 * 24 * 7)
 
@@ -52,6 +52,7 @@ from paper.serializers import (
 )
 from paper.tasks import censored_paper_cleanup
 from paper.utils import (
+    PAPER_DETAIL_CACHE_TIMEOUT,
     add_default_hub,
     clean_abstract,
     get_cache_key,
@@ -151,7 +152,11 @@ class PaperViewSet(ReactionViewActionMixin, viewsets.ModelViewSet):
             queryset = queryset.filter(
                 is_removed=False, retrieved_from_external_source=True
             )
-        if prefetch:
+        if prefetch and self.action == "retrieve":
+            return queryset.select_related(
+                *self.retrieve_select_lookups()
+            ).prefetch_related(*self.retrieve_prefetch_lookups())
+        elif prefetch:
             return queryset.prefetch_related(*self.prefetch_lookups())
         else:
             return queryset
@@ -192,6 +197,21 @@ class PaperViewSet(ReactionViewActionMixin, viewsets.ModelViewSet):
             error_message = "A paper with this url or DOI already exists."
         return Response({"error": error_message}, status=status.HTTP_400_BAD_REQUEST)
 
+    def retrieve_select_lookups(self):
+        return (
+            "uploaded_by",
+            "uploaded_by__author_profile",
+            "unified_document",
+        )
+
+    def retrieve_prefetch_lookups(self):
+        # Only what the detail payload renders. Votes, hub subscribers and
+        # comments are unbounded and were loaded just to be discarded.
+        return (
+            "authors",
+            "hubs",
+        )
+
     def _get_paper_context(self, request=None):
         context = {
             "request": request,
@@ -261,56 +281,52 @@ class PaperViewSet(ReactionViewActionMixin, viewsets.ModelViewSet):
         instance = self.get_object()
         context = self._get_paper_context(request)
 
-        # Commenting out paper cache
-        # cache_key = get_cache_key("paper", instance.id)
-        # cache_hit = cache.get(cache_key)
-        # if cache_hit is not None:
-        #     vote = self.dynamic_serializer_class(context=context).get_user_vote(
-        #         instance
-        #     )
-        #     cache_hit["user_vote"] = vote
-        #     return Response(cache_hit)
-
-        serializer = self.dynamic_serializer_class(
-            instance,
-            context=context,
-            _include_fields=[
-                "abstract",
-                "abstract_src_markdown",
-                "authors",
-                "boost_amount",
-                "created_date",
-                "discussion_count",
-                "doi",
-                "external_source",
-                "file",
-                "first_preview",
-                "hubs",
-                "id",
-                "is_open_access",
-                "oa_status",
-                "paper_publish_date",
-                "paper_title",
-                "pdf_file_extract",
-                "pdf_license",
-                "pdf_url",
-                "purchases",
-                "raw_authors",
-                "score",
-                "slug",
-                "title",
-                "unified_document",
-                "uploaded_by",
-                "uploaded_date",
-                "uploaded_date",
-                "url",
-            ],
-        )
-        serializer_data = serializer.data
+        # The shared payload holds nothing viewer specific, user_vote is
+        # overlaid per request
+        cache_key = get_cache_key("paper", instance.id)
+        serializer_data = cache.get(cache_key)
+        if serializer_data is None:
+            serializer = self.dynamic_serializer_class(
+                instance,
+                context=context,
+                _include_fields=[
+                    "abstract",
+                    "abstract_src_markdown",
+                    "authors",
+                    "boost_amount",
+                    "created_date",
+                    "discussion_count",
+                    "doi",
+                    "external_source",
+                    "file",
+                    "first_preview",
+                    "hubs",
+                    "id",
+                    "is_open_access",
+                    "oa_status",
+                    "paper_publish_date",
+                    "paper_title",
+                    "pdf_file_extract",
+                    "pdf_license",
+                    "pdf_url",
+                    "purchases",
+                    "raw_authors",
+                    "score",
+                    "slug",
+                    "title",
+                    "unified_document",
+                    "uploaded_by",
+                    "uploaded_date",
+                    "uploaded_date",
+                    "url",
+                ],
+            )
+            serializer_data = serializer.data
+            cache.set(cache_key, serializer_data, timeout=PAPER_DETAIL_CACHE_TIMEOUT)
+
+        serializer_data = {**serializer_data}
         vote = self.dynamic_serializer_class(context=context).get_user_vote(instance)
         serializer_data["user_vote"] = vote
-
-        # cache.set(cache_key, serializer_data, timeout=60 * 60 * 24 * 7)
         return Response(serializer_data)
 
     def list(self, request, *args, **kwargs):
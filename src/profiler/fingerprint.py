@@ -0,0 +1,33 @@
+import hashlib
+import re
+
+string_re = re.compile(r"'(?:[^']|'')*'")
+number_re = re.compile(r"\b\d+(?:\.\d+)?\b")
+placeholder_re = re.compile(r"%s")
+value_list_re = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+words_re = re.compile(r"\s+")
+
+# Transaction bookkeeping carries generated names and says nothing about
+# the view, so it is left out of the aggregates
+IGNORED_STATEMENTS = ("SAVEPOINT", "RELEASE", "ROLLBACK")
+
+
+def normalize_sql(sql):
+    """
+    Reduces a statement to its shape: literals and placeholders become
+    `?` and value lists of any length become `(?+)`, so the same query
+    issued with different arguments normalizes to the same text.
+    """
+    sql = string_re.sub("?", sql)
+    sql = number_re.sub("?", sql)
+    sql = placeholder_re.sub("?", sql)
+    sql = value_list_re.sub("(?+)", sql)
+    return words_re.sub(" ", sql).strip()
+
+
+def get_sql_fingerprint(normalized_sql):
+    return hashlib.md5(normalized_sql.encode()).hexdigest()
+
+
+def is_ignored_statement(sql):
+    return sql.lstrip().upper().startswith(IGNORED_STATEMENTS)
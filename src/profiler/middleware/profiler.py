@@ -2,35 +2,72 @@
 # Original author: udfalkso
 # Modified by: Shwagroo Team and Gun.io
 
-import sys
-import re
-import json
 import cProfile
+import datetime
+import decimal
 import pstats
+import random
 import time
-import traceback
+import uuid
 
 from io import StringIO
+from django.core.cache import cache
 from django.db import connection
-from profiler.tasks import log_traceback
+from profiler.fingerprint import (
+    get_sql_fingerprint,
+    is_ignored_statement,
+    normalize_sql,
+)
+from profiler.tasks import log_profile
+from researchhub.settings import (
+    PROFILER_SAMPLE_RATE,
+    PROFILER_SLOW_QUERY_MS,
+    PROFILER_STATS_LIMIT,
+)
 from utils import sentry
 
-sql_expain_re = re.compile(
-    r'\(cost=(?P<cost>[^ ]+) rows=(?P<rows>\d+) width=(?P<width>\d+)\)'
+# A fingerprint is offered for EXPLAIN at most once per timeout
+PROFILER_EXPLAIN_PENDING_TIMEOUT = 60 * 60 * 24
+
+# Parameter types that survive the JSON task serializer
+PROFILER_EXPLAIN_PARAM_TYPES = (
+    str,
+    int,
+    float,
+    bool,
+    type(None),
+    datetime.date,
+    datetime.time,
+    decimal.Decimal,
+    uuid.UUID,
 )
 
 
-class TracebackLogger:
-    def __init__(self):
-        self.tracebacks = []
+def get_explain_pending_key(fingerprint):
+    return f'profiler_explain_pending_{fingerprint}'
+
 
-    def capture_traceback(self):
-        tb = ''.join(traceback.format_stack())
-        self.tracebacks.append(tb)
+def can_send_explain_params(params):
+    if params is None:
+        return True
+    values = params.values() if isinstance(params, dict) else params
+    return all(isinstance(value, PROFILER_EXPLAIN_PARAM_TYPES) for value in values)
+
+
+class QueryFingerprintLogger:
+    """
+    Execute wrapper aggregating the queries of one request by fingerprint.
+    Only the first slow execution of a new fingerprint keeps its
+    parameterized SQL and parameters, so the plan can be captured off the
+    request path. Literal SQL with the values inlined is never kept.
+    """
+
+    def __init__(self, slow_query_ms=PROFILER_SLOW_QUERY_MS):
+        self.slow_query_ms = slow_query_ms
+        self.queries = {}
 
     def __call__(self, execute, sql, params, many, context):
         start = time.monotonic()
-        self.start = start
 
         try:
             result = execute(sql, params, many, context)
@@ -38,17 +75,91 @@ class TracebackLogger:
             sentry.log_error(e)
             raise
 
-        self.capture_traceback()
+        duration = (time.monotonic() - start) * 1000
+        self.record(sql, params, duration, context)
         return result
 
+    def record(self, sql, params, duration, context):
+        if is_ignored_statement(sql):
+            return
+
+        normalized_sql = normalize_sql(sql)
+        fingerprint = get_sql_fingerprint(normalized_sql)
+        query = self.queries.get(fingerprint)
+        if query is None:
+            query = {
+                'fingerprint': fingerprint,
+                'sql': normalized_sql,
+                'count': 0,
+                'total_time': 0,
+                'max_time': 0,
+                'explain_sql': None,
+                'explain_params': None,
+            }
+            self.queries[fingerprint] = query
+
+        query['count'] += 1
+        query['total_time'] += duration
+        query['max_time'] = max(query['max_time'], duration)
+
+        if (
+            duration >= self.slow_query_ms
+            and query['explain_sql'] is None
+            and sql.lstrip().upper().startswith('SELECT')
+            and can_send_explain_params(params)
+            and cache.add(
+                get_explain_pending_key(fingerprint),
+                True,
+                timeout=PROFILER_EXPLAIN_PENDING_TIMEOUT
+            )
+        ):
+            query['explain_sql'] = sql
+            if params is not None:
+                query['explain_params'] = (
+                    dict(params) if isinstance(params, dict) else list(params)
+                )
+
+    @property
+    def total_time(self):
+        return sum(query['total_time'] for query in self.queries.values())
+
+    @property
+    def total_queries(self):
+        return sum(query['count'] for query in self.queries.values())
+
+
+class ProfileSample:
+    def __init__(self):
+        self.profiler = cProfile.Profile()
+        self.logger = QueryFingerprintLogger()
+        self.view_name = None
+
+
+def get_view_name(request, callback):
+    view = getattr(callback, 'cls', callback)
+    view_name = f'{view.__module__}.{getattr(view, "__name__", repr(view))}'
+    actions = getattr(callback, 'actions', None)
+    if actions and request.method.lower() in actions:
+        view_name = f'{view_name}.{actions[request.method.lower()]}'
+    return view_name
+
 
 class ProfileMiddleware(object):
-    def __init__(self, get_response):
-        self.prof = cProfile.Profile()
+    """
+    Profiles a PROFILER_SAMPLE_RATE fraction of /api requests. Every
+    sampled request gets its own profiler and query logger, so concurrent
+    requests never share state. The results are aggregated by log_profile
+    on the logs queue.
+    """
+
+    def __init__(self, get_response, sample_rate=None):
         self.get_response = get_response
+        if sample_rate is None:
+            sample_rate = PROFILER_SAMPLE_RATE
+        self.sample_rate = sample_rate
 
     def __call__(self, request):
-        response = self.process_request(request)
+        self.process_request(request)
 
         response = self.get_response(request)
 
@@ -56,98 +167,57 @@ class ProfileMiddleware(object):
 
         return response
 
-    def get_sql_explaination(self, sql):
-        with connection.cursor() as cursor:
-            first = sql.split(' ')[0]
-            if 'SAVEPOINT' != first and 'RELEASE' != first:
-                cursor.execute(f'EXPLAIN {sql}')
-                res = '\n'.join(r[0] for r in cursor.fetchall())
-            else:
-                res = '(cost=0 rows=0 width=0)\n'
-            return res
-
-    def create_traceback(self, request, callback, tracebacks, queries):
-        if hasattr(callback, 'cls'):
-            view_name = str(callback.cls)
-        else:
-            view_name = str(callback)
-
-        path = request.build_absolute_uri()
-        http_method = request.method
-
-        for tb, q in zip(tracebacks, queries):
-            q['traceback'] = tb
-            explain = self.get_sql_explaination(q['sql'])
-
-            result = sql_expain_re.search(explain.split('\n')[0])
-            q['explain'] = explain
-            q['explain_cost'] = result.group("cost")
-            q['explain_rows'] = result.group("rows")
-            q['explain_width'] = result.group("width")
-
-        total_duration = sum(float(q['time']) for q in queries) * 1000
-        request_data = {
-            'view_name': view_name,
-            'path': path,
-            'http_method': http_method,
-            'total_time': total_duration,
-            'total_queries': len(queries),
-            'paths': json.dumps(sys.path[1:]),
-            'queries': queries,
-        }
-        self.data = request_data
+    def should_profile(self, request):
+        return (
+            request.path.startswith('/api')
+            and random.random() < self.sample_rate
+        )
 
     def process_request(self, request):
-        if 'api' in request.path:
-            self.prof = cProfile.Profile()
+        request.profile_sample = None
+        if self.should_profile(request):
+            request.profile_sample = ProfileSample()
 
     def process_view(self, request, callback, callback_args, callback_kwargs):
-        if 'api' in request.path:
-            logger = TracebackLogger()
-            self.prof.enable()
-
-            with connection.execute_wrapper(logger):
-                response = self.prof.runcall(
-                    callback,
-                    request,
-                    *callback_args,
-                    **callback_kwargs
-                )
+        sample = getattr(request, 'profile_sample', None)
+        if sample is None:
+            return None
 
-            self.prof.disable()
-            queries = connection.queries.copy()
-            self.create_traceback(
-                request,
+        sample.view_name = get_view_name(request, callback)
+        with connection.execute_wrapper(sample.logger):
+            return sample.profiler.runcall(
                 callback,
-                logger.tracebacks,
-                queries
+                request,
+                *callback_args,
+                **callback_kwargs
             )
-            return response
 
     def process_response(self, request, response):
-        if 'api' in request.path:
-            try:
-                self.prof.disable()
-
-                out = StringIO()
-                old_stdout = sys.stdout
-                sys.stdout = out
-                stats = pstats.Stats(self.prof, stream=out)
-
-                stats.print_stats()
-
-                sys.stdout = old_stdout
-                stats_str = out.getvalue()
-                total_time = str(stats.total_tt)
-            except Exception as e:
-                sentry.log_error(e)
-                sentry.log_info(self.prof.stats, error=e)
-                sentry.log_info(self.prof.getstats(), error=e)
-                return response
-
-            log_traceback.apply_async(
-                (self.data, total_time, stats_str),
-                priority=1,
-            )
+        sample = getattr(request, 'profile_sample', None)
+        if sample is None or sample.view_name is None:
+            return response
 
+        try:
+            out = StringIO()
+            stats = pstats.Stats(sample.profiler, stream=out)
+            stats.sort_stats('tottime').print_stats(PROFILER_STATS_LIMIT)
+            stats_str = out.getvalue()
+            total_time = stats.total_tt
+        except Exception as e:
+            sentry.log_error(e)
+            return response
+
+        logger = sample.logger
+        data = {
+            'view_name': sample.view_name,
+            'path': request.path,
+            'http_method': request.method,
+            'total_time': logger.total_time,
+            'total_queries': logger.total_queries,
+            'queries': list(logger.queries.values()),
+        }
+        log_profile.apply_async(
+            (data, total_time, stats_str),
+            priority=1,
+        )
         return response
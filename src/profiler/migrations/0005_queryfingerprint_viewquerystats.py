@@ -0,0 +1,51 @@
+# Generated by Django 4.1 on 2026-10-18 12:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiler', '0004_auto_20200420_1716'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='profile',
+            name='view_name',
+            field=models.CharField(max_length=256),
+        ),
+        migrations.CreateModel(
+            name='QueryFingerprint',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fingerprint', models.CharField(max_length=32, unique=True)),
+                ('sql', models.TextField()),
+                ('explain', models.TextField(blank=True, null=True)),
+                ('explain_cost', models.FloatField(null=True)),
+                ('explain_rows', models.BigIntegerField(null=True)),
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ViewQueryStats',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('view_name', models.CharField(max_length=256)),
+                ('http_method', models.CharField(max_length=8)),
+                ('request_count', models.PositiveIntegerField(default=0)),
+                ('query_count', models.BigIntegerField(default=0)),
+                ('total_time', models.FloatField(default=0)),
+                ('max_time', models.FloatField(default=0)),
+                ('max_per_request', models.PositiveIntegerField(default=0)),
+                ('n_plus_one_requests', models.PositiveIntegerField(default=0)),
+                ('updated_date', models.DateTimeField(auto_now=True)),
+                ('query_fingerprint', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='view_stats', to='profiler.queryfingerprint')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='viewquerystats',
+            constraint=models.UniqueConstraint(fields=('view_name', 'http_method', 'query_fingerprint'), name='unique_view_query_stats'),
+        ),
+    ]
@@ -16,7 +16,7 @@ group_prefix_re = [
 
 
 class Profile(models.Model):
-    view_name = models.CharField(max_length=64)
+    view_name = models.CharField(max_length=256)
     path = models.CharField(max_length=256)
     http_method = models.CharField(max_length=8)
     total_queries = models.CharField(max_length=8)
@@ -26,6 +26,53 @@ class Profile(models.Model):
     created_date = models.DateTimeField(auto_now_add=True)
 
 
+class QueryFingerprint(models.Model):
+    """
+    A statement shape seen by the profiler. The plan is captured once,
+    the first time a query of this shape is slow.
+    """
+
+    fingerprint = models.CharField(max_length=32, unique=True)
+    sql = models.TextField()
+    explain = models.TextField(null=True, blank=True)
+    explain_cost = models.FloatField(null=True)
+    explain_rows = models.BigIntegerField(null=True)
+
+    created_date = models.DateTimeField(auto_now_add=True)
+
+
+class ViewQueryStats(models.Model):
+    """
+    Running totals of one query shape across the sampled requests of a
+    view. A request counts towards n_plus_one_requests when it issues the
+    query PROFILER_N_PLUS_ONE_THRESHOLD times or more.
+    """
+
+    view_name = models.CharField(max_length=256)
+    http_method = models.CharField(max_length=8)
+    query_fingerprint = models.ForeignKey(
+        QueryFingerprint,
+        related_name='view_stats',
+        on_delete=models.CASCADE
+    )
+    request_count = models.PositiveIntegerField(default=0)
+    query_count = models.BigIntegerField(default=0)
+    total_time = models.FloatField(default=0)
+    max_time = models.FloatField(default=0)
+    max_per_request = models.PositiveIntegerField(default=0)
+    n_plus_one_requests = models.PositiveIntegerField(default=0)
+
+    updated_date = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['view_name', 'http_method', 'query_fingerprint'],
+                name='unique_view_query_stats',
+            )
+        ]
+
+
 class Traceback(models.Model):
     SQL_TRACE = 'SQL_TRACE'
     VIEW_TRACE = 'VIEW_TRACE'
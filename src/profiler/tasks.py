@@ -1,60 +1,118 @@
-import os
+import re
 
-from datetime import datetime
-from django.core.files import File
+from django.core.files.base import ContentFile
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
 from researchhub.celery import app
-from profiler.models import Profile, Traceback
+from profiler.models import (
+    Profile,
+    QueryFingerprint,
+    Traceback,
+    ViewQueryStats,
+)
+from researchhub.settings import PROFILER_N_PLUS_ONE_THRESHOLD
 from utils import sentry
 from researchhub.celery import (
     QUEUE_LOGS,
 )
 
+sql_expain_re = re.compile(
+    r'\(cost=[^ ]+\.\.(?P<cost>[^ ]+) rows=(?P<rows>\d+) width=(?P<width>\d+)\)'
+)
+# Quoted literals in a plan, which carry the values of the explained query
+sql_literal_re = re.compile(r"'(?:[^']|'')*'")
+
+
+def get_sql_explaination(sql, params=None):
+    # A failing EXPLAIN must not abort the surrounding transaction
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN {sql}', params)
+        return '\n'.join(r[0] for r in cursor.fetchall())
+
+
+def redact_sql_literals(explain):
+    return sql_literal_re.sub("'?'", explain)
+
+
+def explain_query_fingerprint(query_fingerprint, sql, params):
+    try:
+        explain = get_sql_explaination(sql, params)
+    except Exception as e:
+        sentry.log_error(e)
+        return
+
+    result = sql_expain_re.search(explain.split('\n')[0])
+    QueryFingerprint.objects.filter(id=query_fingerprint.id).update(
+        explain=redact_sql_literals(explain),
+        explain_cost=float(result.group('cost')) if result else None,
+        explain_rows=int(result.group('rows')) if result else None,
+    )
+
+
+def get_or_create_row(model, defaults=None, **lookup):
+    try:
+        row, _ = model.objects.get_or_create(defaults=defaults, **lookup)
+        return row
+    except IntegrityError:
+        # Created concurrently by another worker
+        return model.objects.get(**lookup)
+
+
+def record_view_queries(view_name, http_method, queries):
+    for query in queries:
+        query_fingerprint = get_or_create_row(
+            QueryFingerprint,
+            defaults={'sql': query['sql']},
+            fingerprint=query['fingerprint'],
+        )
+        if query['explain_sql'] and query_fingerprint.explain is None:
+            explain_query_fingerprint(
+                query_fingerprint, query['explain_sql'], query.get('explain_params')
+            )
+
+        stats = get_or_create_row(
+            ViewQueryStats,
+            view_name=view_name,
+            http_method=http_method,
+            query_fingerprint=query_fingerprint,
+        )
+        is_n_plus_one = query['count'] >= PROFILER_N_PLUS_ONE_THRESHOLD
+        ViewQueryStats.objects.filter(id=stats.id).update(
+            request_count=F('request_count') + 1,
+            query_count=F('query_count') + query['count'],
+            total_time=F('total_time') + query['total_time'],
+            max_time=Greatest(F('max_time'), Value(query['max_time'])),
+            max_per_request=Greatest(
+                F('max_per_request'), Value(query['count'])
+            ),
+            n_plus_one_requests=F('n_plus_one_requests') + int(is_n_plus_one),
+        )
+
 
 @app.task(queue=QUEUE_LOGS)
-def log_traceback(data, total_view_time, traceback):
-    queries = data['queries']
-    view_name = data['view_name']
-    path = data['path']
+def log_profile(data, total_view_time, stats):
+    view_name = data['view_name'][:256]
     http_method = data['http_method']
-    total_queries = str(data['total_queries'])
-    total_sql_time = data['total_time']
-    total_view_time = total_view_time
 
     try:
         profile = Profile.objects.create(
             view_name=view_name,
-            path=path,
+            path=data['path'][:256],
             http_method=http_method,
-            total_queries=total_queries,
-            total_sql_time=total_sql_time,
+            total_queries=str(data['total_queries']),
+            total_sql_time=data['total_time'],
             total_view_time=total_view_time
         )
-
-        filename = f'/tmp/trace_logs/{str(datetime.now())}.log'
-        with open(filename, 'wb+') as f:
-            f.write(traceback.encode())
+        if stats:
             Traceback.objects.create(
                 profile=profile,
                 choice_type=Traceback.VIEW_TRACE,
                 time=total_view_time,
-                trace=File(f)
-            )
-        os.remove(filename)
-        for i, query in enumerate(queries):
-            choice_type = Traceback.SQL_TRACE
-            sql = query.get('sql')
-            trace = query.get('traceback', '')
-            time = query.get('time')
-            filename = f'/tmp/trace_logs/{str(datetime.now())}.log'
-            with open(filename, 'wb+') as f:
-                f.write(trace.encode())
-                Traceback.objects.create(
-                    profile=profile,
-                    choice_type=choice_type,
-                    time=time,
-                    trace=File(f),
-                    sql=sql
+                trace=ContentFile(
+                    stats.encode(), name=f'profile-{profile.id}.log'
                 )
-            os.remove(filename)
+            )
+        record_view_queries(view_name, http_method, data['queries'])
     except Exception as e:
         sentry.log_error(e)
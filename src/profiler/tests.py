@@ -1,3 +1,85 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.db import connection
+from rest_framework.test import APITestCase
 
-# Create your tests here.
+from profiler.fingerprint import normalize_sql
+from profiler.middleware.profiler import QueryFingerprintLogger
+from profiler.models import Profile, QueryFingerprint, ViewQueryStats
+from profiler.tasks import log_profile
+from user.models import User
+from user.tests.helpers import create_random_default_user
+
+
+class ProfilerTests(APITestCase):
+    def setUp(self):
+        self.user = create_random_default_user("profiler_user")
+
+    def test_normalize_sql_ignores_arguments(self):
+        self.assertEqual(
+            normalize_sql("SELECT * FROM t WHERE id IN (%s, %s, %s) AND x = 'a'"),
+            normalize_sql("SELECT *  FROM t WHERE id IN (%s) AND x = 'bc'"),
+        )
+
+    def test_repeated_queries_are_aggregated_per_view(self):
+        logger = QueryFingerprintLogger()
+        with connection.execute_wrapper(logger):
+            for _ in range(6):
+                User.objects.filter(id=self.user.id).exists()
+
+        queries = list(logger.queries.values())
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(queries[0]["count"], 6)
+
+        data = {
+            "view_name": "user.views.UserViewSet.list",
+            "path": "/api/user/",
+            "http_method": "GET",
+            "total_time": logger.total_time,
+            "total_queries": logger.total_queries,
+            "queries": queries,
+        }
+        log_profile(data, 0.1, "")
+        log_profile(data, 0.1, "")
+
+        self.assertEqual(Profile.objects.count(), 2)
+        stats = ViewQueryStats.objects.get(view_name=data["view_name"])
+        self.assertEqual(stats.request_count, 2)
+        self.assertEqual(stats.query_count, 12)
+        self.assertEqual(stats.n_plus_one_requests, 2)
+
+        self.user.is_staff = True
+        self.user.save()
+        self.client.force_authenticate(self.user)
+        response = self.client.get("/api/profiler/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["views"][0]["request_count"], 2)
+        self.assertEqual(
+            response.data["n_plus_one"][0]["fingerprint"], queries[0]["fingerprint"]
+        )
+
+    def test_slow_queries_are_explained_without_literal_values(self):
+        cache.clear()
+        email = "profiler-secret@researchhub.com"
+        logger = QueryFingerprintLogger(slow_query_ms=0)
+        with connection.execute_wrapper(logger):
+            User.objects.filter(email=email).exists()
+
+        query = list(logger.queries.values())[0]
+        self.assertNotIn(email, query["explain_sql"])
+        self.assertEqual(query["explain_params"], [email])
+
+        data = {
+            "view_name": "user.views.UserViewSet.list",
+            "path": "/api/user/",
+            "http_method": "GET",
+            "total_time": logger.total_time,
+            "total_queries": logger.total_queries,
+            "queries": [query],
+        }
+        log_profile(data, 0.1, "")
+
+        query_fingerprint = QueryFingerprint.objects.get(
+            fingerprint=query["fingerprint"]
+        )
+        self.assertIsNotNone(query_fingerprint.explain_cost)
+        self.assertNotIn(email, query_fingerprint.explain)
@@ -1,3 +1,86 @@
-from django.shortcuts import render
+from datetime import timedelta
 
-# Create your views here.
+from django.db.models import Avg, Count, F, IntegerField, Sum
+from django.db.models.functions import Cast
+from django.utils import timezone
+from rest_framework import viewsets
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+from profiler.models import Profile, ViewQueryStats
+
+PROFILER_REPORT_DEFAULT_DAYS = 7
+PROFILER_REPORT_LIMIT = 50
+
+
+class ProfilerReportViewSet(viewsets.ViewSet):
+    """
+    Aggregated view of the sampled profiles: the slowest views, the
+    query shapes costing the most time, and the query shapes repeated
+    per request (N+1 candidates). Filter with `view_name` and `days`.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def list(self, request):
+        try:
+            days = int(request.query_params.get("days", PROFILER_REPORT_DEFAULT_DAYS))
+        except ValueError:
+            days = PROFILER_REPORT_DEFAULT_DAYS
+        view_name = request.query_params.get("view_name")
+
+        profiles = Profile.objects.filter(
+            created_date__gte=timezone.now() - timedelta(days=days)
+        )
+        query_stats = ViewQueryStats.objects.all()
+        if view_name:
+            profiles = profiles.filter(view_name=view_name)
+            query_stats = query_stats.filter(view_name=view_name)
+
+        views = (
+            profiles.values("view_name", "http_method")
+            .annotate(
+                request_count=Count("id"),
+                avg_view_time=Avg("total_view_time"),
+                avg_sql_time=Avg("total_sql_time"),
+                avg_queries=Avg(Cast("total_queries", IntegerField())),
+                total_view_time=Sum("total_view_time"),
+            )
+            .order_by("-total_view_time")[:PROFILER_REPORT_LIMIT]
+        )
+
+        query_fields = (
+            "view_name",
+            "http_method",
+            "request_count",
+            "query_count",
+            "total_time",
+            "max_time",
+            "max_per_request",
+            "n_plus_one_requests",
+            "fingerprint",
+            "sql",
+            "explain_cost",
+            "explain_rows",
+        )
+        query_stats = query_stats.annotate(
+            fingerprint=F("query_fingerprint__fingerprint"),
+            sql=F("query_fingerprint__sql"),
+            explain_cost=F("query_fingerprint__explain_cost"),
+            explain_rows=F("query_fingerprint__explain_rows"),
+        ).values(*query_fields)
+
+        return Response(
+            {
+                "views": list(views),
+                "queries": list(
+                    query_stats.order_by("-total_time")[:PROFILER_REPORT_LIMIT]
+                ),
+                "n_plus_one": list(
+                    query_stats.filter(n_plus_one_requests__gt=0).order_by(
+                        "-n_plus_one_requests", "-total_time"
+                    )[:PROFILER_REPORT_LIMIT]
+                ),
+            },
+            status=200,
+        )
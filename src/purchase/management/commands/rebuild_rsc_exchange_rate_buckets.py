@@ -0,0 +1,28 @@
+"""
+Recomputes the hourly and daily RSC exchange rate buckets from the raw
+RscExchangeRate rows
+"""
+
+from django.core.management.base import BaseCommand
+
+from purchase.related_models.constants.rsc_exchange_currency import (
+    RSC_EXCHANGE_CURRENCY,
+)
+from purchase.rsc_price import rebuild_rsc_rate_buckets
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rates read and buckets written per query",
+        )
+
+    def handle(self, *args, **options):
+        for target_currency, _ in RSC_EXCHANGE_CURRENCY:
+            written = rebuild_rsc_rate_buckets(
+                target_currency, batch_size=options["batch_size"]
+            )
+            self.stdout.write(f"{target_currency}: {written} buckets written")
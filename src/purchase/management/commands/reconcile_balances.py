@@ -0,0 +1,70 @@
+"""
+Verifies per-user balance checkpoints against the full Balance ledger
+"""
+
+from django.core.management.base import BaseCommand
+from django.db.models import Sum
+
+from purchase.models import Balance, BalanceCheckpoint
+from purchase.related_models.balance_model import get_withdrawal_content_type
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Overwrite mismatched checkpoints with the ledger balance",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of checkpoints compared per query",
+        )
+
+    def handle(self, *args, **options):
+        fix = options["fix"]
+        batch_size = options["batch_size"]
+        withdrawal_content_type = get_withdrawal_content_type()
+
+        checked = 0
+        mismatched = 0
+        last_id = 0
+        while True:
+            checkpoints = list(
+                BalanceCheckpoint.objects.filter(id__gt=last_id)
+                .order_by("id")
+                .values("id", "user_id", "balance")[:batch_size]
+            )
+            if not checkpoints:
+                break
+            last_id = checkpoints[-1]["id"]
+
+            user_ids = [checkpoint["user_id"] for checkpoint in checkpoints]
+            ledger = dict(
+                Balance.objects.filter(user_id__in=user_ids)
+                .exclude(content_type=withdrawal_content_type)
+                .values("user_id")
+                .annotate(total=Sum("numeric_amount"))
+                .values_list("user_id", "total")
+            )
+
+            for checkpoint in checkpoints:
+                checked += 1
+                user_id = checkpoint["user_id"]
+                if checkpoint["balance"] == (ledger.get(user_id) or 0):
+                    continue
+
+                # Re-check under lock, rows may have been written since
+                checkpoint_balance, ledger_balance = BalanceCheckpoint.reconcile(
+                    user_id, fix=fix
+                )
+                if checkpoint_balance != ledger_balance:
+                    mismatched += 1
+                    print(
+                        f"User {user_id}: checkpoint {checkpoint_balance}"
+                        f" != ledger {ledger_balance}"
+                    )
+
+        print(f"Checked {checked} checkpoints, {mismatched} mismatched")
@@ -0,0 +1,55 @@
+# Generated by Django 4.1 on 2026-10-18 12:00
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("purchase", "0024_rscexchangerate_price_source"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="balance",
+            name="numeric_amount",
+            field=models.DecimalField(decimal_places=128, max_digits=255, null=True),
+        ),
+        migrations.RunSQL(
+            "UPDATE purchase_balance SET numeric_amount = CAST(amount AS numeric)",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.CreateModel(
+            name="BalanceCheckpoint",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "balance",
+                    models.DecimalField(
+                        decimal_places=128, default=0, max_digits=255
+                    ),
+                ),
+                ("last_balance_id", models.BigIntegerField(default=0)),
+                ("updated_date", models.DateTimeField(auto_now=True)),
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="balance_checkpoint",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 4.1 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("purchase", "0025_balance_numeric_amount_balancecheckpoint"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="rscexchangerate",
+            index=models.Index(
+                fields=["target_currency", "-created_date"],
+                name="rsc_rate_currency_created_idx",
+            ),
+        ),
+        migrations.CreateModel(
+            name="RscExchangeRateBucket",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "target_currency",
+                    models.CharField(
+                        choices=[("USD", "USD"), ("ETHER", "ETHER")], max_length=255
+                    ),
+                ),
+                (
+                    "interval",
+                    models.CharField(
+                        choices=[("HOUR", "HOUR"), ("DAY", "DAY")], max_length=16
+                    ),
+                ),
+                ("bucket_start", models.DateTimeField()),
+                ("open", models.FloatField()),
+                ("high", models.FloatField()),
+                ("low", models.FloatField()),
+                ("close", models.FloatField()),
+                ("sample_count", models.PositiveIntegerField(default=1)),
+                ("updated_date", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="rscexchangeratebucket",
+            constraint=models.UniqueConstraint(
+                fields=("target_currency", "interval", "bucket_start"),
+                name="unique_rsc_rate_bucket",
+            ),
+        ),
+    ]
@@ -1,6 +1,27 @@
+from decimal import Decimal
+
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import Sum, Value
+from django.db.models.functions import Coalesce
+
+LEDGER_DECIMAL_FIELD_KWARGS = {"max_digits": 255, "decimal_places": 128}
+
+
+def get_withdrawal_content_type():
+    return ContentType.objects.get_by_natural_key("reputation", "withdrawal")
+
+
+def sum_ledger_amounts(queryset):
+    total = queryset.aggregate(
+        total=Coalesce(
+            Sum("numeric_amount"),
+            Value(0),
+            output_field=models.DecimalField(**LEDGER_DECIMAL_FIELD_KWARGS),
+        )
+    )["total"]
+    return total or 0
 
 
 class Balance(models.Model):
@@ -18,7 +39,123 @@ class Balance(models.Model):
 
     # TODO: why is this a char field?
     amount = models.CharField(max_length=255)
+    # Numeric copy of amount so the ledger can be summed without casting
+    numeric_amount = models.DecimalField(
+        null=True, **LEDGER_DECIMAL_FIELD_KWARGS
+    )
     testnet_amount = models.CharField(max_length=255, default=0, null=True, blank=True)
 
     created_date = models.DateTimeField(auto_now_add=True)
     updated_date = models.DateTimeField(auto_now=True)
+
+    def save(self, *args, **kwargs):
+        is_new = self._state.adding
+        previous_amount = self.numeric_amount
+        self.numeric_amount = Decimal(str(self.amount))
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if self.content_type_id == get_withdrawal_content_type().id:
+                # Withdrawal rows only count once the withdrawal is settled,
+                # so they are summed at read time instead
+                return
+
+            if is_new:
+                BalanceCheckpoint.record(self.user_id, self.numeric_amount, self.id)
+            elif previous_amount is not None and previous_amount != self.numeric_amount:
+                BalanceCheckpoint.record(
+                    self.user_id, self.numeric_amount - previous_amount, self.id
+                )
+
+
+class BalanceCheckpoint(models.Model):
+    """
+    Running total of a user's non-withdrawal Balance rows, updated in the
+    same transaction as each row is written.
+    """
+
+    user = models.OneToOneField(
+        'user.User',
+        on_delete=models.CASCADE,
+        related_name='balance_checkpoint'
+    )
+    balance = models.DecimalField(default=0, **LEDGER_DECIMAL_FIELD_KWARGS)
+    # Highest Balance id included in the running total
+    last_balance_id = models.BigIntegerField(default=0)
+    updated_date = models.DateTimeField(auto_now=True)
+
+    @staticmethod
+    def get_ledger_queryset(user_id):
+        return Balance.objects.filter(user_id=user_id).exclude(
+            content_type=get_withdrawal_content_type()
+        )
+
+    @classmethod
+    def get_ledger_balance(cls, user_id):
+        return sum_ledger_amounts(cls.get_ledger_queryset(user_id))
+
+    @classmethod
+    def _get_locked(cls, user_id):
+        """
+        Returns (checkpoint, created). A missing checkpoint is seeded from
+        the full ledger, which already includes rows written in the
+        current transaction.
+        """
+        checkpoint = cls.objects.select_for_update().filter(user_id=user_id).first()
+        if checkpoint is not None:
+            return checkpoint, False
+
+        ledger = cls.get_ledger_queryset(user_id)
+        try:
+            with transaction.atomic():
+                checkpoint = cls.objects.create(
+                    user_id=user_id,
+                    balance=sum_ledger_amounts(ledger),
+                    last_balance_id=ledger.aggregate(
+                        last_id=Coalesce(models.Max("id"), 0)
+                    )["last_id"],
+                )
+            return checkpoint, True
+        except IntegrityError:
+            # Created concurrently
+            return cls.objects.select_for_update().get(user_id=user_id), False
+
+    @classmethod
+    def record(cls, user_id, amount, balance_id):
+        with transaction.atomic():
+            checkpoint, created = cls._get_locked(user_id)
+            if created:
+                return checkpoint
+
+            checkpoint.balance += amount
+            checkpoint.last_balance_id = max(checkpoint.last_balance_id, balance_id)
+            checkpoint.save(update_fields=["balance", "last_balance_id", "updated_date"])
+        return checkpoint
+
+    @classmethod
+    def get_balance(cls, user_id):
+        checkpoint = cls.objects.filter(user_id=user_id).first()
+        if checkpoint is None:
+            with transaction.atomic():
+                checkpoint, _ = cls._get_locked(user_id)
+        return checkpoint.balance
+
+    @classmethod
+    def reconcile(cls, user_id, fix=False):
+        """
+        Compares the checkpoint against the full ledger under lock.
+        Returns (checkpoint_balance, ledger_balance).
+        """
+        with transaction.atomic():
+            checkpoint, _ = cls._get_locked(user_id)
+            ledger_balance = cls.get_ledger_balance(user_id)
+            checkpoint_balance = checkpoint.balance
+            if fix and checkpoint_balance != ledger_balance:
+                checkpoint.balance = ledger_balance
+                checkpoint.last_balance_id = cls.get_ledger_queryset(
+                    user_id
+                ).aggregate(last_id=Coalesce(models.Max("id"), 0))["last_id"]
+                checkpoint.save(
+                    update_fields=["balance", "last_balance_id", "updated_date"]
+                )
+        return checkpoint_balance, ledger_balance
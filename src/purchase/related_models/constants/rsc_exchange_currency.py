@@ -8,3 +8,8 @@ MORALIS = "MORALIS"
 UNI_SWAP = "UNI_SWAP"
 
 PRICE_SOURCES = ((COIN_GECKO, COIN_GECKO), (MORALIS, MORALIS), (UNI_SWAP, UNI_SWAP))
+
+HOUR = "HOUR"
+DAY = "DAY"
+
+RSC_EXCHANGE_RATE_INTERVALS = ((HOUR, HOUR), (DAY, DAY))
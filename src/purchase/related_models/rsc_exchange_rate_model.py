@@ -4,6 +4,7 @@ from purchase.related_models.constants.rsc_exchange_currency import (
     MORALIS,
     PRICE_SOURCES,
     RSC_EXCHANGE_CURRENCY,
+    RSC_EXCHANGE_RATE_INTERVALS,
 )
 from utils.models import DefaultModel
 
@@ -42,3 +43,43 @@ class RscExchangeRate(DefaultModel):
         max_length=255,
         null=False,
     )
+
+    class Meta:
+        indexes = (
+            models.Index(
+                fields=("target_currency", "-created_date"),
+                name="rsc_rate_currency_created_idx",
+            ),
+        )
+
+
+class RscExchangeRateBucket(models.Model):
+    """
+    Open/high/low/close of RscExchangeRate.rate over an hour or a day,
+    kept up to date as rates are recorded so charts never scan the raw
+    table.
+    """
+
+    target_currency = models.CharField(
+        choices=RSC_EXCHANGE_CURRENCY,
+        max_length=255,
+    )
+    interval = models.CharField(
+        choices=RSC_EXCHANGE_RATE_INTERVALS,
+        max_length=16,
+    )
+    bucket_start = models.DateTimeField()
+    open = models.FloatField()
+    high = models.FloatField()
+    low = models.FloatField()
+    close = models.FloatField()
+    sample_count = models.PositiveIntegerField(default=1)
+    updated_date = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["target_currency", "interval", "bucket_start"],
+                name="unique_rsc_rate_bucket",
+            )
+        ]
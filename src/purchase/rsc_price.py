@@ -0,0 +1,209 @@
+import time
+
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest, Least
+
+from purchase.related_models.constants.rsc_exchange_currency import (
+    DAY,
+    HOUR,
+    MORALIS,
+    USD,
+)
+from purchase.related_models.rsc_exchange_rate_model import (
+    RscExchangeRate,
+    RscExchangeRateBucket,
+)
+from utils.cache import incr_cache_counter
+
+RSC_PRICE_CACHE_TIMEOUT = 60 * 60 * 24
+# Rates are recorded hourly, so workers may serve their own copy of the
+# latest rate for this long before checking the shared cache again
+RSC_PRICE_LOCAL_CACHE_SECONDS = 60
+RSC_PRICE_SERIES_MAX_POINTS = 1000
+RSC_PRICE_SERIES_DEFAULT_POINTS = {HOUR: 24 * 7, DAY: 365}
+
+RSC_PRICE_FIELDS = (
+    "rate",
+    "real_rate",
+    "price_source",
+    "target_currency",
+    "created_date",
+)
+RSC_PRICE_BUCKET_FIELDS = ("bucket_start", "open", "high", "low", "close")
+
+_local_latest_rates = {}
+
+
+def _get_latest_key(target_currency, price_source):
+    return f"rsc_price_latest_{target_currency}_{price_source or 'any'}"
+
+
+def _get_series_version_key(target_currency):
+    return f"rsc_price_series_version_{target_currency}"
+
+
+def _get_series_key(target_currency, interval, limit):
+    version = cache.get(_get_series_version_key(target_currency), 0)
+    return f"rsc_price_series_{target_currency}_{interval}_{limit}_{version}"
+
+
+def _invalidate_series(target_currency):
+    # Cached series are keyed by version, bumping it retires all of them
+    incr_cache_counter(_get_series_version_key(target_currency))
+
+
+def get_bucket_start(date, interval):
+    bucket_start = date.replace(minute=0, second=0, microsecond=0)
+    if interval == DAY:
+        bucket_start = bucket_start.replace(hour=0)
+    return bucket_start
+
+
+def _set_local_latest_rate(key, value):
+    expires_at = time.monotonic() + RSC_PRICE_LOCAL_CACHE_SECONDS
+    _local_latest_rates[key] = (expires_at, value)
+
+
+def _set_latest_rate(target_currency, price_source, value):
+    key = _get_latest_key(target_currency, price_source)
+    cache.set(key, value, timeout=RSC_PRICE_CACHE_TIMEOUT)
+    _set_local_latest_rate(key, value)
+
+
+def get_latest_rsc_rate(target_currency=USD, price_source=None):
+    """
+    Returns the most recently recorded rate as a dict of RSC_PRICE_FIELDS,
+    optionally restricted to one price source, or None if none exists.
+    Served from process memory, then the shared cache, and only read from
+    the database when both are cold.
+    """
+    key = _get_latest_key(target_currency, price_source)
+    local = _local_latest_rates.get(key)
+    if local is not None and local[0] > time.monotonic():
+        return local[1]
+
+    value = cache.get(key)
+    if value is None:
+        rates = RscExchangeRate.objects.filter(target_currency=target_currency)
+        if price_source is not None:
+            rates = rates.filter(price_source=price_source)
+        value = rates.order_by("-created_date").values(*RSC_PRICE_FIELDS).first()
+        if value is None:
+            return None
+        cache.set(key, value, timeout=RSC_PRICE_CACHE_TIMEOUT)
+
+    _set_local_latest_rate(key, value)
+    return value
+
+
+def _record_bucket(target_currency, interval, date, rate):
+    bucket_start = get_bucket_start(date, interval)
+    try:
+        with transaction.atomic():
+            RscExchangeRateBucket.objects.create(
+                target_currency=target_currency,
+                interval=interval,
+                bucket_start=bucket_start,
+                open=rate,
+                high=rate,
+                low=rate,
+                close=rate,
+            )
+    except IntegrityError:
+        RscExchangeRateBucket.objects.filter(
+            target_currency=target_currency,
+            interval=interval,
+            bucket_start=bucket_start,
+        ).update(
+            high=Greatest(F("high"), Value(rate)),
+            low=Least(F("low"), Value(rate)),
+            close=rate,
+            sample_count=F("sample_count") + 1,
+        )
+
+
+def record_rsc_exchange_rate(
+    rate, real_rate, target_currency=USD, price_source=MORALIS
+):
+    """
+    Records a rate and folds it into the hourly and daily buckets and the
+    latest rate cache. Every writer of RscExchangeRate goes through here.
+    """
+    exchange_rate = RscExchangeRate.objects.create(
+        price_source=price_source,
+        rate=rate,
+        real_rate=real_rate,
+        target_currency=target_currency,
+    )
+    for interval in (HOUR, DAY):
+        _record_bucket(target_currency, interval, exchange_rate.created_date, rate)
+
+    value = {field: getattr(exchange_rate, field) for field in RSC_PRICE_FIELDS}
+    _set_latest_rate(target_currency, None, value)
+    _set_latest_rate(target_currency, price_source, value)
+
+    _invalidate_series(target_currency)
+    return exchange_rate
+
+
+def get_rsc_rate_series(interval=HOUR, limit=None, target_currency=USD):
+    """
+    Returns up to `limit` of the most recent `interval` buckets as dicts of
+    RSC_PRICE_BUCKET_FIELDS, oldest first.
+    """
+    limit = min(
+        limit or RSC_PRICE_SERIES_DEFAULT_POINTS[interval], RSC_PRICE_SERIES_MAX_POINTS
+    )
+    key = _get_series_key(target_currency, interval, limit)
+    series = cache.get(key)
+    if series is None:
+        buckets = RscExchangeRateBucket.objects.filter(
+            target_currency=target_currency, interval=interval
+        ).order_by("-bucket_start")
+        series = list(buckets.values(*RSC_PRICE_BUCKET_FIELDS)[:limit])[::-1]
+        cache.set(key, series, timeout=RSC_PRICE_CACHE_TIMEOUT)
+    return series
+
+
+def rebuild_rsc_rate_buckets(target_currency=USD, batch_size=1000):
+    """
+    Recomputes every bucket of `target_currency` from RscExchangeRate.
+    Returns the number of buckets written.
+    """
+    buckets = {}
+    rates = (
+        RscExchangeRate.objects.filter(target_currency=target_currency)
+        .order_by("created_date")
+        .values_list("created_date", "rate")
+    )
+    for created_date, rate in rates.iterator(chunk_size=batch_size):
+        for interval in (HOUR, DAY):
+            bucket_start = get_bucket_start(created_date, interval)
+            bucket = buckets.get((interval, bucket_start))
+            if bucket is None:
+                buckets[(interval, bucket_start)] = RscExchangeRateBucket(
+                    target_currency=target_currency,
+                    interval=interval,
+                    bucket_start=bucket_start,
+                    open=rate,
+                    high=rate,
+                    low=rate,
+                    close=rate,
+                )
+            else:
+                bucket.high = max(bucket.high, rate)
+                bucket.low = min(bucket.low, rate)
+                bucket.close = rate
+                bucket.sample_count += 1
+
+    RscExchangeRateBucket.objects.bulk_create(
+        buckets.values(),
+        batch_size=batch_size,
+        update_conflicts=True,
+        unique_fields=["target_currency", "interval", "bucket_start"],
+        update_fields=["open", "high", "low", "close", "sample_count"],
+    )
+    _invalidate_series(target_currency)
+    return len(buckets)
@@ -1,9 +1,23 @@
+import datetime
+
+import pytz
 from django.contrib.contenttypes.models import ContentType
 from django.test import TestCase
 from rest_framework.test import APITestCase
 
 from paper.tests.helpers import create_paper
-from purchase.models import Balance
+from purchase.models import (
+    Balance,
+    BalanceCheckpoint,
+    RscExchangeRate,
+    RscExchangeRateBucket,
+)
+from purchase.related_models.constants.rsc_exchange_currency import HOUR, USD
+from purchase.rsc_price import (
+    get_rsc_rate_series,
+    rebuild_rsc_rate_buckets,
+    record_rsc_exchange_rate,
+)
 from reputation.models import Escrow
 from user.related_models.gatekeeper_model import Gatekeeper
 from user.tests.helpers import (
@@ -91,3 +105,69 @@ class SendRSCTest(APITestCase, TestCase, TestHelper, IntegrationTestHelper):
                 "purchase_type": "BOOST",
             },
         )
+
+
+class BalanceCheckpointTest(APITestCase):
+    def setUp(self):
+        self.user = create_random_default_user("checkpoint_user")
+        self.distribution_content_type = ContentType.objects.get(model="distribution")
+
+    def test_checkpoint_tracks_balance_writes(self):
+        Balance.objects.create(
+            amount="100.5", user=self.user, content_type=self.distribution_content_type
+        )
+        balance = Balance.objects.create(
+            amount="-20", user=self.user, content_type=self.distribution_content_type
+        )
+        balance.amount = "-30"
+        balance.save()
+
+        self.assertEqual(self.user.get_balance(), 70.5)
+        self.assertEqual(
+            BalanceCheckpoint.objects.get(user=self.user).balance,
+            BalanceCheckpoint.get_ledger_balance(self.user.id),
+        )
+
+    def test_reconcile_fixes_drifted_checkpoint(self):
+        Balance.objects.create(
+            amount="10", user=self.user, content_type=self.distribution_content_type
+        )
+        BalanceCheckpoint.objects.filter(user=self.user).update(balance=0)
+
+        checkpoint_balance, ledger_balance = BalanceCheckpoint.reconcile(
+            self.user.id, fix=True
+        )
+        self.assertEqual((checkpoint_balance, ledger_balance), (0, 10))
+        self.assertEqual(self.user.get_balance(), 10)
+
+
+class RscPriceTest(APITestCase):
+    def test_latest_rate_follows_recorded_rates(self):
+        record_rsc_exchange_rate(0.5, 0.5)
+        record_rsc_exchange_rate(0.75, 0.7)
+
+        response = self.client.get("/api/exchange_rate/latest/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["rate"], 0.75)
+        self.assertEqual(response.data["real_rate"], 0.7)
+
+    def test_buckets_hold_open_high_low_close(self):
+        for rate in (0.5, 0.9, 0.3, 0.6):
+            record_rsc_exchange_rate(rate, rate)
+        start = datetime.datetime(2023, 1, 1, 10, tzinfo=pytz.UTC)
+        for minutes, exchange_rate in enumerate(RscExchangeRate.objects.order_by("id")):
+            RscExchangeRate.objects.filter(id=exchange_rate.id).update(
+                created_date=start + datetime.timedelta(minutes=minutes * 20)
+            )
+        RscExchangeRateBucket.objects.all().delete()
+
+        rebuild_rsc_rate_buckets(USD)
+
+        series = get_rsc_rate_series(HOUR, target_currency=USD)
+        self.assertEqual(
+            [
+                (bucket["open"], bucket["high"], bucket["low"], bucket["close"])
+                for bucket in series
+            ],
+            [(0.5, 0.9, 0.3, 0.3), (0.6, 0.6, 0.6, 0.6)],
+        )
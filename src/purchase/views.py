@@ -28,6 +28,13 @@ from purchase.models import (
     Wallet,
 )
 from purchase.permissions import CanSendRSC
+from purchase.related_models.constants.rsc_exchange_currency import (
+    HOUR,
+    RSC_EXCHANGE_CURRENCY,
+    RSC_EXCHANGE_RATE_INTERVALS,
+    USD,
+)
+from purchase.rsc_price import get_latest_rsc_rate, get_rsc_rate_series
 from purchase.serializers import (
     AggregatePurchaseSerializer,
     BalanceSerializer,
@@ -548,6 +555,48 @@ class RscExchangeRateViewSet(viewsets.ReadOnlyModelViewSet):
         "price_source",
     ]
 
+    def _get_target_currency(self, request):
+        target_currency = request.query_params.get("target_currency", USD)
+        if target_currency not in dict(RSC_EXCHANGE_CURRENCY):
+            return None
+        return target_currency
+
+    @action(detail=False, methods=["get"])
+    def latest(self, request):
+        target_currency = self._get_target_currency(request)
+        if target_currency is None:
+            return Response({"message": "Invalid target_currency"}, status=400)
+
+        rate = get_latest_rsc_rate(target_currency)
+        if rate is None:
+            return Response(status=404)
+        return Response(rate, status=200)
+
+    @action(detail=False, methods=["get"])
+    def series(self, request):
+        target_currency = self._get_target_currency(request)
+        interval = request.query_params.get("interval", HOUR).upper()
+        if target_currency is None or interval not in dict(RSC_EXCHANGE_RATE_INTERVALS):
+            return Response(
+                {"message": "Invalid target_currency or interval"}, status=400
+            )
+
+        try:
+            limit = max(int(request.query_params.get("limit", 0)), 0)
+        except ValueError:
+            limit = 0
+        series = get_rsc_rate_series(
+            interval, limit=limit or None, target_currency=target_currency
+        )
+        return Response(
+            {
+                "target_currency": target_currency,
+                "interval": interval,
+                "results": series,
+            },
+            status=200,
+        )
+
 
 class StripeViewSet(viewsets.ModelViewSet):
     # Deprecated
@@ -14,7 +14,7 @@ import utils.sentry as sentry
 from purchase.models import Balance
 from reputation.distributions import Distribution as dist
 from reputation.exceptions import ReputationDistributorError
-from reputation.models import Contribution, Distribution
+from reputation.models import Contribution, Distribution, Leaderboard
 from researchhub.settings import REFERRAL_PROGRAM
 from user.models import User
 from utils.serializers import get_model_serializer
@@ -142,6 +142,12 @@ class Distributor:
         return False
 
     def _record_distribution(self):
+        # Leaderboard.rebuild relies on the distribution and its leaderboard
+        # increment committing together
+        with transaction.atomic():
+            return self._create_distribution()
+
+    def _create_distribution(self):
         record = Distribution.objects.create(
             recipient=self.recipient,
             giver=self.giver,
@@ -157,6 +163,13 @@ class Distributor:
 
         if self.hubs:
             record.hubs.add(*self.hubs)
+
+        try:
+            hub_ids = [getattr(hub, "id", hub) for hub in self.hubs or []]
+            with transaction.atomic():
+                Leaderboard.record_distribution(record, hub_ids)
+        except Exception as error:
+            sentry.log_error(error)
         return record
 
     def _update_reputation_and_balance(self, record):
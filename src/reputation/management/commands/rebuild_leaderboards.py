@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from reputation.models import Leaderboard
+from reputation.related_models.leaderboard import LEADERBOARD_TIMEFRAMES
+
+
+class Command(BaseCommand):
+    """
+    Rebuilds every leaderboard timeframe, including all_time, which the
+    hourly rebuild leaves to increments. Seeds the table and repairs drift.
+    """
+
+    def handle(self, *args, **options):
+        count = Leaderboard.rebuild(timeframes=LEADERBOARD_TIMEFRAMES)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} leaderboard rows"))
@@ -0,0 +1,87 @@
+# Generated by Django 4.1 on 2026-10-18 12:00
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("hub", "0019_remove_hubmembership_created_at"),
+        ("reputation", "0076_escrowrecipients_escrow_new_recipients_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Leaderboard",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_date", models.DateTimeField(auto_now_add=True)),
+                ("updated_date", models.DateTimeField(auto_now=True)),
+                (
+                    "timeframe",
+                    models.CharField(
+                        choices=[
+                            ("today", "today"),
+                            ("past_week", "past_week"),
+                            ("past_month", "past_month"),
+                            ("past_year", "past_year"),
+                            ("all_time", "all_time"),
+                        ],
+                        max_length=16,
+                    ),
+                ),
+                ("reputation", models.IntegerField(default=0)),
+                (
+                    "hub",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="leaderboard_entries",
+                        to="hub.hub",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="leaderboard_entries",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="leaderboard",
+            index=models.Index(
+                fields=["hub", "timeframe", "-reputation"],
+                name="leaderboard_rank_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="leaderboard",
+            constraint=models.UniqueConstraint(
+                fields=("user", "hub", "timeframe"),
+                name="unique_leaderboard_user_hub_timeframe",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="leaderboard",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("hub__isnull", True)),
+                fields=("user", "timeframe"),
+                name="unique_leaderboard_user_timeframe",
+            ),
+        ),
+    ]
@@ -6,6 +6,7 @@ from reputation.related_models.deposit import Deposit
 from reputation.related_models.distribution import Distribution
 from reputation.related_models.distribution_amount import DistributionAmount
 from reputation.related_models.escrow import Escrow
+from reputation.related_models.leaderboard import Leaderboard
 from reputation.related_models.paid_status_mixin import PaidStatusModelMixin
 from reputation.related_models.webhook import Webhook
 from reputation.related_models.withdrawal import Withdrawal
@@ -0,0 +1,220 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import pytz
+from django.db import IntegrityError, connection, models, transaction
+from django.db.models import F, Q, Sum
+from django.utils import timezone
+
+from utils.models import DefaultModel
+
+TODAY = "today"
+PAST_WEEK = "past_week"
+PAST_MONTH = "past_month"
+PAST_YEAR = "past_year"
+ALL_TIME = "all_time"
+LEADERBOARD_TIMEFRAMES = (TODAY, PAST_WEEK, PAST_MONTH, PAST_YEAR, ALL_TIME)
+LEADERBOARD_ROLLING_TIMEFRAMES = (TODAY, PAST_WEEK, PAST_MONTH, PAST_YEAR)
+
+# Distributions this recent when a rebuild starts are read again under the
+# table lock, their transactions may not have committed at the first read
+LEADERBOARD_REBUILD_CATCH_UP = timedelta(minutes=10)
+
+# Distributions that do not count towards leaderboard reputation
+LEADERBOARD_EXCLUDED_DISTRIBUTION_TYPES = (
+    "REFERRAL",
+    "PURCHASE",
+    "REWARD",
+    "EDITOR_COMPENSATION",
+    "EDITOR_PAYOUT",
+    "MOD_PAYOUT",
+    "CREATE_BULLET_POINT",
+    "CREATE_SUMMARY",
+    "SUMMARY_UPVOTED",
+    "BULLET_POINT_UPVOTED",
+    "CREATE_FIRST_SUMMARY",
+    "REFERRAL_APPROVED",
+)
+LEADERBOARD_HUB_EXCLUDED_DISTRIBUTION_TYPES = (
+    *LEADERBOARD_EXCLUDED_DISTRIBUTION_TYPES,
+    "BOUNTY_DAO_FEE",
+)
+
+
+def get_leaderboard_timeframe_start(timeframe, now=None):
+    """Returns the aware datetime at which `timeframe` starts."""
+    now = now or timezone.now()
+    start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    if timeframe == TODAY:
+        return start_of_day
+    elif timeframe == PAST_WEEK:
+        return start_of_day - timedelta(days=7)
+    elif timeframe == PAST_MONTH:
+        return start_of_day - timedelta(days=30)
+    elif timeframe == PAST_YEAR:
+        return start_of_day - timedelta(days=365)
+    return datetime(year=2019, month=1, day=1, tzinfo=pytz.UTC)
+
+
+class Leaderboard(DefaultModel):
+    """
+    Materialized reputation per user, hub and timeframe.
+    Rows without a hub hold the site-wide leaderboard.
+    """
+
+    TIMEFRAME_CHOICES = [(timeframe, timeframe) for timeframe in LEADERBOARD_TIMEFRAMES]
+
+    user = models.ForeignKey(
+        "user.User",
+        related_name="leaderboard_entries",
+        on_delete=models.CASCADE,
+    )
+    hub = models.ForeignKey(
+        "hub.Hub",
+        related_name="leaderboard_entries",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+    )
+    timeframe = models.CharField(max_length=16, choices=TIMEFRAME_CHOICES)
+    reputation = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = (
+            models.UniqueConstraint(
+                fields=("user", "hub", "timeframe"),
+                name="unique_leaderboard_user_hub_timeframe",
+            ),
+            models.UniqueConstraint(
+                fields=("user", "timeframe"),
+                condition=Q(hub__isnull=True),
+                name="unique_leaderboard_user_timeframe",
+            ),
+        )
+        indexes = (
+            models.Index(
+                fields=("hub", "timeframe", "-reputation"),
+                name="leaderboard_rank_idx",
+            ),
+        )
+
+    def __str__(self):
+        return f"Leaderboard: {self.user_id} - {self.hub_id} - {self.timeframe}"
+
+    @classmethod
+    def _increment(cls, user_id, hub_id, amount):
+        for timeframe in LEADERBOARD_TIMEFRAMES:
+            updated = cls.objects.filter(
+                user_id=user_id, hub_id=hub_id, timeframe=timeframe
+            ).update(reputation=F("reputation") + amount)
+            if updated:
+                continue
+
+            try:
+                with transaction.atomic():
+                    cls.objects.create(
+                        user_id=user_id,
+                        hub_id=hub_id,
+                        timeframe=timeframe,
+                        reputation=amount,
+                    )
+            except IntegrityError:
+                # Created concurrently
+                cls.objects.filter(
+                    user_id=user_id, hub_id=hub_id, timeframe=timeframe
+                ).update(reputation=F("reputation") + amount)
+
+    @classmethod
+    def record_distribution(cls, distribution, hub_ids):
+        """
+        Adds a newly created distribution to every timeframe it falls in,
+        which is all of them at creation time.
+        """
+        amount = distribution.reputation_amount
+        user_id = distribution.recipient_id
+        distribution_type = distribution.distribution_type
+        if not amount or user_id is None:
+            return
+
+        if distribution_type not in LEADERBOARD_EXCLUDED_DISTRIBUTION_TYPES:
+            cls._increment(user_id, None, amount)
+        if distribution_type not in LEADERBOARD_HUB_EXCLUDED_DISTRIBUTION_TYPES:
+            for hub_id in hub_ids:
+                cls._increment(user_id, hub_id, amount)
+
+    @classmethod
+    def rebuild(cls, timeframes=LEADERBOARD_ROLLING_TIMEFRAMES, now=None):
+        """
+        Recomputes the rows of `timeframes` from the distribution records.
+        This is what expires reputation that has aged out of the rolling
+        timeframes, all_time rows only ever grow and are kept incrementally.
+
+        Totals up to a cutoff shortly before now are read without locking.
+        The table is then locked against increments only while the
+        distributions since the cutoff are added and the rows are replaced.
+        Distributors create the distribution and increment in one
+        transaction, so every distribution visible under the lock has its
+        increment in the old rows, and every other one increments the new
+        rows once the lock is released.
+        """
+        now = now or timezone.now()
+        cutoff = now - LEADERBOARD_REBUILD_CATCH_UP
+        totals = cls._get_totals(timeframes, now, Q(created_date__lt=cutoff))
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(f"LOCK TABLE {cls._meta.db_table} IN EXCLUSIVE MODE")
+            recent_totals = cls._get_totals(
+                timeframes, now, Q(created_date__gte=cutoff)
+            )
+            for key, total in recent_totals.items():
+                totals[key] += total
+
+            entries = [
+                cls(
+                    user_id=user_id,
+                    hub_id=hub_id,
+                    timeframe=timeframe,
+                    reputation=total,
+                )
+                for (timeframe, user_id, hub_id), total in totals.items()
+                if total
+            ]
+            cls.objects.filter(timeframe__in=timeframes).delete()
+            cls.objects.bulk_create(entries, batch_size=1000)
+        return len(entries)
+
+    @classmethod
+    def _get_totals(cls, timeframes, now, date_filter):
+        """
+        Returns the reputation of the distributions matching `date_filter`
+        keyed by (timeframe, user_id, hub_id).
+        """
+        from reputation.models import Distribution
+
+        totals = defaultdict(int)
+        for timeframe in timeframes:
+            distributions = Distribution.objects.filter(
+                date_filter,
+                created_date__gte=get_leaderboard_timeframe_start(timeframe, now),
+                recipient__isnull=False,
+            )
+            site_rows = (
+                distributions.exclude(
+                    distribution_type__in=LEADERBOARD_EXCLUDED_DISTRIBUTION_TYPES
+                )
+                .values("recipient_id")
+                .annotate(total=Sum("reputation_amount"))
+            )
+            hub_rows = (
+                distributions.exclude(
+                    distribution_type__in=LEADERBOARD_HUB_EXCLUDED_DISTRIBUTION_TYPES
+                )
+                .filter(hubs__isnull=False)
+                .values("recipient_id", "hubs")
+                .annotate(total=Sum("reputation_amount"))
+            )
+            for row in site_rows.iterator():
+                totals[(timeframe, row["recipient_id"], None)] += row["total"]
+            for row in hub_rows.iterator():
+                totals[(timeframe, row["recipient_id"], row["hubs"])] += row["total"]
+        return totals
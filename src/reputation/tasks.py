@@ -5,13 +5,14 @@ import pytz
 from celery.decorators import periodic_task
 from celery.task.schedules import crontab
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import DurationField, F
+from django.db.models import DurationField, Exists, F, OuterRef
 from django.db.models.functions import Cast
 
+from hub.models import Hub
 from mailing_list.lib import base_email_context
 from notification.models import Notification
 from reputation.lib import check_hotwallet, check_pending_withdrawal
-from reputation.models import Bounty, Contribution
+from reputation.models import Bounty, Contribution, Leaderboard
 from researchhub.celery import QUEUE_BOUNTIES, QUEUE_CONTRIBUTIONS, QUEUE_PURCHASES, app
 from researchhub.settings import PRODUCTION
 from researchhub_document.models import ResearchhubUnifiedDocument
@@ -27,6 +28,7 @@ from utils.message import send_email_message
 from utils.sentry import log_info
 
 DEFAULT_REWARD = 1000000
+BOUNTY_HUB_NOTIFICATION_BATCH_SIZE = 1000
 
 
 @app.task(queue=QUEUE_CONTRIBUTIONS)
@@ -82,6 +84,15 @@ def create_author_contribution(contribution_type, user_id, unified_doc_id, objec
     Contribution.objects.bulk_create(contributions)
 
 
+@periodic_task(
+    run_every=crontab(minute=10),
+    priority=5,
+    queue=QUEUE_CONTRIBUTIONS,
+)
+def rebuild_leaderboards():
+    Leaderboard.rebuild()
+
+
 @periodic_task(
     run_every=crontab(minute="*/5"),
     priority=4,
@@ -186,35 +197,94 @@ def send_bounty_hub_notifications():
     upcoming_expirations = open_bounties.filter(
         time_left__gt=timedelta(days=0), time_left__lte=timedelta(days=5)
     )
-    for bounty in upcoming_expirations.iterator():
-        hubs = bounty.unified_document.hubs.all()
-        for hub in hubs.iterator():
-            for subscriber in hub.subscribers.all().iterator():
-                # Sends a notification if no notification exists for user in hub with current bounty
-                if not Notification.objects.filter(
-                    object_id=bounty.id,
-                    content_type=ContentType.objects.get_for_model(Bounty),
-                    recipient=subscriber,
-                    action_user=action_user,
-                ).exists():
-                    bounty_item = bounty.item
-                    if isinstance(bounty_item, ResearchhubUnifiedDocument):
-                        unified_doc = bounty_item
-                    else:
-                        unified_doc = bounty_item.unified_document
-                    notification = Notification.objects.create(
-                        item=bounty,
-                        action_user=action_user,
-                        recipient=subscriber,
-                        unified_document=unified_doc,
-                        notification_type=Notification.BOUNTY_HUB_EXPIRING_SOON,
-                        extra={
-                            "hub_details": json.dumps(
-                                {"name": hub.name, "slug": hub.slug}
-                            )
-                        },
-                    )
-                    notification.send_notification()
+    hub_details = {
+        hub["id"]: json.dumps({"name": hub["name"], "slug": hub["slug"]})
+        for hub in Hub.objects.filter(
+            related_documents__related_bounties__in=upcoming_expirations
+        ).values("id", "name", "slug")
+    }
+    bounties = {
+        bounty.id: bounty
+        for bounty in upcoming_expirations.select_related("unified_document")
+    }
+
+    notifications = []
+    notified = set()
+    templates = {}
+    for bounty_id, recipient_id, hub_id in _get_bounty_hub_recipients(
+        upcoming_expirations, action_user
+    ).iterator():
+        # Subscribers of several of the document's hubs are notified once
+        if (bounty_id, recipient_id) in notified:
+            continue
+        notified.add((bounty_id, recipient_id))
+
+        template = templates.get(bounty_id)
+        if template is None:
+            template = _get_bounty_hub_notification_template(
+                bounties[bounty_id], action_user
+            )
+            templates[bounty_id] = template
+
+        notifications.append(
+            Notification(
+                item=template.item,
+                action_user=action_user,
+                recipient_id=recipient_id,
+                unified_document=template.unified_document,
+                notification_type=Notification.BOUNTY_HUB_EXPIRING_SOON,
+                body=template.body,
+                navigation_url=template.navigation_url,
+                extra={"hub_details": hub_details[hub_id]},
+            )
+        )
+        if len(notifications) >= BOUNTY_HUB_NOTIFICATION_BATCH_SIZE:
+            Notification.bulk_create_and_send(notifications)
+            notifications = []
+
+    if notifications:
+        Notification.bulk_create_and_send(notifications)
+
+
+def _get_bounty_hub_recipients(bounties, action_user):
+    """
+    (bounty id, subscriber id, hub id) rows for every subscriber of a hub
+    of the bounty's document who has not been notified about the bounty
+    yet.
+    """
+    already_notified = Notification.objects.filter(
+        content_type=ContentType.objects.get_for_model(Bounty),
+        object_id=OuterRef("id"),
+        recipient_id=OuterRef("recipient_id"),
+        action_user=action_user,
+    )
+    return (
+        bounties.annotate(
+            hub_id=F("unified_document__hubs"),
+            recipient_id=F("unified_document__hubs__subscribers"),
+        )
+        .filter(recipient_id__isnull=False)
+        .filter(~Exists(already_notified))
+        .order_by("id", "hub_id")
+        .values_list("id", "recipient_id", "hub_id")
+    )
+
+
+def _get_bounty_hub_notification_template(bounty, action_user):
+    # The body only depends on the bounty, so it is formatted once
+    bounty_item = bounty.item
+    if isinstance(bounty_item, ResearchhubUnifiedDocument):
+        unified_doc = bounty_item
+    else:
+        unified_doc = bounty_item.unified_document
+    template = Notification(
+        item=bounty,
+        action_user=action_user,
+        unified_document=unified_doc,
+        notification_type=Notification.BOUNTY_HUB_EXPIRING_SOON,
+    )
+    template.format_body()
+    return template
 
 
 @periodic_task(
@@ -1,14 +1,17 @@
 import decimal
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 
+import pytz
 from rest_framework.test import APITestCase
 
 from discussion.tests.helpers import create_rh_comment
-from hub.tests.helpers import create_hub
+from hub.tests.helpers import create_hub, subscribe
+from notification.models import Notification
 from reputation.distributions import Distribution as Dist
 from reputation.distributor import Distributor
-from reputation.models import BountyFee
+from reputation.models import Bounty, BountyFee
+from reputation.tasks import send_bounty_hub_notifications
 from user.models import User
 from user.tests.helpers import create_moderator, create_random_default_user, create_user
 
@@ -615,3 +618,29 @@ class BountyViewTests(APITestCase):
             f"/api/bounty/{bounty_1.data['id']}/cancel_bounty/",
         )
         self.assertEqual(cancel_bounty_res_2.status_code, 403)
+
+    def test_hub_subscribers_notified_of_expiring_bounty_once(self):
+        bounty_res = self.test_user_can_create_bounty()
+        bounty = Bounty.objects.get(id=bounty_res.data["id"])
+        bounty.expiration_date = datetime.now(pytz.UTC) + timedelta(days=2)
+        bounty.save()
+
+        other_hub = create_hub(name="other_hub")
+        bounty.unified_document.hubs.add(self.hub, other_hub)
+        subscribe(self.hub, self.user_2)
+        subscribe(self.hub, self.user_3)
+        subscribe(other_hub, self.user_2)
+
+        send_bounty_hub_notifications()
+        send_bounty_hub_notifications()
+
+        notifications = Notification.objects.filter(
+            notification_type=Notification.BOUNTY_HUB_EXPIRING_SOON,
+            object_id=bounty.id,
+        )
+        self.assertEqual(notifications.count(), 2)
+        self.assertEqual(
+            set(notifications.values_list("recipient_id", flat=True)),
+            {self.user_2.id, self.user_3.id},
+        )
+        self.assertTrue(all(notification.body for notification in notifications))
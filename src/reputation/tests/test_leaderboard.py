@@ -0,0 +1,82 @@
+import time
+from datetime import datetime
+
+import pytz
+from rest_framework.test import APITestCase
+
+from hub.tests.helpers import create_hub
+from reputation.distributions import Distribution as Dist
+from reputation.distributor import Distributor
+from reputation.models import Leaderboard
+from reputation.related_models.leaderboard import (
+    ALL_TIME,
+    LEADERBOARD_TIMEFRAMES,
+    TODAY,
+    get_leaderboard_timeframe_start,
+)
+from user.tests.helpers import create_random_default_user
+
+
+class LeaderboardTests(APITestCase):
+    def setUp(self):
+        self.user = create_random_default_user("leaderboard_user")
+        self.hub = create_hub(name="leaderboard_hub")
+
+    def _distribute(self, distribution_type, amount):
+        Distributor(
+            Dist(distribution_type, amount, reputation=amount),
+            self.user,
+            None,
+            time.time(),
+            hubs=[self.hub],
+        ).distribute()
+
+    def test_distribution_increments_site_and_hub_rows(self):
+        self._distribute("UPVOTE_RSC_POT", 5)
+        self._distribute("UPVOTE_RSC_POT", 3)
+
+        entries = Leaderboard.objects.filter(user=self.user, timeframe="today")
+        self.assertEqual(entries.get(hub__isnull=True).reputation, 8)
+        self.assertEqual(entries.get(hub=self.hub).reputation, 8)
+
+    def test_excluded_distributions_are_skipped(self):
+        self._distribute("REFERRAL", 5)
+        self.assertFalse(Leaderboard.objects.filter(user=self.user).exists())
+
+    def test_rebuild_matches_incremental_rows(self):
+        self._distribute("UPVOTE_RSC_POT", 5)
+        incremental = set(
+            Leaderboard.objects.values_list("hub_id", "timeframe", "reputation")
+        )
+
+        Leaderboard.rebuild(timeframes=LEADERBOARD_TIMEFRAMES)
+        rebuilt = set(
+            Leaderboard.objects.values_list("hub_id", "timeframe", "reputation")
+        )
+        self.assertEqual(incremental, rebuilt)
+
+    def test_rebuild_keeps_all_time_rows(self):
+        self._distribute("UPVOTE_RSC_POT", 5)
+        Leaderboard.objects.filter(user=self.user, timeframe=ALL_TIME).update(
+            reputation=100
+        )
+        Leaderboard.objects.filter(user=self.user, timeframe=TODAY).update(
+            reputation=100
+        )
+
+        Leaderboard.rebuild()
+
+        entries = Leaderboard.objects.filter(user=self.user, hub__isnull=True)
+        self.assertEqual(entries.get(timeframe=ALL_TIME).reputation, 100)
+        self.assertEqual(entries.get(timeframe=TODAY).reputation, 5)
+
+    def test_timeframe_starts_are_aware_datetimes(self):
+        now = datetime(2026, 10, 18, 15, 30, tzinfo=pytz.UTC)
+        for timeframe in LEADERBOARD_TIMEFRAMES:
+            start = get_leaderboard_timeframe_start(timeframe, now)
+            self.assertIsInstance(start, datetime)
+            self.assertIsNotNone(start.tzinfo)
+        self.assertEqual(
+            get_leaderboard_timeframe_start("today", now),
+            datetime(2026, 10, 18, tzinfo=pytz.UTC),
+        )
@@ -1,45 +1,168 @@
+import copy
+
 import rest_framework.serializers as serializers
+from django.db.models import prefetch_related_objects
+from django.utils.module_loading import import_string
+
+# Nested dynamic serializers can point back at each other (unified document
+# -> paper -> unified document), so query planning stops at this depth
+SERIALIZER_PLAN_MAX_DEPTH = 4
+
+
+def _get_field_names_key(field_names):
+    if field_names is None or field_names == "__all__":
+        return field_names
+    return frozenset(field_names)
+
+
+def _is_many_lookup(model, lookup):
+    for part in lookup.split("__"):
+        field = model._meta.get_field(part)
+        if field.many_to_many or field.one_to_many:
+            return True
+        model = field.related_model
+    return False
 
 
 class DynamicModelFieldSerializer(serializers.ModelSerializer):
+    # Relations read by SerializerMethodFields, used for query planning.
+    # Maps a field name to (lookup, context key, nested serializer path)
+    # tuples. The path is None when the relation is not rendered through
+    # another dynamic serializer.
+    related_method_fields = {}
+
+    # Resolved fields per serializer class and per field selection, shared
+    # by every instance so the model is only introspected once
+    _field_prototypes = {}
+    _field_names = {}
+
     def __init__(self, *args, **kwargs):
         # Don't pass the '_include_fields' arg up to the superclass
         # _include_fields = kwargs.pop("_include_fields", "_all_")
-        _include_fields = kwargs.pop("_include_fields", "__all__")
+        self._include_fields = kwargs.pop("_include_fields", "__all__")
         # Don't pass the '_exclude_fields' arg up to the superclass
-        _exclude_fields = kwargs.pop("_exclude_fields", None)
+        self._exclude_fields = kwargs.pop("_exclude_fields", None)
         # Don't pass the '_filter_fields' arg up to the superclass
         _filter_fields = kwargs.pop("_filter_fields", None)
 
         super(DynamicModelFieldSerializer, self).__init__(*args, **kwargs)
 
-        # instance_class_name = self.instance.__class__.__name__
-        # is_manager = (
-        #     instance_class_name == "RelatedManager"
-        #     or instance_class_name == "ManyRelatedManager"
-        # )
-        # known_related_objects = getattr(self.instance, "_known_related_objects", [])
-        # if is_manager or len(known_related_objects) > 0:
-        #     if _include_fields == "_all_":
-        #         _include_fields = None
-        #         _exclude_fields = "__all__"
-        # elif _include_fields == "_all_":
-        #     _include_fields = "__all__"
+    @classmethod
+    def _get_field_prototypes(cls):
+        prototypes = DynamicModelFieldSerializer._field_prototypes.get(cls)
+        if prototypes is None:
+            prototypes = super(DynamicModelFieldSerializer, cls()).get_fields()
+            DynamicModelFieldSerializer._field_prototypes[cls] = prototypes
+        return prototypes
+
+    @classmethod
+    def resolve_field_names(cls, _include_fields="__all__", _exclude_fields=None):
+        key = (
+            cls,
+            _get_field_names_key(_include_fields),
+            _get_field_names_key(_exclude_fields),
+        )
+        field_names = DynamicModelFieldSerializer._field_names.get(key)
+        if field_names is not None:
+            return field_names
 
+        field_names = list(cls._get_field_prototypes())
         if _include_fields is not None and _include_fields != "__all__":
             # Drop any fields that are not specified in the
             # `_include_fields` argument.
             allowed = set(_include_fields)
-            existing = set(self.fields)
-            for field_name in existing - allowed:
-                self.fields.pop(field_name)
-
-        if _exclude_fields is not None:
-            existing = set(self.fields)
-            if _exclude_fields == "__all__":
-                for field_name in existing:
-                    self.fields.pop(field_name)
-            else:
-                disallowed = set(_exclude_fields)
-                for field_name in disallowed:
-                    self.fields.pop(field_name)
+            field_names = [name for name in field_names if name in allowed]
+
+        if _exclude_fields == "__all__":
+            field_names = []
+        elif _exclude_fields is not None:
+            disallowed = set(_exclude_fields)
+            field_names = [name for name in field_names if name not in disallowed]
+
+        field_names = tuple(field_names)
+        DynamicModelFieldSerializer._field_names[key] = field_names
+        return field_names
+
+    def get_fields(self):
+        prototypes = self._get_field_prototypes()
+        return {
+            name: copy.deepcopy(prototypes[name])
+            for name in self.resolve_field_names(
+                self._include_fields, self._exclude_fields
+            )
+        }
+
+    @classmethod
+    def get_query_plan(
+        cls, context, _include_fields="__all__", _exclude_fields=None, _depth=0
+    ):
+        """
+        Returns the (select_related, prefetch_related) lookups covering the
+        relations this serializer reads for the selected fields, following
+        nested dynamic serializers through their `context` entries.
+        """
+        select_related = []
+        prefetch_related = []
+        if _depth >= SERIALIZER_PLAN_MAX_DEPTH:
+            return select_related, prefetch_related
+
+        model = cls.Meta.model
+        for field_name in cls.resolve_field_names(_include_fields, _exclude_fields):
+            relations = cls.related_method_fields.get(field_name, ())
+            for lookup, context_key, serializer_path in relations:
+                is_many = _is_many_lookup(model, lookup)
+                if is_many:
+                    prefetch_related.append(lookup)
+                else:
+                    select_related.append(lookup)
+                if serializer_path is None:
+                    continue
+
+                context_fields = context.get(context_key, {})
+                nested_select, nested_prefetch = import_string(
+                    serializer_path
+                ).get_query_plan(
+                    context,
+                    _include_fields=context_fields.get("_include_fields", "__all__"),
+                    _exclude_fields=context_fields.get("_exclude_fields", None),
+                    _depth=_depth + 1,
+                )
+                if is_many:
+                    nested_prefetch = nested_select + nested_prefetch
+                else:
+                    select_related.extend(
+                        f"{lookup}__{nested}" for nested in nested_select
+                    )
+                prefetch_related.extend(
+                    f"{lookup}__{nested}" for nested in nested_prefetch
+                )
+
+        return (
+            list(dict.fromkeys(select_related)),
+            list(dict.fromkeys(prefetch_related)),
+        )
+
+    @classmethod
+    def plan_queryset(
+        cls, queryset, context, _include_fields="__all__", _exclude_fields=None
+    ):
+        select_related, prefetch_related = cls.get_query_plan(
+            context, _include_fields=_include_fields, _exclude_fields=_exclude_fields
+        )
+        return queryset.select_related(*select_related).prefetch_related(
+            *prefetch_related
+        )
+
+    @classmethod
+    def prefetch_instances(
+        cls, instances, context, _include_fields="__all__", _exclude_fields=None
+    ):
+        """
+        Loads the planned relations onto already fetched instances, e.g. a
+        paginated page. Relations that are already cached are skipped.
+        """
+        select_related, prefetch_related = cls.get_query_plan(
+            context, _include_fields=_include_fields, _exclude_fields=_exclude_fields
+        )
+        prefetch_related_objects(instances, *select_related, *prefetch_related)
+        return instances
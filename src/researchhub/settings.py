@@ -260,8 +260,17 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
-# if not TESTING:
-#     MIDDLEWARE.append('profiler.middleware.profiler.ProfileMiddleware')
+# Profiler
+
+# Fraction of /api requests profiled by ProfileMiddleware, 0 disables it
+PROFILER_SAMPLE_RATE = float(os.environ.get("PROFILER_SAMPLE_RATE", 0))
+# Queries slower than this get their plan captured, once per fingerprint
+PROFILER_SLOW_QUERY_MS = float(os.environ.get("PROFILER_SLOW_QUERY_MS", 100))
+PROFILER_N_PLUS_ONE_THRESHOLD = 5
+PROFILER_STATS_LIMIT = 40
+
+if not TESTING and PROFILER_SAMPLE_RATE > 0:
+    MIDDLEWARE.append("profiler.middleware.profiler.ProfileMiddleware")
 
 if USE_SILK:
     INSTALLED_APPS += ["silk", "dbbackup"]
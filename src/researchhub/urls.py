@@ -28,6 +28,7 @@ import notification.views
 import oauth.urls
 import oauth.views
 import paper.views as paper_views
+import profiler.views
 import purchase.views
 import reputation.views
 import researchhub.views
@@ -327,6 +328,7 @@ router.register(
 router.register(
     r"exchange_rate", purchase.views.RscExchangeRateViewSet, basename="exchange_rate"
 )
+router.register(r"profiler", profiler.views.ProfilerReportViewSet, basename="profiler")
 router.register(r"citation_entry", CitationEntryViewSet, basename="citation_entry")
 router.register(
     r"citation_project", CitationProjectViewSet, basename="citation_project"
@@ -0,0 +1,106 @@
+from collections import defaultdict
+
+from django.db import connection
+from django.db.models import Count
+
+from researchhub_comment.models import RhCommentModel
+
+DEFAULT_COMMENT_TREE_MAX_DEPTH = 3
+
+DESCENDANTS_QUERY = """
+    WITH RECURSIVE descendants AS (
+        SELECT id, parent_id, 1 AS relative_depth
+        FROM "researchhub_comment_rhcommentmodel"
+        WHERE parent_id = ANY(%s) AND is_removed = FALSE
+
+        UNION ALL
+
+        SELECT child.id, child.parent_id, descendants.relative_depth + 1
+        FROM "researchhub_comment_rhcommentmodel" child, descendants
+        WHERE child.parent_id = descendants.id
+            AND child.is_removed = FALSE
+            AND descendants.relative_depth < %s
+    )
+    SELECT id
+    FROM descendants;
+"""
+
+
+class RhCommentTreeLoader:
+    """
+    Loads the replies of a page of root comments in a fixed number of
+    queries: one recursive query for the descendant ids, one for the rows
+    and one grouped count for children_count. The tree is assembled in
+    memory on `_tree_children` / `_tree_children_count`, which
+    DynamicRhCommentSerializer reads instead of querying per node.
+
+    `filter_children` receives the flat queryset of descendants and should
+    apply the same filters and ordering the recursive path applies to
+    each `comment.children`. Per-parent limits (child_count, child_offset)
+    are applied here once the replies are grouped by parent.
+    """
+
+    def __init__(
+        self,
+        max_depth=DEFAULT_COMMENT_TREE_MAX_DEPTH,
+        filter_children=None,
+        child_count=None,
+        child_offset=0,
+    ):
+        self.max_depth = max_depth
+        self.filter_children = filter_children
+        self.child_count = child_count
+        self.child_offset = child_offset
+
+    def _get_descendant_ids(self, root_ids):
+        # Roots are depth 1 and the serializer stops at max_depth
+        levels = self.max_depth - 1
+        if levels < 1 or not root_ids:
+            return []
+
+        with connection.cursor() as cursor:
+            cursor.execute(DESCENDANTS_QUERY, [list(root_ids), levels])
+            return [row[0] for row in cursor.fetchall()]
+
+    def _get_children_counts(self, comment_ids):
+        counts = (
+            RhCommentModel.objects.filter(parent_id__in=comment_ids)
+            .values("parent_id")
+            .annotate(count=Count("id"))
+        )
+        return {row["parent_id"]: row["count"] for row in counts}
+
+    def _slice(self, children):
+        if self.child_count is None:
+            return children
+        return children[self.child_offset : self.child_offset + self.child_count]
+
+    def load(self, roots, queryset):
+        """
+        Attaches the reply tree to `roots`. `queryset` is the base
+        queryset descendants are loaded from, with the select_related and
+        prefetch_related calls the serializer needs.
+        """
+        roots = list(roots)
+        comments_by_id = {comment.id: comment for comment in roots}
+
+        descendant_ids = self._get_descendant_ids(comments_by_id.keys())
+        descendants = queryset.filter(id__in=descendant_ids)
+        if self.filter_children is not None:
+            descendants = self.filter_children(descendants)
+
+        children_by_parent = defaultdict(list)
+        for comment in descendants:
+            comments_by_id[comment.id] = comment
+            children_by_parent[comment.parent_id].append(comment)
+
+        children_counts = self._get_children_counts(comments_by_id.keys())
+        for comment in comments_by_id.values():
+            children = self._slice(children_by_parent.get(comment.id, []))
+            for child in children:
+                # Avoids a parent lookup per node during serialization
+                child.parent = comment
+            comment._tree_children = children
+            comment._tree_children_count = children_counts.get(comment.id, 0)
+
+        return roots
@@ -0,0 +1,101 @@
+from django.core.cache import cache
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+from paper.utils import invalidate_paper_detail_cache
+from search.indexing_queue import INDEX_QUEUE_UPDATE, enqueue_index_update
+from utils.cache import incr_cache_counter
+
+# Documents getting more updates than this within the window have their
+# deltas buffered in the cache and written by a delayed flush instead
+DISCUSSION_COUNT_HOT_THRESHOLD = 10
+DISCUSSION_COUNT_HOT_WINDOW_SECONDS = 60
+DISCUSSION_COUNT_FLUSH_COUNTDOWN = 30
+
+
+def _get_document_key(prefix, app_label, model_name, pk):
+    return f"discussion_count_{prefix}_{app_label}_{model_name}_{pk}"
+
+
+def apply_discussion_count_delta(model, pk, amount):
+    model.objects.filter(pk=pk).update(discussion_count=F("discussion_count") + amount)
+    # Queryset updates skip post_save, so reindex explicitly
+    enqueue_index_update(INDEX_QUEUE_UPDATE, model._meta.app_label, model.__name__, pk)
+    if model._meta.model_name == "paper":
+        invalidate_paper_detail_cache(pk)
+
+
+def update_discussion_count(document, amount):
+    """
+    Atomically adds `amount` to document.discussion_count. Updates for
+    documents with a burst of activity are merged in the cache and
+    written at most once per flush countdown.
+    """
+    from researchhub_comment.tasks import flush_discussion_count_delta
+
+    model = document._meta.model
+    app_label = model._meta.app_label
+    model_name = model.__name__
+    document.discussion_count += amount
+
+    rate_key = _get_document_key("rate", app_label, model_name, document.pk)
+    rate = incr_cache_counter(rate_key, 1, timeout=DISCUSSION_COUNT_HOT_WINDOW_SECONDS)
+    if rate <= DISCUSSION_COUNT_HOT_THRESHOLD:
+        apply_discussion_count_delta(model, document.pk, amount)
+        return
+
+    delta_key = _get_document_key("delta", app_label, model_name, document.pk)
+    incr_cache_counter(delta_key, amount)
+    scheduled_key = _get_document_key("scheduled", app_label, model_name, document.pk)
+    if cache.add(scheduled_key, True, timeout=DISCUSSION_COUNT_FLUSH_COUNTDOWN * 10):
+        flush_discussion_count_delta.apply_async(
+            (app_label, model_name, document.pk),
+            countdown=DISCUSSION_COUNT_FLUSH_COUNTDOWN,
+        )
+
+
+def flush_buffered_discussion_count(model, pk):
+    app_label = model._meta.app_label
+    model_name = model.__name__
+    # Cleared first so deltas buffered during the flush schedule another
+    cache.delete(_get_document_key("scheduled", app_label, model_name, pk))
+
+    delta_key = _get_document_key("delta", app_label, model_name, pk)
+    delta = cache.get(delta_key, 0)
+    if not delta:
+        return 0
+
+    try:
+        # Subtract rather than delete so concurrent deltas are kept
+        cache.decr(delta_key, delta)
+    except ValueError:
+        return 0
+
+    apply_discussion_count_delta(model, pk, delta)
+    return delta
+
+
+def get_discussion_count_subquery(model):
+    """
+    Discussion count of each `model` row as maintained by RhCommentModel:
+    root comments that are not removed and replies whose parent is not
+    removed.
+    """
+    from researchhub_comment.models import RhCommentModel
+
+    comments = (
+        RhCommentModel.all_objects.filter(
+            thread__content_type__app_label=model._meta.app_label,
+            thread__content_type__model=model._meta.model_name,
+            thread__object_id=OuterRef("pk"),
+        )
+        .filter(
+            Q(is_removed=False, parent__isnull=True)
+            | Q(parent__is_removed=False, parent__isnull=False)
+        )
+        .order_by()
+        .values("thread__object_id")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+    return Coalesce(Subquery(comments, output_field=IntegerField()), 0)
@@ -79,6 +79,12 @@ class RHCommentFilter(filters.FilterSet):
         model = RhCommentModel
         fields = ("ordering",)
 
+    def __init__(self, *args, is_comment_tree=False, **kwargs):
+        # Set when filtering the flat set of replies loaded by
+        # RhCommentTreeLoader, which applies child_count per parent itself
+        self.is_comment_tree = is_comment_tree
+        super().__init__(*args, **kwargs)
+
     def _is_ascending(self):
         return self.data.get("ascending", ASCENDING_FALSE) == ASCENDING_TRUE
 
@@ -105,6 +111,8 @@ class RHCommentFilter(filters.FilterSet):
         # This checks whether we are filtering on the comment's children
         # because we don't want the related filters to be called
         # on the base comments, only children
+        if self.is_comment_tree:
+            return True
         instance_class_name = self.queryset.__class__.__name__
         if instance_class_name == "RelatedManager":
             return True
@@ -165,7 +173,7 @@ class RHCommentFilter(filters.FilterSet):
         return qs
 
     def filter_child_count(self, qs, name, value):
-        if not self._is_on_child_queryset():
+        if not self._is_on_child_queryset() or self.is_comment_tree:
             return qs
         offset = int(self.data.get("child_offset", 0))
         count = offset + value
@@ -1,50 +1,42 @@
-from threading import Thread
-
 from django.core.management.base import BaseCommand
-from django.db.models import Q
+from django.db.models import F, Max, Min
 
-from researchhub_document.models import ResearchhubUnifiedDocument
+from hypothesis.models import Hypothesis
+from paper.models import Paper
+from researchhub_comment.discussion_count import get_discussion_count_subquery
+from researchhub_document.models import ResearchhubPost
 
 
 class Command(BaseCommand):
-    def _update_discussion_count(self, start, end):
-        docs = ResearchhubUnifiedDocument.objects.filter(id__gte=start, id__lt=end)
-        doc_count = docs.count()
-        for i, doc in enumerate(docs.iterator()):
-            print(f"STARTING ID: {start} -- {i}/{doc_count}")
-            try:
-                item = doc.get_document()
-                if hasattr(item, "rh_threads"):
-                    count = item.rh_threads.filter(
-                        (
-                            Q(rh_comments__is_removed=False)
-                            & Q(rh_comments__parent__isnull=True)
-                        )
-                        | (
-                            Q(rh_comments__parent__is_removed=False)
-                            & Q(rh_comments__parent__isnull=False)
-                        )
-                    ).count()
-                    item.discussion_count = count
-                    item.save(update_fields=["discussion_count"])
-            except Exception as e:
-                print(e)
+    """
+    Recomputes discussion_count of every document from its rh_threads,
+    one grouped UPDATE per id range, writing only rows that drifted.
+    """
 
-    def handle(self, *args, **options):
-        CHUNK_SIZE = 10000
-        documents = ResearchhubUnifiedDocument.objects.all()
-        start = documents.first().id
-        end = documents.last().id
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10000,
+            help="Range of document ids updated per statement",
+        )
 
-        py_threads = []
-        for i in range(start, end + CHUNK_SIZE, CHUNK_SIZE):
-            t = Thread(
-                target=self._update_discussion_count,
-                args=(i, i + CHUNK_SIZE),
+    def _update_discussion_counts(self, model, batch_size):
+        bounds = model.objects.aggregate(min_id=Min("id"), max_id=Max("id"))
+        if bounds["min_id"] is None:
+            return 0
+
+        updated = 0
+        for start in range(bounds["min_id"], bounds["max_id"] + 1, batch_size):
+            updated += (
+                model.objects.filter(id__gte=start, id__lt=start + batch_size)
+                .alias(new_discussion_count=get_discussion_count_subquery(model))
+                .exclude(discussion_count=F("new_discussion_count"))
+                .update(discussion_count=get_discussion_count_subquery(model))
             )
-            t.daemon = True
-            t.start()
-            py_threads.append(t)
+        return updated
 
-        for t in py_threads:
-            t.join()
+    def handle(self, *args, **options):
+        for model in (Paper, ResearchhubPost, Hypothesis):
+            updated = self._update_discussion_counts(model, options["batch_size"])
+            print(f"{model.__name__}: updated {updated} discussion counts")
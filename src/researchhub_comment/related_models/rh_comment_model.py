@@ -20,12 +20,16 @@ from researchhub_comment.constants.rh_comment_content_types import (
 from researchhub_comment.constants.rh_comment_migration_legacy_types import (
     RH_COMMENT_MIGRATION_LEGACY_TYPES,
 )
+from researchhub_comment.discussion_count import update_discussion_count
 from researchhub_comment.related_models.rh_comment_thread_model import (
     RhCommentThreadModel,
 )
 from researchhub_comment.tasks import celery_create_comment_content_src
 from utils.models import DefaultAuthenticatedModel, SoftDeletableModel
 
+# Documents whose rh_threads count towards DocumentFilter.discussed_*
+DISCUSSED_FILTER_MODEL_NAMES = ("paper", "researchhubpost", "hypothesis")
+
 
 class RhCommentModel(
     AbstractGenericReactionModel, SoftDeletableModel, DefaultAuthenticatedModel
@@ -143,8 +147,17 @@ class RhCommentModel(
     def _update_related_discussion_count(self, amount):
         related_document = self.unified_document.get_document()
         if hasattr(related_document, "discussion_count"):
-            related_document.discussion_count += amount
-            related_document.save()
+            update_discussion_count(related_document, amount)
+
+    def get_discussed_document_filter(self):
+        """
+        Returns the DocumentFilter whose discussed_* counters include this
+        comment, or None if comments on this thread are not counted.
+        """
+        thread = self.thread
+        if thread.content_type.model not in DISCUSSED_FILTER_MODEL_NAMES:
+            return None
+        return thread.content_object.unified_document.document_filter
 
     def increment_discussion_count(self):
         self._update_related_discussion_count(1)
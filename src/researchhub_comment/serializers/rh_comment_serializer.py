@@ -82,6 +82,8 @@ class DynamicRhCommentSerializer(
         return serializer.data
 
     def get_children_count(self, comment):
+        if hasattr(comment, "_tree_children_count"):
+            return comment._tree_children_count
         return comment.children.count()
 
     def get_children(self, comment):
@@ -110,9 +112,12 @@ class DynamicRhCommentSerializer(
         if depth_context[relative_depth_key] >= max_depth:
             return []
 
+        # Loaded up front by RhCommentTreeLoader
+        if hasattr(comment, "_tree_children"):
+            qs = comment._tree_children
         # Passing comment.children as a related manager for filtering purposes
         # See filter class for more details
-        if view:
+        elif view:
             qs = view.filter_queryset(comment.children)
         else:
             qs = comment.children.filter(**_filter_fields)
@@ -65,3 +65,11 @@ def celery_create_mention_notification(comment_id, recipients):
                 context,
                 html_template="general_email_message.html",
             )
+
+
+@app.task()
+def flush_discussion_count_delta(app_label, model_name, pk):
+    from researchhub_comment.discussion_count import flush_buffered_discussion_count
+
+    model = apps.get_model(app_label, model_name)
+    flush_buffered_discussion_count(model, pk)
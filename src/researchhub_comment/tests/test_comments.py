@@ -1,7 +1,9 @@
 import time
 
+from django.core.management import call_command
 from rest_framework.test import APITestCase
 
+from paper.models import Paper
 from paper.tests.helpers import create_paper
 from reputation.distributions import Distribution as Dist
 from reputation.distributor import Distributor
@@ -198,3 +200,61 @@ class CommentViewTests(APITestCase):
 
         self.assertEqual(notification_res.status_code, 200)
         self.assertEqual(notification_res.data["count"], 1)
+
+    def test_list_loads_comment_tree(self):
+        root = self._create_paper_comment(self.paper.id, self.user_1)
+        reply_1 = self._create_paper_comment(
+            self.paper.id, self.user_2, parent_id=root.data["id"]
+        )
+        reply_2 = self._create_paper_comment(
+            self.paper.id, self.user_3, parent_id=root.data["id"]
+        )
+        nested_reply = self._create_paper_comment(
+            self.paper.id, self.user_3, parent_id=reply_1.data["id"]
+        )
+        self._create_paper_comment(
+            self.paper.id, self.user_4, parent_id=nested_reply.data["id"]
+        )
+
+        res = self.client.get(
+            f"/api/paper/{self.paper.id}/comments/?ordering=CREATED_DATE&ascending=TRUE"
+        )
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.data["count"], 1)
+
+        root_data = res.data["results"][0]
+        self.assertEqual(root_data["children_count"], 2)
+        self.assertEqual(
+            [child["id"] for child in root_data["children"]],
+            [reply_1.data["id"], reply_2.data["id"]],
+        )
+
+        reply_data = root_data["children"][0]
+        self.assertEqual(reply_data["children_count"], 1)
+        nested_data = reply_data["children"][0]
+        self.assertEqual(nested_data["id"], nested_reply.data["id"])
+        # Past the max depth replies are counted but not serialized
+        self.assertEqual(nested_data["children_count"], 1)
+        self.assertEqual(nested_data["children"], [])
+
+        limited_res = self.client.get(
+            f"/api/paper/{self.paper.id}/comments/?ordering=CREATED_DATE&ascending=TRUE&child_count=1"
+        )
+        limited_root = limited_res.data["results"][0]
+        self.assertEqual(limited_root["children_count"], 2)
+        self.assertEqual(len(limited_root["children"]), 1)
+
+    def test_update_discussion_counts_reconciles_drift(self):
+        root = self._create_paper_comment(self.paper.id, self.user_1)
+        self._create_paper_comment(
+            self.paper.id, self.user_2, parent_id=root.data["id"]
+        )
+        self._create_paper_comment(self.paper.id, self.user_3)
+        self.paper.refresh_from_db()
+        self.assertEqual(self.paper.discussion_count, 3)
+
+        Paper.objects.filter(id=self.paper.id).update(discussion_count=10)
+        call_command("update_discussion_counts")
+
+        self.paper.refresh_from_db()
+        self.assertEqual(self.paper.discussion_count, 3)
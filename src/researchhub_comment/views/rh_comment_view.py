@@ -27,6 +27,10 @@ from reputation.views.bounty_view import (
 from researchhub.pagination import FasterDjangoPaginator
 from researchhub.permissions import IsObjectOwner, IsObjectOwnerOrModerator
 from researchhub.settings import TESTING
+from researchhub_comment.comment_tree import (
+    DEFAULT_COMMENT_TREE_MAX_DEPTH,
+    RhCommentTreeLoader,
+)
 from researchhub_comment.constants.rh_comment_thread_types import GENERIC_COMMENT
 from researchhub_comment.filters import RHCommentFilter
 from researchhub_comment.models import RhCommentModel
@@ -46,7 +50,6 @@ from researchhub_document.related_models.constants.document_type import (
     FILTER_HAS_BOUNTY,
     SORT_BOUNTY_EXPIRATION_DATE,
     SORT_BOUNTY_TOTAL_AMOUNT,
-    SORT_DISCUSSED,
 )
 from researchhub_document.related_models.constants.filters import (
     DISCUSSED,
@@ -82,6 +85,18 @@ def censor_comment(comment):
     comment_count = len(RhCommentModel.objects.raw(query, [comment.id]))
     comment._update_related_discussion_count(-comment_count)
 
+    # Root comments stop counting towards discussed_* once removed,
+    # and replies stop counting once their parent is removed
+    document_filter = comment.get_discussed_document_filter()
+    if document_filter is not None:
+        if comment.is_root_comment:
+            document_filter.increment_discussed(comment.created_date, -1)
+        reply_dates = RhCommentModel.all_objects.filter(parent=comment).values_list(
+            "created_date", flat=True
+        )
+        for reply_date in reply_dates:
+            document_filter.increment_discussed(reply_date, -1)
+
 
 class CommentPagination(PageNumberPagination):
     django_paginator_class = FasterDjangoPaginator
@@ -266,7 +281,9 @@ class RhCommentViewSet(ReactionViewActionMixin, ModelViewSet):
                 countdown=10,
             )
 
-            unified_document.update_filter(SORT_DISCUSSED)
+            document_filter = rh_comment.get_discussed_document_filter()
+            if document_filter is not None:
+                document_filter.increment_discussed(rh_comment.created_date)
             hubs = list(unified_document.hubs.all().values_list("id", flat=True))
             doc_type = get_doc_type_key(unified_document)
             reset_unified_document_cache(
@@ -333,7 +350,6 @@ class RhCommentViewSet(ReactionViewActionMixin, ModelViewSet):
                 item_object_id,
             )
             unified_document = bounty.unified_document
-            unified_document.update_filter(SORT_DISCUSSED)
             create_contribution.apply_async(
                 (
                     Contribution.BOUNTY_CREATED,
@@ -389,8 +405,7 @@ class RhCommentViewSet(ReactionViewActionMixin, ModelViewSet):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset().filter(parent__isnull=True))
+    def _get_list_queryset(self, queryset):
         queryset = queryset.select_related(
             "created_by",
             "created_by__author_profile",
@@ -399,7 +414,6 @@ class RhCommentViewSet(ReactionViewActionMixin, ModelViewSet):
         queryset = queryset.prefetch_related(
             # "created_by__permissions",
             # "bounties__parent__created_by__permissions",
-            "children",
             "purchases",
             "bounties",
             "bounties__parent",
@@ -407,10 +421,38 @@ class RhCommentViewSet(ReactionViewActionMixin, ModelViewSet):
             "bounties__created_by__author_profile",
             "bounty_solution",
         )
+        return queryset
+
+    def _filter_comment_tree_children(self, queryset):
+        filterset = self.filter_class(
+            self.request.query_params,
+            queryset=queryset,
+            request=self.request,
+            is_comment_tree=True,
+        )
+        return filterset.qs
+
+    def _load_comment_tree(self, roots, context):
+        query_params = self.request.query_params
+        child_count = query_params.get("child_count", None)
+        loader = RhCommentTreeLoader(
+            max_depth=context.get(
+                "rhc_dcs_get_children_max_depth", DEFAULT_COMMENT_TREE_MAX_DEPTH
+            ),
+            filter_children=self._filter_comment_tree_children,
+            child_count=int(child_count) if child_count is not None else None,
+            child_offset=int(query_params.get("child_offset", 0)),
+        )
+        return loader.load(roots, self._get_list_queryset(self.get_queryset()))
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset().filter(parent__isnull=True))
+        queryset = self._get_list_queryset(queryset)
 
         page = self.paginate_queryset(queryset)
         context = self._get_retrieve_context()
         if page is not None:
+            page = self._load_comment_tree(page, context)
             serializer = self.get_serializer(
                 page,
                 many=True,
@@ -0,0 +1,392 @@
+from collections import defaultdict
+from datetime import datetime
+
+import pytz
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count, Max, Q, Sum
+
+from discussion.models import Thread
+from discussion.reaction_models import Vote
+from hypothesis.models import Hypothesis
+from paper.models import Paper
+from reputation.models import Bounty
+from researchhub_case.models import AuthorClaimCase
+from researchhub_comment.models import RhCommentModel
+from researchhub_document.feed_index import refresh_feed_entries_for_filters
+from researchhub_document.models import (
+    DocumentFilter,
+    ResearchhubPost,
+    ResearchhubUnifiedDocument,
+)
+from researchhub_document.related_models.constants.document_type import (
+    FILTER_ALL,
+    FILTER_ANSWERED,
+    FILTER_AUTHOR_CLAIMED,
+    FILTER_BOUNTY_CLOSED,
+    FILTER_BOUNTY_EXPIRED,
+    FILTER_BOUNTY_OPEN,
+    FILTER_EXCLUDED_FROM_FEED,
+    FILTER_HAS_BOUNTY,
+    FILTER_INCLUDED_IN_FEED,
+    FILTER_OPEN_ACCESS,
+    FILTER_PEER_REVIEWED,
+    HYPOTHESIS,
+    NOTE,
+    PAPER,
+    SORT_BOUNTY_EXPIRATION_DATE,
+    SORT_BOUNTY_TOTAL_AMOUNT,
+    SORT_DISCUSSED,
+    SORT_UPVOTED,
+)
+from researchhub_document.related_models.document_filter_model import (
+    get_filter_window_start_dates,
+)
+from review.models import Review
+
+BOUNTY_UPDATE_TYPES = (
+    FILTER_BOUNTY_CLOSED,
+    FILTER_BOUNTY_EXPIRED,
+    FILTER_BOUNTY_OPEN,
+    FILTER_HAS_BOUNTY,
+    SORT_BOUNTY_EXPIRATION_DATE,
+    SORT_BOUNTY_TOTAL_AMOUNT,
+)
+
+
+class DocumentFilterBulkUpdater:
+    """
+    Set-based equivalent of DocumentFilter.update_filter.
+
+    Computes the filter and sort fields for a batch of unified documents
+    with a handful of grouped aggregations (one per source table) instead
+    of ~20 queries per document, and writes them back with bulk_update.
+    """
+
+    BULK_UPDATE_BATCH_SIZE = 1000
+
+    def __init__(self, update_types=(FILTER_ALL,), now=None):
+        self.update_types = set(update_types)
+        self.now = now or datetime.now(pytz.UTC)
+        self.all_start_date = get_filter_window_start_dates(self.now)["all"]
+
+    def _should_update(self, *update_types):
+        if FILTER_ALL in self.update_types:
+            return True
+        return any(update_type in self.update_types for update_type in update_types)
+
+    def update(self, unified_document_ids):
+        """
+        Recomputes filters for the given unified document ids.
+        Returns the number of DocumentFilter rows written.
+        """
+        unified_documents = list(
+            ResearchhubUnifiedDocument.all_objects.filter(
+                id__in=unified_document_ids, document_filter__isnull=False
+            )
+            .exclude(document_type=NOTE)
+            .select_related("document_filter")
+        )
+        if not unified_documents:
+            return 0
+
+        doc_ids = [doc.id for doc in unified_documents]
+        targets = self._get_document_targets(doc_ids)
+
+        discussed = {}
+        if self._should_update(SORT_DISCUSSED):
+            discussed = self._get_discussed_aggregates(targets)
+
+        upvoted = {}
+        if self._should_update(SORT_UPVOTED):
+            upvoted = self._get_upvoted_aggregates(targets)
+
+        bounties = {}
+        expiration_dates = {}
+        if self._should_update(*BOUNTY_UPDATE_TYPES):
+            bounties, expiration_dates = self._get_bounty_aggregates(doc_ids)
+
+        reviewed_doc_ids = set()
+        if self._should_update(FILTER_PEER_REVIEWED):
+            reviewed_doc_ids = set(
+                Review.objects.filter(unified_document_id__in=doc_ids)
+                .values_list("unified_document_id", flat=True)
+                .distinct()
+            )
+
+        claimed_paper_ids = set()
+        if self._should_update(FILTER_AUTHOR_CLAIMED):
+            claimed_paper_ids = set(
+                AuthorClaimCase.objects.filter(
+                    target_paper_id__in=targets["paper_ids"].values(),
+                    status="APPROVED",
+                )
+                .values_list("target_paper_id", flat=True)
+                .distinct()
+            )
+
+        answered_post_ids = set()
+        if self._should_update(FILTER_ANSWERED):
+            answered_post_ids = set(
+                Thread.objects.filter(
+                    post_id__in=targets["post_ids"].values(), is_accepted_answer=True
+                )
+                .values_list("post_id", flat=True)
+                .distinct()
+            )
+
+        fields = set()
+        document_filters = []
+        for doc in unified_documents:
+            document_filter = doc.document_filter
+            document_type = doc.document_type
+            target_key = targets["doc_targets"].get(doc.id)
+
+            if document_type == PAPER:
+                paper_id = targets["paper_ids"].get(doc.id)
+                if self._should_update(FILTER_AUTHOR_CLAIMED):
+                    document_filter.author_claimed = paper_id in claimed_paper_ids
+                    fields.add("author_claimed")
+                if self._should_update(FILTER_OPEN_ACCESS):
+                    oa_status = targets["oa_statuses"].get(doc.id)
+                    document_filter.open_access = bool(
+                        oa_status and oa_status != "closed"
+                    )
+                    fields.add("open_access")
+                if self._should_update(FILTER_PEER_REVIEWED):
+                    document_filter.peer_reviewed = doc.id in reviewed_doc_ids
+                    fields.add("peer_reviewed")
+            elif document_type != HYPOTHESIS:
+                if self._should_update(FILTER_ANSWERED):
+                    post_id = targets["post_ids"].get(doc.id)
+                    document_filter.answered = post_id in answered_post_ids
+                    fields.add("answered")
+                if self._should_update(FILTER_PEER_REVIEWED):
+                    document_filter.peer_reviewed = doc.id in reviewed_doc_ids
+                    fields.add("peer_reviewed")
+
+            if self._should_update(*BOUNTY_UPDATE_TYPES):
+                fields.update(
+                    self._apply_bounty_fields(
+                        document_filter,
+                        bounties.get(doc.id, {}),
+                        expiration_dates.get(doc.id),
+                    )
+                )
+
+            # The rolling discussed/upvoted windows are owned by the activity
+            # buckets, only the all-time counts and dates are rescanned
+            if self._should_update(SORT_DISCUSSED):
+                counts = discussed.get(target_key, {})
+                document_filter.discussed_all = counts.get("discussed_all", 0)
+                fields.add("discussed_all")
+                document_filter.discussed_date = (
+                    counts.get("latest_date") or doc.created_date
+                )
+                fields.add("discussed_date")
+
+            if self._should_update(SORT_UPVOTED):
+                counts = upvoted.get(target_key, {})
+                document_filter.upvoted_all = counts.get("upvoted_all", 0)
+                fields.add("upvoted_all")
+                if counts.get("latest_date"):
+                    document_filter.upvoted_date = counts["latest_date"]
+                    fields.add("upvoted_date")
+
+            if FILTER_INCLUDED_IN_FEED in self.update_types:
+                document_filter.is_excluded = False
+                fields.add("is_excluded")
+            elif FILTER_EXCLUDED_FROM_FEED in self.update_types:
+                document_filter.is_excluded = True
+                fields.add("is_excluded")
+
+            document_filters.append(document_filter)
+
+        if not fields:
+            return 0
+
+        fields.add("updated_date")
+        for document_filter in document_filters:
+            document_filter.updated_date = self.now
+
+        DocumentFilter.objects.bulk_update(
+            document_filters, list(fields), batch_size=self.BULK_UPDATE_BATCH_SIZE
+        )
+        # bulk_update skips post_save
+        refresh_feed_entries_for_filters(
+            [document_filter.id for document_filter in document_filters]
+        )
+        return len(document_filters)
+
+    def _get_document_targets(self, doc_ids):
+        """
+        Maps every unified document to the (content_type_id, object_id) of
+        its concrete document, which is what threads and votes point at.
+        """
+        paper_content_type = ContentType.objects.get_for_model(Paper)
+        post_content_type = ContentType.objects.get_for_model(ResearchhubPost)
+        hypothesis_content_type = ContentType.objects.get_for_model(Hypothesis)
+
+        doc_targets = {}
+        paper_ids = {}
+        post_ids = {}
+        oa_statuses = {}
+
+        papers = Paper.objects.filter(unified_document_id__in=doc_ids).values_list(
+            "id", "unified_document_id", "oa_status"
+        )
+        for paper_id, doc_id, oa_status in papers:
+            doc_targets[doc_id] = (paper_content_type.id, paper_id)
+            paper_ids[doc_id] = paper_id
+            oa_statuses[doc_id] = oa_status
+
+        # Mirrors unified_document.posts.first()
+        posts = (
+            ResearchhubPost.objects.filter(unified_document_id__in=doc_ids)
+            .order_by("id")
+            .values_list("id", "unified_document_id")
+        )
+        for post_id, doc_id in posts:
+            if doc_id not in post_ids:
+                doc_targets[doc_id] = (post_content_type.id, post_id)
+                post_ids[doc_id] = post_id
+
+        hypotheses = Hypothesis.objects.filter(
+            unified_document_id__in=doc_ids
+        ).values_list("id", "unified_document_id")
+        for hypothesis_id, doc_id in hypotheses:
+            doc_targets[doc_id] = (hypothesis_content_type.id, hypothesis_id)
+
+        return {
+            "doc_targets": doc_targets,
+            "paper_ids": paper_ids,
+            "post_ids": post_ids,
+            "oa_statuses": oa_statuses,
+        }
+
+    def _get_target_filter(self, targets, content_type_field, object_id_field):
+        object_ids_by_content_type = defaultdict(list)
+        for content_type_id, object_id in targets["doc_targets"].values():
+            object_ids_by_content_type[content_type_id].append(object_id)
+
+        target_filter = Q()
+        for content_type_id, object_ids in object_ids_by_content_type.items():
+            target_filter |= Q(
+                **{
+                    content_type_field: content_type_id,
+                    f"{object_id_field}__in": object_ids,
+                }
+            )
+        return target_filter
+
+    def _get_all_time_filter(self):
+        return Q(created_date__gte=self.all_start_date, created_date__lt=self.now)
+
+    def _get_discussed_aggregates(self, targets):
+        if not targets["doc_targets"]:
+            return {}
+
+        is_visible = (Q(is_removed=False) & Q(parent__isnull=True)) | (
+            Q(parent__is_removed=False) & Q(parent__isnull=False)
+        )
+        rows = (
+            RhCommentModel.all_objects.filter(
+                self._get_target_filter(
+                    targets, "thread__content_type_id", "thread__object_id"
+                )
+            )
+            .values("thread__content_type_id", "thread__object_id")
+            .annotate(
+                latest_date=Max("created_date"),
+                discussed_all=Count(
+                    "id", filter=is_visible & self._get_all_time_filter()
+                ),
+            )
+            .order_by()
+        )
+
+        results = defaultdict(lambda: defaultdict(int))
+        for row in rows:
+            # A document may have several threads, so fold them together
+            key = (row["thread__content_type_id"], row["thread__object_id"])
+            result = results[key]
+            result["discussed_all"] += row["discussed_all"]
+            latest_date = result.get("latest_date")
+            if latest_date is None or row["latest_date"] > latest_date:
+                result["latest_date"] = row["latest_date"]
+        return results
+
+    def _get_upvoted_aggregates(self, targets):
+        if not targets["doc_targets"]:
+            return {}
+
+        all_time_filter = self._get_all_time_filter()
+        rows = (
+            Vote.objects.filter(
+                self._get_target_filter(targets, "content_type_id", "object_id")
+            )
+            .values("content_type_id", "object_id")
+            .annotate(
+                latest_date=Max("created_date"),
+                upvoted_all=Count(
+                    "id", filter=all_time_filter & Q(vote_type=Vote.UPVOTE)
+                )
+                - Count("id", filter=all_time_filter & Q(vote_type=Vote.DOWNVOTE)),
+            )
+            .order_by()
+        )
+        return {(row["content_type_id"], row["object_id"]): row for row in rows}
+
+    def _get_bounty_aggregates(self, doc_ids):
+        rows = (
+            Bounty.objects.filter(unified_document_id__in=doc_ids)
+            .values("unified_document_id")
+            .annotate(
+                bounty_count=Count("id"),
+                open_count=Count("id", filter=Q(status=Bounty.OPEN)),
+                closed_count=Count("id", filter=Q(status=Bounty.CLOSED)),
+                expired_count=Count("id", filter=Q(status=Bounty.EXPIRED)),
+                open_amount=Sum("amount", filter=Q(status=Bounty.OPEN)),
+                # Mirrors related_bounties.filter(status=OPEN).last()
+                last_open_id=Max("id", filter=Q(status=Bounty.OPEN)),
+            )
+            .order_by()
+        )
+        bounties = {row["unified_document_id"]: row for row in rows}
+
+        last_open_ids = [
+            row["last_open_id"] for row in bounties.values() if row["last_open_id"]
+        ]
+        expiration_dates = dict(
+            Bounty.objects.filter(id__in=last_open_ids).values_list(
+                "unified_document_id", "expiration_date"
+            )
+        )
+        return bounties, expiration_dates
+
+    def _apply_bounty_fields(self, document_filter, bounty_row, expiration_date):
+        fields = []
+        if self._should_update(FILTER_BOUNTY_OPEN):
+            document_filter.bounty_open = bounty_row.get("open_count", 0) > 0
+            fields.append("bounty_open")
+        if self._should_update(FILTER_BOUNTY_CLOSED):
+            document_filter.bounty_closed = bounty_row.get("closed_count", 0) > 0
+            fields.append("bounty_closed")
+        if self._should_update(FILTER_BOUNTY_EXPIRED):
+            document_filter.bounty_expired = bounty_row.get("expired_count", 0) > 0
+            fields.append("bounty_expired")
+        if self._should_update(FILTER_HAS_BOUNTY):
+            document_filter.has_bounty = bounty_row.get("bounty_count", 0) > 0
+            fields.append("has_bounty")
+        if self._should_update(SORT_BOUNTY_EXPIRATION_DATE):
+            document_filter.bounty_expiration_date = expiration_date
+            fields.append("bounty_expiration_date")
+        if self._should_update(SORT_BOUNTY_TOTAL_AMOUNT):
+            document_filter.bounty_total_amount = bounty_row.get("open_amount") or 0
+            fields.append("bounty_total_amount")
+        return fields
+
+
+def bulk_update_document_filters(unified_document_ids, update_types=(FILTER_ALL,)):
+    return DocumentFilterBulkUpdater(update_types=update_types).update(
+        unified_document_ids
+    )
@@ -0,0 +1,287 @@
+import base64
+import json
+from collections import defaultdict
+from decimal import Decimal
+
+from dateutil import parser
+from django.db import transaction
+from django.db.models import Q
+
+from researchhub_document.filters import (
+    TAG_CHOICES_STR,
+    TIME_SCOPE_CHOICES,
+    map_tag_to_document_filter,
+)
+from researchhub_document.models import FeedEntry, ResearchhubUnifiedDocument
+from researchhub_document.related_models.constants.document_type import (
+    BOUNTY,
+    DISCUSSION,
+    ELN,
+    HYPOTHESIS,
+    NOTE,
+    PAPER,
+    POSTS,
+    QUESTION,
+)
+from researchhub_document.related_models.constants.filters import (
+    DISCUSSED,
+    EXPIRING_SOON,
+    HOT,
+    MOST_RSC,
+    NEW,
+    UPVOTED,
+)
+from researchhub_document.related_models.feed_entry_model import (
+    FEED_ENTRY_ALL_HUBS,
+    FEED_ENTRY_VALUE_FIELDS,
+)
+from researchhub_document.utils import get_date_ranges_by_time_scope
+
+FEED_INDEX_REFRESH_BATCH_SIZE = 1000
+
+FEED_ENTRY_DATE_FIELDS = (
+    "created_date",
+    "bounty_expiration_date",
+    "discussed_date",
+    "upvoted_date",
+)
+
+
+def _get_entry_values(unified_document):
+    values = {
+        "document_type": unified_document.document_type,
+        "created_date": unified_document.created_date,
+        "hot_score_v2": unified_document.hot_score_v2,
+    }
+    document_filter = unified_document.document_filter
+    for field in FEED_ENTRY_VALUE_FIELDS:
+        if field in values:
+            continue
+        if document_filter is None:
+            values[field] = FeedEntry._meta.get_field(field).get_default()
+        else:
+            values[field] = getattr(document_filter, field)
+    return values
+
+
+def _refresh_feed_entries(unified_document_ids):
+    documents = (
+        ResearchhubUnifiedDocument.all_objects.filter(id__in=unified_document_ids)
+        .exclude(is_removed=True)
+        .exclude(document_type=NOTE)
+        .select_related("document_filter")
+    )
+    hub_ids = defaultdict(list)
+    Through = ResearchhubUnifiedDocument.hubs.through
+    for doc_id, hub_id in Through.objects.filter(
+        researchhubunifieddocument_id__in=unified_document_ids
+    ).values_list("researchhubunifieddocument_id", "hub_id"):
+        hub_ids[doc_id].append(hub_id)
+
+    expected = {}
+    for document in documents:
+        values = _get_entry_values(document)
+        for hub_id in [FEED_ENTRY_ALL_HUBS] + hub_ids[document.id]:
+            expected[(document.id, hub_id)] = values
+
+    existing = {
+        (entry.unified_document_id, entry.hub_id): entry
+        for entry in FeedEntry.objects.filter(
+            unified_document_id__in=unified_document_ids
+        )
+    }
+
+    created = []
+    updated = []
+    for (doc_id, hub_id), values in expected.items():
+        entry = existing.pop((doc_id, hub_id), None)
+        if entry is None:
+            created.append(
+                FeedEntry(unified_document_id=doc_id, hub_id=hub_id, **values)
+            )
+        elif any(getattr(entry, field) != value for field, value in values.items()):
+            for field, value in values.items():
+                setattr(entry, field, value)
+            updated.append(entry)
+
+    with transaction.atomic():
+        # Entries left over belong to removed documents or dropped hubs
+        if existing:
+            FeedEntry.objects.filter(
+                id__in=[entry.id for entry in existing.values()]
+            ).delete()
+        # A concurrent refresh may have created the same entry already
+        FeedEntry.objects.bulk_create(created, ignore_conflicts=True)
+        FeedEntry.objects.bulk_update(updated, FEED_ENTRY_VALUE_FIELDS)
+    return len(created) + len(updated) + len(existing)
+
+
+def refresh_feed_entries(unified_document_ids):
+    """
+    Brings the feed entries of the given unified documents in line with
+    the documents, their hubs and their DocumentFilter. Only rows that
+    differ are written. Returns the number of rows written or deleted.
+    """
+    unified_document_ids = list(set(unified_document_ids))
+    written = 0
+    for i in range(0, len(unified_document_ids), FEED_INDEX_REFRESH_BATCH_SIZE):
+        written += _refresh_feed_entries(
+            unified_document_ids[i : i + FEED_INDEX_REFRESH_BATCH_SIZE]
+        )
+    return written
+
+
+def refresh_feed_entries_for_filters(document_filter_ids):
+    document_filter_ids = list(document_filter_ids)
+    written = 0
+    for i in range(0, len(document_filter_ids), FEED_INDEX_REFRESH_BATCH_SIZE):
+        written += refresh_feed_entries(
+            ResearchhubUnifiedDocument.all_objects.filter(
+                document_filter_id__in=document_filter_ids[
+                    i : i + FEED_INDEX_REFRESH_BATCH_SIZE
+                ]
+            ).values_list("id", flat=True)
+        )
+    return written
+
+
+def schedule_feed_entries_refresh(unified_document_ids):
+    unified_document_ids = list(unified_document_ids)
+    transaction.on_commit(lambda: refresh_feed_entries(unified_document_ids))
+
+
+def encode_feed_index_cursor(key):
+    value, doc_id = key
+    if hasattr(value, "isoformat"):
+        value = value.isoformat()
+    elif isinstance(value, Decimal):
+        value = str(value)
+    payload = json.dumps({"v": value, "id": doc_id})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+class FeedIndexQuery:
+    """
+    Reads unified document feeds from FeedEntry with keyset pagination.
+    Filters mirror UnifiedDocumentFilter; every page seeks past the
+    (sort value, unified document id) key of the previous one instead of
+    using an offset.
+    """
+
+    def __init__(
+        self,
+        page_size,
+        hub_id=FEED_ENTRY_ALL_HUBS,
+        document_type="all",
+        ordering=HOT,
+        time_scope="today",
+        tags=None,
+        ignore_excluded=False,
+    ):
+        self.hub_id = hub_id
+        self.document_type = document_type.upper()
+        self.ordering = ordering
+        self.time_scope = time_scope if time_scope in TIME_SCOPE_CHOICES else "today"
+        self.tags = tags.split(",") if tags else []
+        self.ignore_excluded = ignore_excluded
+        self.page_size = page_size
+        self.sort_field, self.descending = self._get_sort()
+
+    def _get_sort(self):
+        if self.ordering == NEW:
+            return "created_date", True
+        elif self.ordering == DISCUSSED:
+            return f"discussed_{self.time_scope}", True
+        elif self.ordering == UPVOTED:
+            return f"upvoted_{self.time_scope}", True
+        elif self.ordering == EXPIRING_SOON:
+            return "bounty_expiration_date", False
+        elif self.ordering == MOST_RSC:
+            return "bounty_total_amount", True
+        return "hot_score_v2", True
+
+    def decode_cursor(self, cursor):
+        """Returns the sort key encoded in a cursor, or None if it is invalid."""
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            value = payload["v"]
+            if self.sort_field in FEED_ENTRY_DATE_FIELDS:
+                value = parser.isoparse(value)
+            elif self.sort_field == "bounty_total_amount":
+                value = Decimal(value)
+            else:
+                value = int(value)
+            return (value, int(payload["id"]))
+        except (ValueError, TypeError, KeyError, AttributeError, ArithmeticError):
+            return None
+
+    def _filter_document_type(self, qs):
+        if self.document_type == PAPER:
+            return qs.filter(document_type=PAPER)
+        elif self.document_type == POSTS:
+            return qs.filter(document_type__in=[DISCUSSION, ELN])
+        elif self.document_type == QUESTION:
+            return qs.filter(document_type=QUESTION)
+        elif self.document_type == HYPOTHESIS:
+            return qs.filter(document_type=HYPOTHESIS)
+        elif self.document_type == BOUNTY:
+            return qs.filter(has_bounty=True)
+        return qs
+
+    def _filter_ordering(self, qs):
+        start_date, end_date = get_date_ranges_by_time_scope(self.time_scope)
+        if self.ordering == NEW:
+            qs = qs.filter(created_date__range=(start_date, end_date))
+        elif self.ordering == DISCUSSED and self.time_scope != "all":
+            qs = qs.filter(
+                discussed_date__range=(start_date, end_date),
+                **{f"{self.sort_field}__gt": 0},
+            )
+        elif self.ordering == UPVOTED and self.time_scope != "all":
+            qs = qs.filter(upvoted_date__range=(start_date, end_date))
+        elif self.ordering in (EXPIRING_SOON, MOST_RSC):
+            # Keyset pagination needs a total order, documents without a
+            # bounty have no key for these orderings
+            qs = qs.filter(**{f"{self.sort_field}__isnull": False})
+        return qs
+
+    def _filter_after(self, qs, after_key):
+        value, doc_id = after_key
+        lookup = "lt" if self.descending else "gt"
+        return qs.filter(
+            Q(**{f"{self.sort_field}__{lookup}": value})
+            | Q(**{self.sort_field: value, f"unified_document_id__{lookup}": doc_id})
+        )
+
+    def get_queryset(self, after_key=None):
+        qs = FeedEntry.objects.filter(hub_id=self.hub_id)
+        qs = self._filter_document_type(qs)
+        for tag in self.tags:
+            if tag in TAG_CHOICES_STR:
+                key, value = map_tag_to_document_filter(tag)
+                qs = qs.filter(**{key: value})
+        if self.ignore_excluded:
+            qs = qs.filter(is_excluded=False)
+        qs = self._filter_ordering(qs)
+        if after_key is not None:
+            qs = self._filter_after(qs, after_key)
+
+        prefix = "-" if self.descending else ""
+        return qs.order_by(f"{prefix}{self.sort_field}", f"{prefix}unified_document_id")
+
+    def get_page(self, after_key=None):
+        """
+        Returns (unified document ids, key of the last entry) for the page
+        following `after_key`. The key is None when there is no next page.
+        """
+        rows = list(
+            self.get_queryset(after_key).values_list(
+                "unified_document_id", self.sort_field
+            )[: self.page_size]
+        )
+        ids = [doc_id for doc_id, _ in rows]
+        last_key = None
+        if len(rows) == self.page_size:
+            doc_id, value = rows[-1]
+            last_key = (value, doc_id)
+        return ids, last_key
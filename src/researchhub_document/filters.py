@@ -62,6 +62,18 @@ ORDER_CHOICES = (
 TIME_SCOPE_CHOICES = ("today", "week", "month", "year", "all")
 
 
+def map_tag_to_document_filter(value):
+    if value == "closed":
+        return "bounty_closed", True
+    elif value == "expired":
+        return "bounty_expired", True
+    elif value == "open":
+        return "bounty_open", True
+    elif value == "unanswered":
+        return "answered", False
+    return value, True
+
+
 class UnifiedDocumentFilter(filters.FilterSet):
     hub_id = filters.ModelChoiceFilter(
         field_name="hubs",
@@ -94,15 +106,7 @@ class UnifiedDocumentFilter(filters.FilterSet):
         fields = ["hub_id", "ordering", "subscribed_hubs", "type", "ignore_excluded"]
 
     def _map_tag_to_document_filter(self, value):
-        if value == "closed":
-            return "bounty_closed", True
-        elif value == "expired":
-            return "bounty_expired", True
-        elif value == "open":
-            return "bounty_open", True
-        elif value == "unanswered":
-            return "answered", False
-        return value, True
+        return map_tag_to_document_filter(value)
 
     def document_type_filter(self, qs, name, value):
         value = value.upper()
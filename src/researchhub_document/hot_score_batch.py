@@ -0,0 +1,390 @@
+import datetime
+from collections import defaultdict
+
+import numpy as np
+import pytz
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count, IntegerField, Q, Sum
+from django.db.models.functions import Cast
+
+from discussion.models import Comment, Reply, Thread, Vote
+from hypothesis.models import Hypothesis
+from paper.models import Paper
+from purchase.models import Purchase
+from reputation.related_models.bounty import Bounty
+from researchhub_document.feed_index import refresh_feed_entries
+from researchhub_document.models import ResearchhubPost, ResearchhubUnifiedDocument
+from researchhub_document.related_models.constants.document_type import PAPER
+
+HOT_SCORE_EPOCH = datetime.datetime(2020, 1, 1, tzinfo=pytz.UTC)
+# Keep in sync with HotScoreMixin._get_time_score
+HOT_SCORE_TIME_DIVISOR = 43000
+# Keep in sync with HotScoreMixin._calc_bounty_score
+BOUNTY_PROMO_PERIOD_SECONDS = 259200
+MIN_REQ_DISCUSSIONS = 1
+
+
+def _log(values, base):
+    return np.log(values) / np.log(base)
+
+
+class HotScoreBatchCalculator:
+    """
+    Vectorized equivalent of HotScoreMixin.calculate_hot_score_v2.
+
+    Pulls the scoring inputs for many unified documents with a few grouped
+    queries, computes the scores with NumPy and writes hot_score_v2 back
+    with bulk_update.
+    """
+
+    BULK_UPDATE_BATCH_SIZE = 1000
+
+    def __init__(self, now=None):
+        self.now = now or datetime.datetime.now(pytz.UTC)
+        self.paper_content_type = ContentType.objects.get_for_model(Paper)
+        self.post_content_type = ContentType.objects.get_for_model(ResearchhubPost)
+        self.hypothesis_content_type = ContentType.objects.get_for_model(Hypothesis)
+
+    def update(self, unified_document_ids):
+        """
+        Recalculates and saves hot_score_v2 for the given unified documents.
+        Returns the number of documents whose score changed.
+        """
+        unified_documents = list(
+            ResearchhubUnifiedDocument.all_objects.filter(
+                id__in=unified_document_ids
+            ).only("id", "document_type", "created_date", "hot_score_v2")
+        )
+        scores = self.calculate(unified_documents)
+
+        changed = []
+        for unified_document in unified_documents:
+            score = scores.get(unified_document.id)
+            if score is None:
+                continue
+            score = int(score)
+            if unified_document.hot_score_v2 != score:
+                unified_document.hot_score_v2 = score
+                changed.append(unified_document)
+
+        ResearchhubUnifiedDocument.all_objects.bulk_update(
+            changed, ["hot_score_v2"], batch_size=self.BULK_UPDATE_BATCH_SIZE
+        )
+        # bulk_update skips post_save
+        refresh_feed_entries([unified_document.id for unified_document in changed])
+        return len(changed)
+
+    def calculate(self, unified_documents):
+        """Returns a {unified_document_id: hot_score_v2} dict."""
+        inputs = self._get_document_inputs([doc.id for doc in unified_documents])
+        docs = [doc for doc in unified_documents if doc.id in inputs["targets"]]
+        if not docs:
+            return {}
+
+        doc_ids = [doc.id for doc in docs]
+        doc_index = {doc_id: i for i, doc_id in enumerate(doc_ids)}
+        targets = [inputs["targets"][doc_id] for doc_id in doc_ids]
+
+        doc_votes = self._get_vote_scores(targets)
+        comment_votes = self._get_comment_vote_totals(
+            inputs["thread_filters"], inputs["target_to_doc"]
+        )
+        boosts = self._get_boost_amounts(targets)
+
+        doc_vote_net_score = np.array(
+            [doc_votes.get(target, 0) for target in targets], dtype=float
+        )
+        total_comment_vote_score = np.array(
+            [comment_votes.get(doc_id, 0) for doc_id in doc_ids], dtype=float
+        )
+        boost = np.array([boosts.get(target, 0) for target in targets], dtype=float)
+        discussion_count = np.array(
+            [inputs["discussion_counts"][doc_id] for doc_id in doc_ids], dtype=float
+        )
+        twitter_score = np.array(
+            [
+                inputs["twitter_scores"].get(doc_id, 0)
+                if doc.document_type == PAPER
+                else 0
+                for doc_id, doc in zip(doc_ids, docs)
+            ],
+            dtype=float,
+        )
+        created_timestamps = np.array(
+            [doc.created_date.timestamp() for doc in docs], dtype=float
+        )
+        bounty_score = self._get_bounty_scores(doc_ids, doc_index)
+
+        hot_scores = self.score(
+            doc_vote_net_score=doc_vote_net_score,
+            total_comment_vote_score=total_comment_vote_score,
+            discussion_count=discussion_count,
+            boost=boost,
+            bounty_score=bounty_score,
+            twitter_score=twitter_score,
+            created_timestamps=created_timestamps,
+        )
+        return dict(zip(doc_ids, hot_scores.tolist()))
+
+    @staticmethod
+    def score(
+        doc_vote_net_score,
+        total_comment_vote_score,
+        discussion_count,
+        boost,
+        bounty_score,
+        twitter_score,
+        created_timestamps,
+    ):
+        """Scoring kernel. Every argument is a float array of equal length."""
+        social_media_score = _log(twitter_score + 1, 5)
+        time_score = (
+            created_timestamps - HOT_SCORE_EPOCH.timestamp()
+        ) / HOT_SCORE_TIME_DIVISOR
+        time_score_with_magnitude = (
+            np.sign(doc_vote_net_score + social_media_score) * time_score
+        )
+        doc_vote_score = np.log2(np.abs(doc_vote_net_score) + 1)
+        discussion_vote_score = np.log2(discussion_count + 1) + _log(
+            np.maximum(0, total_comment_vote_score) + 1, 3
+        )
+        boost_score = np.log10(boost + 1)
+
+        # See HotScoreMixin.calculate_hot_score_v2 for the penalty rationale
+        discussion_vote_score = np.where(
+            discussion_count == MIN_REQ_DISCUSSIONS,
+            discussion_vote_score - 2,
+            discussion_vote_score,
+        )
+        time_score_with_magnitude = np.where(
+            (discussion_count < MIN_REQ_DISCUSSIONS) & (time_score_with_magnitude >= 0),
+            -time_score_with_magnitude,
+            time_score_with_magnitude,
+        )
+
+        agg_score = discussion_vote_score + doc_vote_score + boost_score + bounty_score
+        return (agg_score + time_score_with_magnitude) * 1000
+
+    def _get_document_inputs(self, doc_ids):
+        targets = {}
+        discussion_counts = {}
+        twitter_scores = {}
+        thread_filters = []
+
+        papers = Paper.objects.filter(unified_document_id__in=doc_ids).values_list(
+            "id", "unified_document_id", "discussion_count", "twitter_score"
+        )
+        paper_ids = []
+        for paper_id, doc_id, count, twitter_score in papers:
+            targets[doc_id] = (self.paper_content_type.id, paper_id)
+            discussion_counts[doc_id] = count
+            twitter_scores[doc_id] = twitter_score
+            paper_ids.append(paper_id)
+        if paper_ids:
+            thread_filters.append(("paper_id", paper_ids))
+
+        # Mirrors unified_document.posts.first()
+        posts = (
+            ResearchhubPost.objects.filter(unified_document_id__in=doc_ids)
+            .order_by("id")
+            .values_list("id", "unified_document_id", "discussion_count")
+        )
+        post_ids = []
+        for post_id, doc_id, count in posts:
+            if doc_id in targets:
+                continue
+            targets[doc_id] = (self.post_content_type.id, post_id)
+            discussion_counts[doc_id] = count
+            post_ids.append(post_id)
+        if post_ids:
+            thread_filters.append(("post_id", post_ids))
+
+        hypotheses = Hypothesis.objects.filter(
+            unified_document_id__in=doc_ids
+        ).values_list("id", "unified_document_id", "discussion_count")
+        hypothesis_ids = []
+        for hypothesis_id, doc_id, count in hypotheses:
+            targets[doc_id] = (self.hypothesis_content_type.id, hypothesis_id)
+            discussion_counts[doc_id] = count
+            hypothesis_ids.append(hypothesis_id)
+        if hypothesis_ids:
+            thread_filters.append(("hypothesis_id", hypothesis_ids))
+
+        target_to_doc = {target: doc_id for doc_id, target in targets.items()}
+        return {
+            "targets": targets,
+            "target_to_doc": target_to_doc,
+            "discussion_counts": discussion_counts,
+            "twitter_scores": twitter_scores,
+            "thread_filters": thread_filters,
+        }
+
+    def _get_generic_filter(self, targets, content_type_field, object_id_field):
+        object_ids_by_content_type = defaultdict(list)
+        for content_type_id, object_id in targets:
+            object_ids_by_content_type[content_type_id].append(object_id)
+
+        generic_filter = Q()
+        for content_type_id, object_ids in object_ids_by_content_type.items():
+            generic_filter |= Q(
+                **{
+                    content_type_field: content_type_id,
+                    f"{object_id_field}__in": object_ids,
+                }
+            )
+        return generic_filter
+
+    def _get_vote_scores(self, targets):
+        """
+        Net score per (content_type_id, object_id), matching
+        AbstractGenericReactionModel.calculate_score.
+        """
+        if not targets:
+            return {}
+
+        rows = (
+            Vote.objects.filter(
+                self._get_generic_filter(targets, "content_type_id", "object_id"),
+                created_by__is_suspended=False,
+                created_by__probable_spammer=False,
+            )
+            .values("content_type_id", "object_id")
+            .annotate(
+                score=Count("id", filter=Q(vote_type=Vote.UPVOTE))
+                - Count("id", filter=Q(vote_type=Vote.DOWNVOTE))
+            )
+            .order_by()
+        )
+        return {
+            (row["content_type_id"], row["object_id"]): row["score"] for row in rows
+        }
+
+    def _get_comment_vote_totals(self, thread_filters, target_to_doc):
+        """
+        Sum of the positive scores of every thread, comment and reply on a
+        document, matching HotScoreMixin._count_doc_comment_votes.
+        """
+        if not thread_filters:
+            return {}
+
+        document_fields = {
+            "paper_id": self.paper_content_type.id,
+            "post_id": self.post_content_type.id,
+            "hypothesis_id": self.hypothesis_content_type.id,
+        }
+        thread_filter = Q()
+        for field, ids in thread_filters:
+            thread_filter |= Q(**{f"{field}__in": ids})
+
+        thread_docs = {}
+        threads = Thread.objects.filter(thread_filter, is_removed=False).values_list(
+            "id", "paper_id", "post_id", "hypothesis_id"
+        )
+        for thread_id, paper_id, post_id, hypothesis_id in threads:
+            for field, object_id in (
+                ("paper_id", paper_id),
+                ("post_id", post_id),
+                ("hypothesis_id", hypothesis_id),
+            ):
+                doc_id = target_to_doc.get((document_fields[field], object_id))
+                if object_id is not None and doc_id is not None:
+                    thread_docs[thread_id] = doc_id
+                    break
+
+        comment_docs = {}
+        comments = Comment.objects.filter(
+            parent_id__in=thread_docs.keys(), is_removed=False
+        ).values_list("id", "parent_id")
+        for comment_id, thread_id in comments:
+            comment_docs[comment_id] = thread_docs[thread_id]
+
+        comment_content_type = ContentType.objects.get_for_model(Comment)
+        reply_docs = {}
+        replies = Reply.objects.filter(
+            content_type=comment_content_type,
+            object_id__in=comment_docs.keys(),
+            is_removed=False,
+        ).values_list("id", "object_id")
+        for reply_id, comment_id in replies:
+            reply_docs[reply_id] = comment_docs[comment_id]
+
+        item_docs = {}
+        for model, docs_by_id in (
+            (Thread, thread_docs),
+            (Comment, comment_docs),
+            (Reply, reply_docs),
+        ):
+            content_type_id = ContentType.objects.get_for_model(model).id
+            for item_id, doc_id in docs_by_id.items():
+                item_docs[(content_type_id, item_id)] = doc_id
+
+        totals = defaultdict(int)
+        for item, score in self._get_vote_scores(list(item_docs.keys())).items():
+            totals[item_docs[item]] += max(0, score)
+        return totals
+
+    def _get_boost_amounts(self, targets):
+        rows = (
+            Purchase.objects.filter(
+                self._get_generic_filter(targets, "content_type_id", "object_id"),
+                paid_status=Purchase.PAID,
+                amount__gt=0,
+                boost_time__gt=0,
+            )
+            .annotate(amount_as_int=Cast("amount", IntegerField()))
+            .values("content_type_id", "object_id")
+            .annotate(boost=Sum("amount_as_int"))
+            .order_by()
+        )
+        return {
+            (row["content_type_id"], row["object_id"]): row["boost"] or 0
+            for row in rows
+        }
+
+    def _get_bounty_scores(self, doc_ids, doc_index):
+        bounty_score = np.zeros(len(doc_ids), dtype=float)
+        bounties = list(
+            Bounty.objects.filter(
+                unified_document_id__in=doc_ids,
+                status=Bounty.OPEN,
+                expiration_date__isnull=False,
+            ).values_list(
+                "unified_document_id", "created_date", "expiration_date", "amount"
+            )
+        )
+        if not bounties:
+            return bounty_score
+
+        now = self.now.timestamp()
+        indices = np.array([doc_index[row[0]] for row in bounties])
+        created = np.array([row[1].timestamp() for row in bounties], dtype=float)
+        expiration = np.array([row[2].timestamp() for row in bounties], dtype=float)
+        amount = np.array([float(row[3]) for row in bounties], dtype=float)
+
+        promo_period = BOUNTY_PROMO_PERIOD_SECONDS
+        seconds_since_create = now - created
+        seconds_to_expiration = expiration - now
+        is_near_new = (0 < seconds_since_create) & (seconds_since_create < promo_period)
+        is_near_expire = (0 < seconds_to_expiration) & (
+            seconds_to_expiration < promo_period
+        )
+        percentage_within_promo_period = np.where(
+            is_near_new,
+            (promo_period - seconds_since_create) / promo_period * 100,
+            np.where(
+                is_near_expire,
+                (promo_period - seconds_to_expiration) / promo_period * 100,
+                0,
+            ),
+        )
+        scores = np.where(
+            is_near_new | is_near_expire,
+            _log(amount + 1, 100) + _log(percentage_within_promo_period + 1, 7),
+            0,
+        )
+        np.add.at(bounty_score, indices, scores)
+        return bounty_score
+
+
+def recalculate_hot_scores(unified_document_ids):
+    return HotScoreBatchCalculator().update(unified_document_ids)
@@ -0,0 +1,114 @@
+from collections import defaultdict
+from datetime import datetime
+
+import pytz
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Q
+from django.db.models.functions import TruncHour
+
+from discussion.reaction_models import Vote
+from researchhub_comment.models import RhCommentModel
+from researchhub_comment.related_models.rh_comment_model import (
+    DISCUSSED_FILTER_MODEL_NAMES,
+)
+from researchhub_document.models import (
+    DocumentFilterActivityBucket,
+    ResearchhubUnifiedDocument,
+)
+from researchhub_document.related_models.document_filter_model import (
+    get_filter_window_start_dates,
+    set_activity_compacted_until,
+)
+
+
+class Command(BaseCommand):
+    """
+    Seeds DocumentFilterActivityBucket from the last year of comments and
+    votes. Only needed once; afterwards buckets are maintained on write.
+    """
+
+    def handle(self, *args, **options):
+        now = datetime.now(pytz.UTC)
+        year_start = get_filter_window_start_dates(now)["year"]
+        filter_ids = self._get_document_filter_ids()
+
+        buckets = defaultdict(lambda: {"discussed": 0, "upvoted": 0})
+
+        is_visible = (Q(is_removed=False) & Q(parent__isnull=True)) | (
+            Q(parent__is_removed=False) & Q(parent__isnull=False)
+        )
+        comment_rows = (
+            RhCommentModel.all_objects.filter(
+                is_visible,
+                created_date__gte=year_start,
+                thread__content_type__model__in=DISCUSSED_FILTER_MODEL_NAMES,
+            )
+            .annotate(bucket_start=TruncHour("created_date"))
+            .values("thread__content_type__model", "thread__object_id", "bucket_start")
+            .annotate(amount=Count("id"))
+            .order_by()
+        )
+        for row in comment_rows.iterator():
+            key = (row["thread__content_type__model"], row["thread__object_id"])
+            filter_id = filter_ids.get(key)
+            if filter_id:
+                buckets[(filter_id, row["bucket_start"])]["discussed"] += row["amount"]
+        print("Comment buckets loaded")
+
+        vote_rows = (
+            Vote.objects.filter(
+                created_date__gte=year_start,
+                content_type__model__in=DISCUSSED_FILTER_MODEL_NAMES,
+            )
+            .annotate(bucket_start=TruncHour("created_date"))
+            .values("content_type__model", "object_id", "bucket_start")
+            .annotate(
+                amount=Count("id", filter=Q(vote_type=Vote.UPVOTE))
+                - Count("id", filter=Q(vote_type=Vote.DOWNVOTE))
+            )
+            .order_by()
+        )
+        for row in vote_rows.iterator():
+            key = (row["content_type__model"], row["object_id"])
+            filter_id = filter_ids.get(key)
+            if filter_id:
+                buckets[(filter_id, row["bucket_start"])]["upvoted"] += row["amount"]
+        print("Vote buckets loaded")
+
+        with transaction.atomic():
+            DocumentFilterActivityBucket.objects.all().delete()
+            DocumentFilterActivityBucket.objects.bulk_create(
+                [
+                    DocumentFilterActivityBucket(
+                        document_filter_id=filter_id,
+                        bucket_start=bucket_start,
+                        discussed=counts["discussed"],
+                        upvoted=counts["upvoted"],
+                    )
+                    for (filter_id, bucket_start), counts in buckets.items()
+                ],
+                batch_size=5000,
+            )
+            DocumentFilterActivityBucket.rebuild_windows(now)
+            set_activity_compacted_until(now)
+
+        print(f"COMPLETED - {len(buckets)} buckets")
+
+    def _get_document_filter_ids(self):
+        filter_ids = {}
+        docs = ResearchhubUnifiedDocument.all_objects.filter(
+            document_filter__isnull=False
+        ).values_list("document_filter_id", "paper__id", "hypothesis__id")
+        for filter_id, paper_id, hypothesis_id in docs.iterator():
+            if paper_id:
+                filter_ids[("paper", paper_id)] = filter_id
+            if hypothesis_id:
+                filter_ids[("hypothesis", hypothesis_id)] = filter_id
+
+        posts = ResearchhubUnifiedDocument.all_objects.filter(
+            document_filter__isnull=False, posts__isnull=False
+        ).values_list("document_filter_id", "posts__id")
+        for filter_id, post_id in posts.iterator():
+            filter_ids[("researchhubpost", post_id)] = filter_id
+        return filter_ids
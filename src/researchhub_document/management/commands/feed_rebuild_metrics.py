@@ -0,0 +1,10 @@
+from researchhub_document.utils import (
+    get_feed_rebuild_metrics,
+    reset_feed_rebuild_metrics,
+)
+from utils.management import MetricsCommand
+
+
+class Command(MetricsCommand):
+    get_metrics = staticmethod(get_feed_rebuild_metrics)
+    reset_metrics = staticmethod(reset_feed_rebuild_metrics)
@@ -0,0 +1,10 @@
+from researchhub_document.utils import (
+    get_hot_score_recalc_metrics,
+    reset_hot_score_recalc_metrics,
+)
+from utils.management import MetricsCommand
+
+
+class Command(MetricsCommand):
+    get_metrics = staticmethod(get_hot_score_recalc_metrics)
+    reset_metrics = staticmethod(reset_hot_score_recalc_metrics)
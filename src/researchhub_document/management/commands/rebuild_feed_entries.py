@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+
+from researchhub_document.feed_index import (
+    FEED_INDEX_REFRESH_BATCH_SIZE,
+    refresh_feed_entries,
+)
+from researchhub_document.models import ResearchhubUnifiedDocument
+
+
+class Command(BaseCommand):
+    """
+    Builds or repairs FeedEntry rows for every unified document. Afterwards
+    entries are maintained on write.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=FEED_INDEX_REFRESH_BATCH_SIZE,
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        ids = ResearchhubUnifiedDocument.all_objects.order_by("id").values_list(
+            "id", flat=True
+        )
+
+        written = 0
+        last_id = 0
+        while True:
+            batch = list(ids.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                break
+            written += refresh_feed_entries(batch)
+            last_id = batch[-1]
+            print(f"Refreshed up to unified document {last_id}")
+
+        print(f"COMPLETED - {written} feed entries written")
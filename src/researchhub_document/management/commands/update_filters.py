@@ -1,39 +1,46 @@
-from threading import Thread
-
 from django.core.management.base import BaseCommand
-from django.db import connection
 
-from researchhub_document.models import DocumentFilter
+from researchhub_document.document_filter_bulk import DocumentFilterBulkUpdater
+from researchhub_document.models import ResearchhubUnifiedDocument
+from researchhub_document.related_models.constants.document_type import FILTER_ALL, NOTE
 
 
 class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of unified documents recomputed per batch",
+        )
+        parser.add_argument(
+            "--update-type",
+            action="append",
+            dest="update_types",
+            help="Filter type to recompute (may be repeated). Defaults to all",
+        )
+
     def handle(self, *args, **options):
-        def update_filters(start, end):
-            print(f"STARTING - {start} : {end}")
-            qs = DocumentFilter.objects.filter(id__gte=start, id__lt=end)
-            for i, obj in enumerate(qs.iterator()):
-                if i % 1000 == 0:
-                    print(f"Starting ID - {start} - {i}")
-
-                obj.update_filter()
-
-            print("COMPLETED")
-            connection.close()
-
-        def update():
-            CHUNK_SIZE = 25000
-            qs = DocumentFilter.objects.all().order_by("id")
-            start = qs.first().id
-            end = qs.last().id
-
-            threads = []
-            for i in range(start, end + CHUNK_SIZE, CHUNK_SIZE):
-                t = Thread(target=update_filters, args=(i, i + CHUNK_SIZE))
-                t.daemon = True
-                t.start()
-                threads.append(t)
-
-            for t in threads:
-                t.join()
-
-        update()
+        batch_size = options["batch_size"]
+        update_types = options["update_types"] or [FILTER_ALL]
+        updater = DocumentFilterBulkUpdater(update_types=update_types)
+
+        qs = (
+            ResearchhubUnifiedDocument.all_objects.filter(document_filter__isnull=False)
+            .exclude(document_type=NOTE)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
+        last_id = 0
+        total = 0
+        while True:
+            ids = list(qs.filter(id__gt=last_id)[:batch_size])
+            if not ids:
+                break
+
+            total += updater.update(ids)
+            last_id = ids[-1]
+            print(f"Updated {total} filters - last ID {last_id}")
+
+        print("COMPLETED")
@@ -0,0 +1,54 @@
+# Generated by Django 4.1 on 2023-04-20 18:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("researchhub_document", "0052_researchhubpost_score"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DocumentFilterActivityBucket",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_date", models.DateTimeField(auto_now_add=True)),
+                ("updated_date", models.DateTimeField(auto_now=True)),
+                ("bucket_start", models.DateTimeField()),
+                ("discussed", models.IntegerField(default=0)),
+                ("upvoted", models.IntegerField(default=0)),
+                (
+                    "document_filter",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="activity_buckets",
+                        to="researchhub_document.documentfilter",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="documentfilteractivitybucket",
+            index=models.Index(
+                fields=["bucket_start"], name="flt_activity_bucket_start_idx"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="documentfilteractivitybucket",
+            constraint=models.UniqueConstraint(
+                fields=("document_filter", "bucket_start"),
+                name="unique_document_filter_activity_bucket",
+            ),
+        ),
+    ]
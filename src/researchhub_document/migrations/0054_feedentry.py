@@ -0,0 +1,185 @@
+# Generated by Django 4.1 on 2026-10-18 04:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("researchhub_document", "0053_documentfilteractivitybucket"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FeedEntry",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("hub_id", models.PositiveIntegerField()),
+                ("document_type", models.CharField(max_length=32)),
+                ("is_excluded", models.BooleanField(default=False)),
+                ("answered", models.BooleanField(default=False)),
+                ("author_claimed", models.BooleanField(default=False)),
+                ("bounty_closed", models.BooleanField(default=False)),
+                ("bounty_expired", models.BooleanField(default=False)),
+                ("bounty_open", models.BooleanField(default=False)),
+                ("has_bounty", models.BooleanField(default=False)),
+                ("open_access", models.BooleanField(default=False)),
+                ("peer_reviewed", models.BooleanField(default=False)),
+                ("created_date", models.DateTimeField()),
+                ("hot_score_v2", models.IntegerField(default=0)),
+                ("bounty_expiration_date", models.DateTimeField(null=True)),
+                (
+                    "bounty_total_amount",
+                    models.DecimalField(decimal_places=10, max_digits=19, null=True),
+                ),
+                ("discussed_today", models.IntegerField(default=0)),
+                ("discussed_week", models.IntegerField(default=0)),
+                ("discussed_month", models.IntegerField(default=0)),
+                ("discussed_year", models.IntegerField(default=0)),
+                ("discussed_all", models.IntegerField(default=0)),
+                ("discussed_date", models.DateTimeField(null=True)),
+                ("upvoted_today", models.IntegerField(default=0)),
+                ("upvoted_week", models.IntegerField(default=0)),
+                ("upvoted_month", models.IntegerField(default=0)),
+                ("upvoted_year", models.IntegerField(default=0)),
+                ("upvoted_all", models.IntegerField(default=0)),
+                ("upvoted_date", models.DateTimeField(null=True)),
+                (
+                    "unified_document",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="feed_entries",
+                        to="researchhub_document.researchhubunifieddocument",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="feedentry",
+            constraint=models.UniqueConstraint(
+                fields=("unified_document", "hub_id"),
+                name="unique_feed_entry_document_hub",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feedentry",
+            index=models.Index(
+                fields=["hub_id", "-created_date", "-unified_document"],
+                include=("document_type", "is_excluded"),
+                name="feed_hub_created_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feedentry",
+            index=models.Index(
+                fields=["hub_id", "-hot_score_v2", "-unified_document"],
+                include=("document_type", "is_excluded"),
+                name="feed_hub_hot_score_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feedentry",
+            index=models.Index(
+                fields=["hub_id", "bounty_expiration_date", "unified_document"],
+                include=("document_type", "is_excluded"),
+                name="feed_hub_bounty_exp_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feedentry",
+            index=models.Index(
+                fields=["hub_id", "-bounty_total_amount", "-unified_document"],
+                include=("document_type", "is_excluded"),
+                name="feed_hub_bounty_amount_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feedentry",
+            index=models.Index(
+                fields=["hub_id", "-discussed_today", "-unified_document"],
+                include=("document_type", "is_excluded"),
+                name="feed_hub_disc_today_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feedentry",
+            index=models.Index(
+                fields=["hub_id", "-discussed_week", "-unified_document"],
+                include=("document_type", "is_excluded"),
+                name="feed_hub_disc_week_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feedentry",
+            index=models.Index(
+                fields=["hub_id", "-discussed_month", "-unified_document"],
+                include=("document_type", "is_excluded"),
+                name="feed_hub_disc_month_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feedentry",
+            index=models.Index(
+                fields=["hub_id", "-discussed_year", "-unified_document"],
+                include=("document_type", "is_excluded"),
+                name="feed_hub_disc_year_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feedentry",
+            index=models.Index(
+                fields=["hub_id", "-discussed_all", "-unified_document"],
+                include=("document_type", "is_excluded"),
+                name="feed_hub_disc_all_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feedentry",
+            index=models.Index(
+                fields=["hub_id", "-upvoted_today", "-unified_document"],
+                include=("document_type", "is_excluded"),
+                name="feed_hub_upv_today_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feedentry",
+            index=models.Index(
+                fields=["hub_id", "-upvoted_week", "-unified_document"],
+                include=("document_type", "is_excluded"),
+                name="feed_hub_upv_week_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feedentry",
+            index=models.Index(
+                fields=["hub_id", "-upvoted_month", "-unified_document"],
+                include=("document_type", "is_excluded"),
+                name="feed_hub_upv_month_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feedentry",
+            index=models.Index(
+                fields=["hub_id", "-upvoted_year", "-unified_document"],
+                include=("document_type", "is_excluded"),
+                name="feed_hub_upv_year_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feedentry",
+            index=models.Index(
+                fields=["hub_id", "-upvoted_all", "-unified_document"],
+                include=("document_type", "is_excluded"),
+                name="feed_hub_upv_all_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.1 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("researchhub_document", "0054_feedentry"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DocumentFilterActivityCursor",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("compacted_until", models.DateTimeField()),
+            ],
+        ),
+    ]
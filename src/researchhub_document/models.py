@@ -1,6 +1,11 @@
 # flake8: noqa
-from .related_models.document_filter_model import DocumentFilter
+from .related_models.document_filter_model import (
+    DocumentFilter,
+    DocumentFilterActivityBucket,
+    DocumentFilterActivityCursor,
+)
 from .related_models.featured_content_model import FeaturedContent
+from .related_models.feed_entry_model import FeedEntry
 from .related_models.researchhub_post_model import ResearchhubPost
 from .related_models.researchhub_unified_document_model import (
     ResearchhubUnifiedDocument,
@@ -1,9 +1,10 @@
 from datetime import datetime, timedelta
 
 import pytz
-from django.db import models
-from django.db.models import Count, DecimalField, Q, Sum
-from django.db.models.functions import Coalesce
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import Count, DecimalField, F, Q, Sum, Value
+from django.db.models.functions import Coalesce, Greatest
 
 from reputation.models import Bounty
 from researchhub_comment.models import RhCommentModel
@@ -30,6 +31,56 @@ from researchhub_document.related_models.constants.document_type import (
 from utils.models import DefaultModel
 from utils.sentry import log_error
 
+FILTER_TIME_WINDOWS = ("today", "week", "month", "year", "all")
+# Windows that activity buckets roll out of. "all" only ever accumulates.
+FILTER_ROLLING_TIME_WINDOWS = ("today", "week", "month", "year")
+FILTER_ACTIVITY_FIELDS = ("discussed", "upvoted")
+# Maintained by the activity buckets only, see DocumentFilterActivityBucket
+FILTER_ROLLING_WINDOW_FIELDS = tuple(
+    f"{field}_{window}"
+    for field in FILTER_ACTIVITY_FIELDS
+    for window in FILTER_ROLLING_TIME_WINDOWS
+)
+
+# Cache copy of DocumentFilterActivityCursor, read on every increment
+FILTER_ACTIVITY_COMPACTED_UNTIL_KEY = "document_filter_activity_compacted_until"
+
+
+def get_filter_window_start_dates(now):
+    # Same buffer as get_date_ranges_by_time_scope in researchhub_document/utils.py
+    hours_buffer = 10
+    return {
+        "today": now - timedelta(hours=(24 + hours_buffer)),
+        "week": now - timedelta(days=7),
+        "month": now - timedelta(days=30),
+        "year": now - timedelta(days=365),
+        "all": datetime(year=2018, month=12, day=31, hour=0, tzinfo=pytz.UTC),
+    }
+
+
+def get_activity_bucket_start(activity_date):
+    return activity_date.replace(minute=0, second=0, microsecond=0)
+
+
+def get_activity_compacted_until():
+    compacted_until = cache.get(FILTER_ACTIVITY_COMPACTED_UNTIL_KEY)
+    if compacted_until is None:
+        compacted_until = DocumentFilterActivityCursor.objects.values_list(
+            "compacted_until", flat=True
+        ).first()
+        if compacted_until is None:
+            return None
+        cache.set(FILTER_ACTIVITY_COMPACTED_UNTIL_KEY, compacted_until, timeout=None)
+    return compacted_until
+
+
+def set_activity_compacted_until(date):
+    DocumentFilterActivityCursor.objects.update_or_create(
+        id=DocumentFilterActivityCursor.CURSOR_ID,
+        defaults={"compacted_until": date},
+    )
+    cache.set(FILTER_ACTIVITY_COMPACTED_UNTIL_KEY, date, timeout=None)
+
 
 class DocumentFilter(DefaultModel):
     # Filter Fields
@@ -87,6 +138,42 @@ class DocumentFilter(DefaultModel):
         for update_type in update_types:
             self.update_filter(update_type)
 
+    def _increment_activity(self, field, activity_date, amount):
+        """
+        Applies a discussed/upvoted delta that happened at `activity_date`
+        to the hourly bucket and to every window column the bucket is
+        currently counted in, without rescanning comments or votes.
+        """
+        if not amount:
+            return
+
+        bucket_start = get_activity_bucket_start(activity_date)
+        window_reference = get_activity_compacted_until() or datetime.now(pytz.UTC)
+        window_start_dates = get_filter_window_start_dates(window_reference)
+
+        updates = {}
+        for window in FILTER_TIME_WINDOWS:
+            if window == "all" or bucket_start >= window_start_dates[window]:
+                window_field = f"{field}_{window}"
+                updates[window_field] = F(window_field) + amount
+        if amount > 0:
+            date_field = f"{field}_date"
+            updates[date_field] = Greatest(F(date_field), Value(activity_date))
+
+        DocumentFilter.objects.filter(id=self.id).update(**updates)
+        DocumentFilterActivityBucket.increment(self.id, field, bucket_start, amount)
+
+        from researchhub_document.feed_index import refresh_feed_entries_for_filters
+
+        # Queryset updates skip post_save
+        transaction.on_commit(lambda: refresh_feed_entries_for_filters([self.id]))
+
+    def increment_discussed(self, activity_date, amount=1):
+        self._increment_activity("discussed", activity_date, amount)
+
+    def increment_upvoted(self, activity_date, amount=1):
+        self._increment_activity("upvoted", activity_date, amount)
+
     def update_filter(self, update_type=FILTER_ALL):
         unified_document = self.unified_document
         document_type = unified_document.document_type
@@ -123,19 +210,13 @@ class DocumentFilter(DefaultModel):
         if update_type == SORT_BOUNTY_TOTAL_AMOUNT or update_type == FILTER_ALL:
             updates.append(self.update_bounty_total_amount)
 
+        # The rolling discussed/upvoted windows are owned by the activity
+        # buckets, rescanning them here would double count their roll-out
         if update_type == SORT_DISCUSSED or update_type == FILTER_ALL:
-            updates.append(self.update_discussed_today)
-            updates.append(self.update_discussed_week)
-            updates.append(self.update_discussed_month)
-            updates.append(self.update_discussed_year)
             updates.append(self.update_discussed_all)
             updates.append(self.update_discussed_date)
 
         if update_type == SORT_UPVOTED or update_type == FILTER_ALL:
-            updates.append(self.update_upvoted_today)
-            updates.append(self.update_upvoted_week)
-            updates.append(self.update_upvoted_month)
-            updates.append(self.update_upvoted_year)
             updates.append(self.update_upvoted_all)
             updates.append(self.update_upvoted_date)
 
@@ -150,7 +231,16 @@ class DocumentFilter(DefaultModel):
             except Exception as e:
                 log_error(e)
 
-        self.save()
+        # Rolling windows are incremented in the database, saving this
+        # instance's copy of them would drop concurrent increments
+        self.save(
+            update_fields=[
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in FILTER_ROLLING_WINDOW_FIELDS
+            ]
+        )
 
     def update_answered(self, unified_document, document):
         self.answered = document.threads.filter(is_accepted_answer=True).exists()
@@ -211,41 +301,24 @@ class DocumentFilter(DefaultModel):
         ).get("total", 0)
 
     def get_discussued(self, document, start_date, end_date):
+        # A single filter call keeps this to one join on rh_comments,
+        # otherwise each comment is counted once per comment in the thread
         threads = document.rh_threads
         qs = threads.filter(
-            rh_comments__created_date__gte=start_date,
-            rh_comments__created_date__lt=end_date,
-        ).filter(
-            (Q(rh_comments__is_removed=False) & Q(rh_comments__parent__isnull=True))
-            | (
-                Q(rh_comments__parent__is_removed=False)
-                & Q(rh_comments__parent__isnull=False)
+            Q(
+                rh_comments__created_date__gte=start_date,
+                rh_comments__created_date__lt=end_date,
+            )
+            & (
+                (Q(rh_comments__is_removed=False) & Q(rh_comments__parent__isnull=True))
+                | (
+                    Q(rh_comments__parent__is_removed=False)
+                    & Q(rh_comments__parent__isnull=False)
+                )
             )
         )
         return qs.count()
 
-    def update_discussed_today(self, unified_document, document):
-        # Same buffer as get_date_ranges_by_time_scope in researchhub_document/utils.py
-        hours_buffer = 10
-        now = datetime.now(pytz.UTC)
-        start_date = now - timedelta(hours=(24 + hours_buffer))
-        self.discussed_today = self.get_discussued(document, start_date, now)
-
-    def update_discussed_week(self, unified_document, document):
-        now = datetime.now(pytz.UTC)
-        start_date = now - timedelta(days=7)
-        self.discussed_week = self.get_discussued(document, start_date, now)
-
-    def update_discussed_month(self, unified_document, document):
-        now = datetime.now(pytz.UTC)
-        start_date = now - timedelta(days=30)
-        self.discussed_month = self.get_discussued(document, start_date, now)
-
-    def update_discussed_year(self, unified_document, document):
-        now = datetime.now(pytz.UTC)
-        start_date = now - timedelta(days=365)
-        self.discussed_year = self.get_discussued(document, start_date, now)
-
     def update_discussed_all(self, unified_document, document):
         now = datetime.now(pytz.UTC)
         start_date = datetime(year=2018, month=12, day=31, hour=0, tzinfo=pytz.UTC)
@@ -279,28 +352,6 @@ class DocumentFilter(DefaultModel):
         )
         return score
 
-    def update_upvoted_today(self, unified_document, document):
-        # Same buffer as get_date_ranges_by_time_scope in researchhub_document/utils.py
-        hours_buffer = 10
-        now = datetime.now(pytz.UTC)
-        start_date = now - timedelta(hours=(24 + hours_buffer))
-        self.upvoted_today = self.get_upvotes(document, start_date, now)
-
-    def update_upvoted_week(self, unified_document, document):
-        now = datetime.now(pytz.UTC)
-        start_date = now - timedelta(days=7)
-        self.upvoted_week = self.get_upvotes(document, start_date, now)
-
-    def update_upvoted_month(self, unified_document, document):
-        now = datetime.now(pytz.UTC)
-        start_date = now - timedelta(days=30)
-        self.upvoted_month = self.get_upvotes(document, start_date, now)
-
-    def update_upvoted_year(self, unified_document, document):
-        now = datetime.now(pytz.UTC)
-        start_date = now - timedelta(days=365)
-        self.upvoted_year = self.get_upvotes(document, start_date, now)
-
     def update_upvoted_all(self, unified_document, document):
         now = datetime.now(pytz.UTC)
         start_date = datetime(year=2018, month=12, day=31, hour=0, tzinfo=pytz.UTC)
@@ -314,3 +365,159 @@ class DocumentFilter(DefaultModel):
         )
         if latest_vote_date:
             self.upvoted_date = latest_vote_date
+
+
+class DocumentFilterActivityCursor(models.Model):
+    """
+    Single row holding the compaction cursor: window columns hold the sum
+    of the buckets whose start is at or after (cursor - window length).
+    Kept in the database so losing the cache cannot compact twice.
+    """
+
+    CURSOR_ID = 1
+
+    compacted_until = models.DateTimeField()
+
+
+class DocumentFilterActivityBucket(DefaultModel):
+    """
+    Hourly discussed/upvoted deltas per document. DocumentFilter window
+    columns are kept as running sums of these buckets; compaction rolls
+    buckets out of each window as time passes.
+    """
+
+    document_filter = models.ForeignKey(
+        DocumentFilter,
+        on_delete=models.CASCADE,
+        related_name="activity_buckets",
+    )
+    bucket_start = models.DateTimeField()
+    discussed = models.IntegerField(default=0)
+    upvoted = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["document_filter", "bucket_start"],
+                name="unique_document_filter_activity_bucket",
+            )
+        ]
+        indexes = (
+            models.Index(
+                fields=("bucket_start",),
+                name="flt_activity_bucket_start_idx",
+            ),
+        )
+
+    @classmethod
+    def increment(cls, document_filter_id, field, bucket_start, amount):
+        bucket, _ = cls.objects.get_or_create(
+            document_filter_id=document_filter_id, bucket_start=bucket_start
+        )
+        cls.objects.filter(id=bucket.id).update(**{field: F(field) + amount})
+
+    @classmethod
+    def compact(cls, now=None):
+        """
+        Rolls buckets that aged out of a window since the last compaction
+        out of the matching DocumentFilter columns, then drops buckets older
+        than the longest window. If there is no previous cursor the window
+        columns are rebuilt from the buckets instead.
+        """
+        now = now or datetime.now(pytz.UTC)
+        with transaction.atomic():
+            # Locking the cursor keeps concurrent runs from rolling the same
+            # buckets out twice
+            compacted_until = (
+                DocumentFilterActivityCursor.objects.select_for_update()
+                .values_list("compacted_until", flat=True)
+                .first()
+            )
+            if compacted_until is None or compacted_until > now:
+                cls.rebuild_windows(now)
+            else:
+                cls._roll_out_expired(compacted_until, now)
+
+            set_activity_compacted_until(now)
+            year_start = get_filter_window_start_dates(now)["year"]
+            cls.objects.filter(bucket_start__lt=year_start).delete()
+
+    @classmethod
+    def _roll_out_expired(cls, compacted_until, now):
+        from researchhub_document.feed_index import refresh_feed_entries_for_filters
+
+        compacted_filter_ids = set()
+        previous_start_dates = get_filter_window_start_dates(compacted_until)
+        current_start_dates = get_filter_window_start_dates(now)
+        for window in FILTER_ROLLING_TIME_WINDOWS:
+            expired = (
+                cls.objects.filter(
+                    bucket_start__gte=previous_start_dates[window],
+                    bucket_start__lt=current_start_dates[window],
+                )
+                .values("document_filter_id")
+                .annotate(discussed_sum=Sum("discussed"), upvoted_sum=Sum("upvoted"))
+                .order_by()
+            )
+            for row in expired.iterator():
+                updates = {}
+                for field in FILTER_ACTIVITY_FIELDS:
+                    amount = row[f"{field}_sum"]
+                    if amount:
+                        window_field = f"{field}_{window}"
+                        updates[window_field] = F(window_field) - amount
+                if updates:
+                    DocumentFilter.objects.filter(id=row["document_filter_id"]).update(
+                        **updates
+                    )
+                    compacted_filter_ids.add(row["document_filter_id"])
+        refresh_feed_entries_for_filters(compacted_filter_ids)
+
+    @classmethod
+    def rebuild_windows(cls, now):
+        window_start_dates = get_filter_window_start_dates(now)
+        annotations = {}
+        for field in FILTER_ACTIVITY_FIELDS:
+            for window in FILTER_ROLLING_TIME_WINDOWS:
+                annotations[f"{field}_{window}"] = Coalesce(
+                    Sum(
+                        field,
+                        filter=Q(bucket_start__gte=window_start_dates[window]),
+                    ),
+                    0,
+                )
+
+        window_fields = list(annotations.keys())
+        rows = (
+            cls.objects.values("document_filter_id").annotate(**annotations).order_by()
+        )
+        document_filters = []
+        for row in rows.iterator():
+            document_filter = DocumentFilter(id=row["document_filter_id"])
+            for window_field in window_fields:
+                setattr(document_filter, window_field, row[window_field])
+            document_filters.append(document_filter)
+
+        DocumentFilter.objects.bulk_update(
+            document_filters, window_fields, batch_size=1000
+        )
+
+        # Filters whose buckets all aged out have no row above but may still
+        # hold counts in their rolling windows
+        has_window_counts = Q()
+        for window_field in window_fields:
+            has_window_counts |= ~Q(**{window_field: 0})
+        stale_filters = DocumentFilter.objects.filter(has_window_counts).exclude(
+            id__in=cls.objects.values("document_filter_id")
+        )
+        stale_filter_ids = list(stale_filters.values_list("id", flat=True))
+        DocumentFilter.objects.filter(id__in=stale_filter_ids).update(
+            **{window_field: 0 for window_field in window_fields}
+        )
+
+        from researchhub_document.feed_index import refresh_feed_entries_for_filters
+
+        refresh_feed_entries_for_filters(
+            [document_filter.id for document_filter in document_filters]
+            + stale_filter_ids
+        )
@@ -0,0 +1,124 @@
+from django.db import models
+
+from researchhub_document.related_models.document_filter_model import (
+    FILTER_ACTIVITY_FIELDS,
+    FILTER_TIME_WINDOWS,
+)
+
+# hub_id of the entries backing the feed across all hubs
+FEED_ENTRY_ALL_HUBS = 0
+
+FEED_ENTRY_TAG_FIELDS = (
+    "answered",
+    "author_claimed",
+    "bounty_closed",
+    "bounty_expired",
+    "bounty_open",
+    "has_bounty",
+    "open_access",
+    "peer_reviewed",
+)
+FEED_ENTRY_ACTIVITY_FIELDS = tuple(
+    f"{field}_{window}"
+    for field in FILTER_ACTIVITY_FIELDS
+    for window in FILTER_TIME_WINDOWS
+)
+FEED_ENTRY_SORT_FIELDS = (
+    "created_date",
+    "hot_score_v2",
+    "bounty_expiration_date",
+    "bounty_total_amount",
+) + FEED_ENTRY_ACTIVITY_FIELDS
+FEED_ENTRY_VALUE_FIELDS = (
+    ("document_type", "is_excluded", "discussed_date", "upvoted_date")
+    + FEED_ENTRY_TAG_FIELDS
+    + FEED_ENTRY_SORT_FIELDS
+)
+# Columns every ordering index carries so type and exclusion filters are
+# answered from the index
+FEED_ENTRY_INDEX_INCLUDE = ("document_type", "is_excluded")
+
+
+def _get_ordering_index(field, name, descending=True):
+    prefix = "-" if descending else ""
+    return models.Index(
+        fields=("hub_id", f"{prefix}{field}", f"{prefix}unified_document"),
+        include=FEED_ENTRY_INDEX_INCLUDE,
+        name=name,
+    )
+
+
+class FeedEntry(models.Model):
+    """
+    Denormalized feed row, one per visible unified document and hub plus
+    one with hub_id FEED_ENTRY_ALL_HUBS. Carries every filter and sort
+    column of the feed so a page is a range scan of one ordering index.
+    Rows are kept in sync by researchhub_document.feed_index.
+    """
+
+    unified_document = models.ForeignKey(
+        "researchhub_document.ResearchhubUnifiedDocument",
+        on_delete=models.CASCADE,
+        related_name="feed_entries",
+    )
+    hub_id = models.PositiveIntegerField()
+    document_type = models.CharField(max_length=32)
+    is_excluded = models.BooleanField(default=False)
+
+    # Filter Fields
+    answered = models.BooleanField(default=False)
+    author_claimed = models.BooleanField(default=False)
+    bounty_closed = models.BooleanField(default=False)
+    bounty_expired = models.BooleanField(default=False)
+    bounty_open = models.BooleanField(default=False)
+    has_bounty = models.BooleanField(default=False)
+    open_access = models.BooleanField(default=False)
+    peer_reviewed = models.BooleanField(default=False)
+
+    # Sorting Fields
+    created_date = models.DateTimeField()
+    hot_score_v2 = models.IntegerField(default=0)
+    bounty_expiration_date = models.DateTimeField(null=True)
+    bounty_total_amount = models.DecimalField(
+        decimal_places=10, max_digits=19, null=True
+    )
+
+    discussed_today = models.IntegerField(default=0)
+    discussed_week = models.IntegerField(default=0)
+    discussed_month = models.IntegerField(default=0)
+    discussed_year = models.IntegerField(default=0)
+    discussed_all = models.IntegerField(default=0)
+    discussed_date = models.DateTimeField(null=True)
+
+    upvoted_today = models.IntegerField(default=0)
+    upvoted_week = models.IntegerField(default=0)
+    upvoted_month = models.IntegerField(default=0)
+    upvoted_year = models.IntegerField(default=0)
+    upvoted_all = models.IntegerField(default=0)
+    upvoted_date = models.DateTimeField(null=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["unified_document", "hub_id"],
+                name="unique_feed_entry_document_hub",
+            )
+        ]
+        indexes = (
+            _get_ordering_index("created_date", "feed_hub_created_date_idx"),
+            _get_ordering_index("hot_score_v2", "feed_hub_hot_score_idx"),
+            _get_ordering_index(
+                "bounty_expiration_date", "feed_hub_bounty_exp_idx", descending=False
+            ),
+            _get_ordering_index("bounty_total_amount", "feed_hub_bounty_amount_idx"),
+            _get_ordering_index("discussed_today", "feed_hub_disc_today_idx"),
+            _get_ordering_index("discussed_week", "feed_hub_disc_week_idx"),
+            _get_ordering_index("discussed_month", "feed_hub_disc_month_idx"),
+            _get_ordering_index("discussed_year", "feed_hub_disc_year_idx"),
+            _get_ordering_index("discussed_all", "feed_hub_disc_all_idx"),
+            _get_ordering_index("upvoted_today", "feed_hub_upv_today_idx"),
+            _get_ordering_index("upvoted_week", "feed_hub_upv_week_idx"),
+            _get_ordering_index("upvoted_month", "feed_hub_upv_month_idx"),
+            _get_ordering_index("upvoted_year", "feed_hub_upv_year_idx"),
+            _get_ordering_index("upvoted_all", "feed_hub_upv_all_idx"),
+        )
@@ -213,6 +213,37 @@ class DynamicPostSerializer(DynamicModelFieldSerializer):
     threads = SerializerMethodField()
     unified_document = SerializerMethodField()
 
+    related_method_fields = {
+        "authors": (
+            (
+                "authors",
+                "doc_dps_get_authors",
+                "user.serializers.DynamicAuthorSerializer",
+            ),
+        ),
+        "created_by": (
+            (
+                "created_by",
+                "doc_dps_get_created_by",
+                "user.serializers.DynamicUserSerializer",
+            ),
+        ),
+        "hubs": (
+            (
+                "unified_document__hubs",
+                "doc_dps_get_hubs",
+                "hub.serializers.DynamicHubSerializer",
+            ),
+        ),
+        "unified_document": (
+            (
+                "unified_document",
+                "doc_dps_get_unified_document",
+                "researchhub_document.serializers.DynamicUnifiedDocumentSerializer",
+            ),
+        ),
+    }
+
     class Meta:
         model = ResearchhubPost
         fields = "__all__"
@@ -94,6 +94,43 @@ class DynamicUnifiedDocumentSerializer(DynamicModelFieldSerializer):
     reviews = SerializerMethodField()
     concepts = SerializerMethodField()
 
+    related_method_fields = {
+        "concepts": (
+            (
+                "concepts",
+                "doc_duds_get_concepts",
+                "tag.serializers.DynamicConceptSerializer",
+            ),
+        ),
+        "created_by": (
+            (
+                "created_by",
+                "doc_duds_get_created_by",
+                "user.serializers.DynamicUserSerializer",
+            ),
+        ),
+        "documents": (
+            (
+                "paper",
+                "doc_duds_get_documents",
+                "paper.serializers.DynamicPaperSerializer",
+            ),
+            (
+                "posts",
+                "doc_duds_get_documents",
+                "researchhub_document.serializers.DynamicPostSerializer",
+            ),
+            (
+                "hypothesis",
+                "doc_duds_get_documents",
+                "hypothesis.serializers.DynamicHypothesisSerializer",
+            ),
+        ),
+        "hubs": (
+            ("hubs", "doc_duds_get_hubs", "hub.serializers.DynamicHubSerializer"),
+        ),
+    }
+
     class Meta:
         model = ResearchhubUnifiedDocument
         fields = "__all__"
@@ -1,5 +1,10 @@
 # flake8: noqa
 
+from .feed_entry_signals import (
+    refresh_feed_entries_on_document_filter_save,
+    refresh_feed_entries_on_hubs_change,
+    refresh_feed_entries_on_unified_doc_save,
+)
 from .researchhub_unified_document_signals import (
     rh_unified_doc_sync_scores_on_related_docs,
 )
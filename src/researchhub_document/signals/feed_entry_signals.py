@@ -0,0 +1,57 @@
+from django.db.models.signals import m2m_changed, post_save
+from django.dispatch import receiver
+
+from researchhub_document.feed_index import schedule_feed_entries_refresh
+from researchhub_document.models import (
+    DocumentFilter,
+    FeedEntry,
+    ResearchhubUnifiedDocument,
+)
+
+
+@receiver(
+    post_save,
+    sender=ResearchhubUnifiedDocument,
+    dispatch_uid="refresh_feed_entries_on_unified_doc_save",
+)
+def refresh_feed_entries_on_unified_doc_save(instance, **kwargs):
+    schedule_feed_entries_refresh([instance.id])
+
+
+@receiver(
+    post_save,
+    sender=DocumentFilter,
+    dispatch_uid="refresh_feed_entries_on_document_filter_save",
+)
+def refresh_feed_entries_on_document_filter_save(instance, created, **kwargs):
+    if created:
+        # New filters are attached to their document afterwards
+        return
+    schedule_feed_entries_refresh(
+        ResearchhubUnifiedDocument.all_objects.filter(
+            document_filter_id=instance.id
+        ).values_list("id", flat=True)
+    )
+
+
+@receiver(
+    m2m_changed,
+    sender=ResearchhubUnifiedDocument.hubs.through,
+    dispatch_uid="refresh_feed_entries_on_hubs_change",
+)
+def refresh_feed_entries_on_hubs_change(instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if not reverse:
+        schedule_feed_entries_refresh([instance.id])
+    elif pk_set:
+        schedule_feed_entries_refresh(pk_set)
+    elif action == "post_clear":
+        # pk_set is not provided when a hub's documents are cleared, its
+        # entries still point at them until they are refreshed
+        schedule_feed_entries_refresh(
+            FeedEntry.objects.filter(hub_id=instance.id).values_list(
+                "unified_document_id", flat=True
+            )
+        )
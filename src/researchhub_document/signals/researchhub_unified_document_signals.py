@@ -5,21 +5,15 @@ from discussion.models import Comment, Reply, Thread
 from discussion.reaction_models import Vote as GrmVote
 from paper.models import Paper
 from researchhub_comment.models import RhCommentModel
-from researchhub_document.tasks import recalc_hot_score_task
+from researchhub_document.utils import schedule_hot_score_recalc
 from utils import sentry
 
 
 @receiver(post_save, sender=GrmVote, dispatch_uid="recalc_hot_score_on_vote")
 def recalc_hot_score(instance, sender, **kwargs):
     try:
-        recalc_hot_score_task.apply_async(
-            (
-                instance.content_type_id,
-                instance.object_id,
-            ),
-            priority=2,
-            countdown=5,
-        )
+        unified_document = instance.unified_document
+        schedule_hot_score_recalc(getattr(unified_document, "id", None))
     except Exception as error:
         print("recalc_hot_score error", error)
         sentry.log_error(error)
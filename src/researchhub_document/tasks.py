@@ -1,7 +1,11 @@
+from datetime import datetime, timedelta
+
+import pytz
 from celery.decorators import periodic_task
 from celery.task.schedules import crontab
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
+from django.db.models import Q
 from django.http.request import HttpRequest, QueryDict
 from django_elasticsearch_dsl.registries import registry
 from rest_framework.request import Request
@@ -9,42 +13,86 @@ from rest_framework.request import Request
 from paper.utils import get_cache_key
 from researchhub.celery import QUEUE_CACHES, QUEUE_ELASTIC_SEARCH, QUEUE_HOT_SCORE, app
 from researchhub.settings import PRODUCTION, STAGING
-from researchhub_document.related_models.constants.document_type import BOUNTY
+from researchhub_document.related_models.constants.document_type import BOUNTY, NOTE
 from utils import sentry
 
+# Documents created within this window (or with an open bounty) are
+# rescored periodically, since their time and bounty inputs keep moving
+HOT_SCORE_ACTIVE_WINDOW_DAYS = 30
+HOT_SCORE_BATCH_SIZE = 1000
 
-@app.task(queue=QUEUE_HOT_SCORE)
-def recalc_hot_score_task(instance_content_type_id, instance_id):
-    content_type = ContentType.objects.get(id=instance_content_type_id)
+
+def _get_unified_document_for_instance(instance_content_type_id, instance_id):
+    content_type = ContentType.objects.get_for_id(instance_content_type_id)
     model_name = content_type.model
     model_class = content_type.model_class()
     uni_doc = None
 
+    if model_name in ["hypothesis", "researchhubpost", "paper"]:
+        uni_doc = model_class.objects.get(id=instance_id).unified_document
+    elif model_name in ["thread", "comment", "reply"]:
+        thread = None
+        if model_name == "thread":
+            thread = model_class.objects.get(id=instance_id)
+        elif model_name == "comment":
+            comment = model_class.objects.get(id=instance_id)
+            thread = comment.parent
+        elif model_name == "reply":
+            reply = model_class.objects.get(id=instance_id)
+            thread = reply.parent.parent
+
+        if thread.paper:
+            uni_doc = thread.paper.unified_document
+        elif thread.hypothesis:
+            uni_doc = thread.hypothesis.unified_document
+        elif thread.post:
+            uni_doc = thread.post.unified_document
+    elif model_name == "citation":
+        uni_doc = model_class.objects.get(id=instance_id).source
+
+    return uni_doc
+
+
+@app.task(queue=QUEUE_HOT_SCORE)
+def recalc_hot_score_task(instance_content_type_id, instance_id):
+    """
+    Resolves the unified document for a voted/commented instance and
+    hands it to the deduplicating scheduler.
+    """
+    from researchhub_document.utils import schedule_hot_score_recalc
+
     try:
-        if model_name in ["hypothesis", "researchhubpost", "paper"]:
-            uni_doc = model_class.objects.get(id=instance_id).unified_document
-        elif model_name in ["thread", "comment", "reply"]:
-            thread = None
-            if model_name == "thread":
-                thread = model_class.objects.get(id=instance_id)
-            elif model_name == "comment":
-                comment = model_class.objects.get(id=instance_id)
-                thread = comment.parent
-            elif model_name == "reply":
-                reply = model_class.objects.get(id=instance_id)
-                thread = reply.parent.parent
-
-            if thread.paper:
-                uni_doc = thread.paper.unified_document
-            elif thread.hypothesis:
-                uni_doc = thread.hypothesis.unified_document
-            elif thread.post:
-                uni_doc = thread.post.unified_document
-        elif model_name == "paper":
-            uni_doc = model_class.objects.get(id=instance_id).unified_document
-        elif model_name == "citation":
-            uni_doc = model_class.objects.get(id=instance_id).source
+        uni_doc = _get_unified_document_for_instance(
+            instance_content_type_id, instance_id
+        )
+        schedule_hot_score_recalc(getattr(uni_doc, "id", None))
+    except Exception as error:
+        sentry.log_error(error)
+
+
+@app.task(queue=QUEUE_HOT_SCORE)
+def recalc_unified_document_hot_score(unified_document_id):
+    from researchhub_document.models import ResearchhubUnifiedDocument
+    from researchhub_document.utils import (
+        HOT_SCORE_RECALC_METRIC_EXECUTED,
+        HOT_SCORE_RECALC_PENDING_TIMEOUT,
+        get_hot_score_recalc_last_run_key,
+        get_hot_score_recalc_pending_key,
+        incr_hot_score_recalc_metric,
+    )
+
+    # Clear the marker first so events arriving during the recalculation
+    # schedule a follow-up instead of being merged into this run
+    cache.delete(get_hot_score_recalc_pending_key(unified_document_id))
+    cache.set(
+        get_hot_score_recalc_last_run_key(unified_document_id),
+        datetime.now().timestamp(),
+        timeout=HOT_SCORE_RECALC_PENDING_TIMEOUT,
+    )
+    incr_hot_score_recalc_metric(HOT_SCORE_RECALC_METRIC_EXECUTED)
 
+    try:
+        uni_doc = ResearchhubUnifiedDocument.all_objects.get(id=unified_document_id)
         uni_doc.calculate_hot_score_v2(should_save=True)
     except Exception as error:
         sentry.log_error(error)
@@ -58,8 +106,20 @@ def preload_trending_documents(
     time_scope,
 ):
     from researchhub_document.serializers import DynamicUnifiedDocumentSerializer
+    from researchhub_document.utils import (
+        FEED_REBUILD_METRIC_EXECUTED,
+        get_feed_rebuild_pending_key,
+        incr_feed_rebuild_metric,
+    )
     from researchhub_document.views import ResearchhubUnifiedDocumentViewSet
 
+    # Clearing the pending marker before rebuilding lets invalidations that
+    # arrive mid-rebuild schedule a fresh one instead of being dropped
+    cache.delete(
+        get_feed_rebuild_pending_key(document_type, hub_id, filtering, time_scope)
+    )
+    incr_feed_rebuild_metric(FEED_REBUILD_METRIC_EXECUTED)
+
     if time_scope == "all":
         cache_pk = f"{document_type}_{hub_id}_{filtering}_all"
     elif time_scope == "year":
@@ -162,6 +222,56 @@ def preload_hub_feeds():
     reset_unified_document_cache(hub_ids=ids, document_type=["all"])
 
 
+@periodic_task(
+    run_every=crontab(minute="*/30"),
+    priority=3,
+    queue=QUEUE_HOT_SCORE,
+)
+def recalc_active_hot_scores():
+    from reputation.related_models.bounty import Bounty
+    from researchhub_document.hot_score_batch import HotScoreBatchCalculator
+    from researchhub_document.models import ResearchhubUnifiedDocument
+
+    window_start = datetime.now(pytz.UTC) - timedelta(days=HOT_SCORE_ACTIVE_WINDOW_DAYS)
+    doc_ids = (
+        ResearchhubUnifiedDocument.objects.filter(
+            Q(created_date__gte=window_start) | Q(related_bounties__status=Bounty.OPEN)
+        )
+        .exclude(document_type=NOTE)
+        .order_by("id")
+        .values_list("id", flat=True)
+        .distinct()
+    )
+
+    calculator = HotScoreBatchCalculator()
+    doc_ids = list(doc_ids)
+    for i in range(0, len(doc_ids), HOT_SCORE_BATCH_SIZE):
+        try:
+            calculator.update(doc_ids[i : i + HOT_SCORE_BATCH_SIZE])
+        except Exception as error:
+            sentry.log_error(error)
+
+
+@app.task(queue=QUEUE_HOT_SCORE)
+def recalc_hot_scores_batch(unified_document_ids):
+    from researchhub_document.hot_score_batch import HotScoreBatchCalculator
+
+    calculator = HotScoreBatchCalculator()
+    for i in range(0, len(unified_document_ids), HOT_SCORE_BATCH_SIZE):
+        calculator.update(unified_document_ids[i : i + HOT_SCORE_BATCH_SIZE])
+
+
+@periodic_task(
+    run_every=crontab(minute=5),
+    priority=3,
+    queue=QUEUE_CACHES,
+)
+def compact_document_filter_activity():
+    from researchhub_document.models import DocumentFilterActivityBucket
+
+    DocumentFilterActivityBucket.compact()
+
+
 @app.task(queue=QUEUE_ELASTIC_SEARCH)
 def update_elastic_registry(post):
     registry.update(post)
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+
+import pytz
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from paper.tests.helpers import create_paper
+from researchhub_document.models import DocumentFilter, DocumentFilterActivityBucket
+from researchhub_document.related_models.document_filter_model import (
+    FILTER_ACTIVITY_COMPACTED_UNTIL_KEY,
+    get_activity_compacted_until,
+    set_activity_compacted_until,
+)
+
+
+class DocumentFilterActivityTests(APITestCase):
+    def setUp(self):
+        self.document_filter = create_paper().unified_document.document_filter
+
+    def test_increment_updates_windows_and_bucket(self):
+        now = datetime.now(pytz.UTC)
+        self.document_filter.increment_upvoted(now, 2)
+        self.document_filter.increment_upvoted(now - timedelta(days=10), 1)
+
+        self.document_filter.refresh_from_db()
+        self.assertEqual(self.document_filter.upvoted_today, 2)
+        self.assertEqual(self.document_filter.upvoted_week, 2)
+        self.assertEqual(self.document_filter.upvoted_month, 3)
+        self.assertEqual(self.document_filter.upvoted_all, 3)
+        self.assertEqual(
+            DocumentFilterActivityBucket.objects.filter(
+                document_filter=self.document_filter
+            ).count(),
+            2,
+        )
+
+    def test_compact_rolls_buckets_out_of_windows(self):
+        now = datetime.now(pytz.UTC)
+        set_activity_compacted_until(now - timedelta(days=2))
+        self.document_filter.increment_discussed(now - timedelta(days=6, hours=12))
+
+        self.document_filter.refresh_from_db()
+        self.assertEqual(self.document_filter.discussed_week, 1)
+
+        DocumentFilterActivityBucket.compact(now=now + timedelta(days=1))
+
+        self.document_filter.refresh_from_db()
+        self.assertEqual(self.document_filter.discussed_today, 0)
+        self.assertEqual(self.document_filter.discussed_week, 0)
+        self.assertEqual(self.document_filter.discussed_month, 1)
+        self.assertEqual(self.document_filter.discussed_all, 1)
+
+    def test_compaction_cursor_survives_cache_loss(self):
+        compacted_until = datetime(2023, 1, 1, 12, tzinfo=pytz.UTC)
+        set_activity_compacted_until(compacted_until)
+        cache.delete(FILTER_ACTIVITY_COMPACTED_UNTIL_KEY)
+
+        self.assertEqual(get_activity_compacted_until(), compacted_until)
+
+    def test_rebuild_zeroes_filters_without_buckets(self):
+        DocumentFilter.objects.filter(id=self.document_filter.id).update(
+            discussed_week=3, discussed_all=3
+        )
+
+        DocumentFilterActivityBucket.rebuild_windows(datetime.now(pytz.UTC))
+
+        self.document_filter.refresh_from_db()
+        self.assertEqual(self.document_filter.discussed_week, 0)
+        self.assertEqual(self.document_filter.discussed_all, 3)
@@ -0,0 +1,78 @@
+from rest_framework.test import APITestCase
+
+from discussion.reaction_models import Vote
+from discussion.tests.helpers import create_rh_comment, create_vote
+from paper.tests.helpers import create_paper
+from researchhub_document.document_filter_bulk import DocumentFilterBulkUpdater
+from researchhub_document.models import DocumentFilter
+from researchhub_document.related_models.constants.document_type import (
+    SORT_DISCUSSED,
+    SORT_UPVOTED,
+)
+from user.tests.helpers import create_random_default_user
+
+
+class DocumentFilterBulkUpdaterTests(APITestCase):
+    def setUp(self):
+        self.author = create_random_default_user("bulk_filter_author")
+        self.paper = create_paper(uploaded_by=self.author)
+        self.other_paper = create_paper(uploaded_by=self.author)
+
+    def test_bulk_update_counts_votes_per_document(self):
+        voters = [create_random_default_user(f"bulk_voter_{i}") for i in range(3)]
+        create_vote(voters[0], self.paper, Vote.UPVOTE)
+        create_vote(voters[1], self.paper, Vote.UPVOTE)
+        create_vote(voters[2], self.paper, Vote.DOWNVOTE)
+        create_vote(voters[0], self.other_paper, Vote.UPVOTE)
+
+        updated = DocumentFilterBulkUpdater(update_types=(SORT_UPVOTED,)).update(
+            [self.paper.unified_document.id, self.other_paper.unified_document.id]
+        )
+
+        self.assertEqual(updated, 2)
+        self.paper.unified_document.document_filter.refresh_from_db()
+        self.other_paper.unified_document.document_filter.refresh_from_db()
+        self.assertEqual(self.paper.unified_document.document_filter.upvoted_all, 1)
+        self.assertEqual(
+            self.other_paper.unified_document.document_filter.upvoted_all, 1
+        )
+
+    def test_bulk_update_matches_single_document_update(self):
+        create_rh_comment(paper=self.paper, created_by=self.author)
+        create_rh_comment(paper=self.paper, created_by=self.author)
+        create_vote(create_random_default_user("bulk_voter"), self.paper, Vote.UPVOTE)
+
+        DocumentFilterBulkUpdater().update([self.paper.unified_document.id])
+        document_filter = self.paper.unified_document.document_filter
+        document_filter.refresh_from_db()
+        bulk_values = (
+            document_filter.discussed_all,
+            document_filter.upvoted_all,
+            document_filter.has_bounty,
+        )
+
+        document_filter.update_filters((SORT_DISCUSSED, SORT_UPVOTED))
+        document_filter.refresh_from_db()
+        single_values = (
+            document_filter.discussed_all,
+            document_filter.upvoted_all,
+            document_filter.has_bounty,
+        )
+
+        self.assertEqual(bulk_values, (2, 1, False))
+        self.assertEqual(bulk_values, single_values)
+
+    def test_bulk_update_leaves_rolling_windows_to_buckets(self):
+        document_filter = self.paper.unified_document.document_filter
+        DocumentFilter.objects.filter(id=document_filter.id).update(
+            upvoted_today=5, discussed_week=3
+        )
+        create_vote(create_random_default_user("bulk_voter"), self.paper, Vote.UPVOTE)
+
+        DocumentFilterBulkUpdater().update([self.paper.unified_document.id])
+        document_filter.update_filters((SORT_DISCUSSED, SORT_UPVOTED))
+
+        document_filter.refresh_from_db()
+        self.assertEqual(document_filter.upvoted_all, 1)
+        self.assertEqual(document_filter.upvoted_today, 5)
+        self.assertEqual(document_filter.discussed_week, 3)
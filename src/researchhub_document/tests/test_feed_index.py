@@ -0,0 +1,94 @@
+from datetime import datetime
+
+import pytz
+from rest_framework.test import APITestCase
+
+from discussion.vote_score import apply_vote_score_delta
+from hub.tests.helpers import create_hub
+from paper.tests.helpers import create_paper
+from researchhub_document.feed_index import (
+    FeedIndexQuery,
+    encode_feed_index_cursor,
+    refresh_feed_entries,
+)
+from researchhub_document.models import FeedEntry, ResearchhubUnifiedDocument
+from researchhub_document.related_models.constants.filters import HOT
+from researchhub_document.related_models.feed_entry_model import FEED_ENTRY_ALL_HUBS
+from user.tests.helpers import create_random_default_user
+
+
+class FeedIndexTests(APITestCase):
+    def setUp(self):
+        self.user = create_random_default_user("feed_index_user")
+        self.hub = create_hub(name="feed_index_hub")
+        self.papers = [create_paper(uploaded_by=self.user) for _ in range(3)]
+        self.doc_ids = []
+        for i, paper in enumerate(self.papers):
+            unified_document = paper.unified_document
+            unified_document.hubs.add(self.hub)
+            ResearchhubUnifiedDocument.objects.filter(id=unified_document.id).update(
+                hot_score_v2=(i + 1) * 10
+            )
+            self.doc_ids.append(unified_document.id)
+        refresh_feed_entries(self.doc_ids)
+
+    def test_refresh_writes_one_entry_per_hub(self):
+        entries = FeedEntry.objects.filter(unified_document_id=self.doc_ids[0])
+
+        self.assertEqual(
+            set(entries.values_list("hub_id", flat=True)),
+            {FEED_ENTRY_ALL_HUBS, self.hub.id},
+        )
+        self.assertEqual(entries.first().hot_score_v2, 10)
+
+    def test_refresh_removes_entries_of_removed_documents(self):
+        ResearchhubUnifiedDocument.objects.filter(id=self.doc_ids[0]).update(
+            is_removed=True
+        )
+        refresh_feed_entries([self.doc_ids[0]])
+
+        self.assertFalse(
+            FeedEntry.objects.filter(unified_document_id=self.doc_ids[0]).exists()
+        )
+
+    def test_keyset_pages_follow_hot_score(self):
+        feed = FeedIndexQuery(2, hub_id=self.hub.id, ordering=HOT)
+
+        ids, last_key = feed.get_page()
+        self.assertEqual(ids, [self.doc_ids[2], self.doc_ids[1]])
+
+        after_key = feed.decode_cursor(encode_feed_index_cursor(last_key))
+        self.assertEqual(after_key, (20, self.doc_ids[1]))
+        ids, last_key = feed.get_page(after_key)
+        self.assertEqual(ids, [self.doc_ids[0]])
+        self.assertIsNone(last_key)
+
+    def test_get_unified_documents_with_cursor(self):
+        response = self.client.get(
+            "/api/researchhub_unified_document/get_unified_documents/",
+            {"cursor": "", "hub_id": self.hub.id, "ordering": HOT, "page_limit": 2},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [doc["id"] for doc in response.data["results"]],
+            [self.doc_ids[2], self.doc_ids[1]],
+        )
+        self.assertIsNotNone(response.data["next"])
+
+    def test_get_unified_documents_rejects_invalid_hub_id(self):
+        response = self.client.get(
+            "/api/researchhub_unified_document/get_unified_documents/",
+            {"cursor": "", "hub_id": "not-a-hub"},
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_vote_score_delta_refreshes_entries(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            apply_vote_score_delta(self.papers[0], 3, datetime.now(pytz.UTC))
+
+        entry = FeedEntry.objects.get(
+            unified_document_id=self.doc_ids[0], hub_id=self.hub.id
+        )
+        self.assertEqual(entry.upvoted_all, 3)
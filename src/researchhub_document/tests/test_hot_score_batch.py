@@ -0,0 +1,32 @@
+from rest_framework.test import APITestCase
+
+from discussion.reaction_models import Vote
+from discussion.tests.helpers import create_vote
+from paper.tests.helpers import create_paper
+from researchhub_document.hot_score_batch import HotScoreBatchCalculator
+from user.tests.helpers import create_random_default_user
+
+
+class HotScoreBatchCalculatorTests(APITestCase):
+    def setUp(self):
+        self.author = create_random_default_user("hot_score_author")
+        self.paper = create_paper(uploaded_by=self.author)
+        self.other_paper = create_paper(uploaded_by=self.author)
+
+    def test_batch_matches_single_document_calculation(self):
+        create_vote(create_random_default_user("hot_voter_1"), self.paper, Vote.UPVOTE)
+        create_vote(create_random_default_user("hot_voter_2"), self.paper, Vote.UPVOTE)
+
+        unified_documents = [
+            self.paper.unified_document,
+            self.other_paper.unified_document,
+        ]
+        single_scores = {
+            doc.id: doc.calculate_hot_score_v2()[0] for doc in unified_documents
+        }
+
+        HotScoreBatchCalculator().update([doc.id for doc in unified_documents])
+
+        for doc in unified_documents:
+            doc.refresh_from_db()
+            self.assertAlmostEqual(doc.hot_score_v2, single_scores[doc.id], delta=1)
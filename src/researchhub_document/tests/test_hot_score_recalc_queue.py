@@ -0,0 +1,30 @@
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from paper.tests.helpers import create_paper
+from researchhub_document.utils import (
+    get_hot_score_recalc_metrics,
+    get_hot_score_recalc_pending_key,
+    reset_hot_score_recalc_metrics,
+    schedule_hot_score_recalc,
+)
+
+
+class HotScoreRecalcQueueTests(APITestCase):
+    def setUp(self):
+        self.unified_document = create_paper().unified_document
+        cache.delete(get_hot_score_recalc_pending_key(self.unified_document.id))
+        reset_hot_score_recalc_metrics()
+
+    def test_pending_recalculations_are_merged(self):
+        self.assertTrue(schedule_hot_score_recalc(self.unified_document.id))
+        self.assertFalse(schedule_hot_score_recalc(self.unified_document.id))
+        self.assertFalse(schedule_hot_score_recalc(self.unified_document.id))
+
+        metrics = get_hot_score_recalc_metrics()
+        self.assertEqual(metrics["scheduled"], 1)
+        self.assertEqual(metrics["merged"], 2)
+
+    def test_missing_document_is_dropped(self):
+        self.assertFalse(schedule_hot_score_recalc(None))
+        self.assertEqual(get_hot_score_recalc_metrics()["dropped"], 1)
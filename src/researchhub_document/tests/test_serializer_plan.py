@@ -0,0 +1,84 @@
+from rest_framework.test import APITestCase
+
+from hub.serializers import DynamicHubSerializer
+from hub.tests.helpers import create_hub
+from paper.tests.helpers import create_paper
+from researchhub_document.models import ResearchhubUnifiedDocument
+from researchhub_document.serializers import DynamicUnifiedDocumentSerializer
+from user.tests.helpers import create_random_default_user
+
+
+class DynamicSerializerPlanTests(APITestCase):
+    def setUp(self):
+        self.user = create_random_default_user("serializer_plan_user")
+        self.hub = create_hub()
+        self.paper = create_paper(uploaded_by=self.user)
+        self.paper.hubs.add(self.hub)
+        self.context = {
+            "doc_duds_get_documents": {
+                "_include_fields": ["id", "hubs", "uploaded_by"],
+            },
+            "pap_dps_get_hubs": {"_include_fields": ["id", "name"]},
+            "pap_dps_get_uploaded_by": {"_include_fields": ["id", "author_profile"]},
+            "usr_dus_get_author_profile": {"_include_fields": ["id"]},
+        }
+
+    def test_field_selection_is_resolved_per_selection(self):
+        first = DynamicHubSerializer(self.hub, _include_fields=["id", "name"])
+        second = DynamicHubSerializer(self.hub, _include_fields=["id"])
+        third = DynamicHubSerializer(self.hub, _include_fields=["id", "name"])
+
+        self.assertEqual(set(first.data), {"id", "name"})
+        self.assertEqual(set(second.data), {"id"})
+        self.assertEqual(set(third.data), {"id", "name"})
+        self.assertIsNot(first.fields["id"], third.fields["id"])
+
+    def test_query_plan_follows_context(self):
+        (
+            select_related,
+            prefetch_related,
+        ) = DynamicUnifiedDocumentSerializer.get_query_plan(
+            self.context, _include_fields=["id", "documents"]
+        )
+
+        self.assertCountEqual(
+            select_related,
+            [
+                "paper",
+                "paper__uploaded_by",
+                "paper__uploaded_by__author_profile",
+                "hypothesis",
+            ],
+        )
+        self.assertCountEqual(
+            prefetch_related,
+            [
+                "paper__hubs",
+                "posts",
+                "posts__unified_document__hubs",
+                "hypothesis__unified_document__hubs",
+            ],
+        )
+
+    def test_prefetched_feed_page_serializes_without_queries(self):
+        page = list(
+            ResearchhubUnifiedDocument.objects.filter(id=self.paper.unified_document_id)
+        )
+        unified_documents = DynamicUnifiedDocumentSerializer.prefetch_instances(
+            page,
+            self.context,
+            _include_fields=["id", "documents"],
+        )
+
+        with self.assertNumQueries(0):
+            data = DynamicUnifiedDocumentSerializer(
+                unified_documents,
+                _include_fields=["id", "documents"],
+                context=self.context,
+                many=True,
+            ).data
+
+        document = data[0]["documents"]
+        self.assertEqual(document["id"], self.paper.id)
+        self.assertEqual(document["hubs"], [{"id": self.hub.id, "name": self.hub.name}])
+        self.assertEqual(document["uploaded_by"]["id"], self.user.id)
@@ -0,0 +1,83 @@
+import base64
+
+from rest_framework.test import APITestCase
+
+from researchhub_document.views.custom.subscribed_feed import (
+    SubscribedFeedMerger,
+    get_subscribed_feed_sort_field,
+)
+
+
+def _doc(doc_id, hot_score_v2):
+    return {"id": doc_id, "hot_score_v2": hot_score_v2}
+
+
+class SubscribedFeedMergerTests(APITestCase):
+    def test_merges_hub_pages_and_removes_duplicates(self):
+        merger = SubscribedFeedMerger("hot_score_v2", page_size=3)
+        cache_hits = [
+            {"next": None, "results": [_doc(1, 50), _doc(2, 10)]},
+            {"next": None, "results": [_doc(3, 40), _doc(1, 50), _doc(4, 5)]},
+        ]
+
+        results, last_key, needs_fallback = merger.merge(cache_hits)
+        self.assertEqual([doc["id"] for doc in results], [1, 3, 2])
+        self.assertFalse(needs_fallback)
+
+        results, _, needs_fallback = merger.merge(cache_hits, after_key=last_key)
+        self.assertEqual([doc["id"] for doc in results], [4])
+        self.assertFalse(needs_fallback)
+
+    def test_stops_at_truncated_hub_page(self):
+        merger = SubscribedFeedMerger("hot_score_v2", page_size=3)
+        cache_hits = [
+            {"next": "page=2", "results": [_doc(1, 50), _doc(2, 30)]},
+            {"next": None, "results": [_doc(3, 40), _doc(4, 20), _doc(5, 10)]},
+        ]
+
+        results, last_key, needs_fallback = merger.merge(cache_hits)
+        self.assertEqual([doc["id"] for doc in results], [1, 3, 2])
+        self.assertFalse(needs_fallback)
+
+        results, _, needs_fallback = merger.merge(cache_hits, after_key=last_key)
+        self.assertEqual(results, [])
+        self.assertTrue(needs_fallback)
+
+    def test_sort_field_matches_cached_feed_ordering(self):
+        self.assertEqual(
+            get_subscribed_feed_sort_field("upvoted", "week"),
+            "document_filter__upvoted_week",
+        )
+        self.assertEqual(
+            get_subscribed_feed_sort_field("discussed", "bogus"),
+            "document_filter__discussed_today",
+        )
+        self.assertEqual(get_subscribed_feed_sort_field("hot", "week"), "hot_score_v2")
+
+    def test_merges_on_document_filter_values(self):
+        merger = SubscribedFeedMerger("document_filter__upvoted_week", page_size=3)
+        merger.sort_values = {1: 3, 2: 9, 3: 5}
+        cache_hits = [
+            {"next": None, "results": [{"id": 1}, {"id": 2}]},
+            {"next": None, "results": [{"id": 3}]},
+        ]
+
+        results, _, _ = merger.merge(cache_hits)
+        self.assertEqual([doc["id"] for doc in results], [2, 3, 1])
+
+    def test_cursor_round_trip(self):
+        merger = SubscribedFeedMerger("hot_score_v2")
+        key = merger.get_sort_key(_doc(7, 12))
+        self.assertEqual(merger.decode_cursor(merger.encode_cursor(key)), key)
+        self.assertIsNone(merger.decode_cursor("not-a-cursor"))
+
+    def test_created_date_cursor_keeps_datetime(self):
+        merger = SubscribedFeedMerger("created_date")
+        key = merger.get_sort_key(
+            {"id": 7, "created_date": "2026-10-17T12:30:00.123456Z"}
+        )
+        cursor = merger.encode_cursor(key)
+        self.assertIn(
+            "2026-10-17T12:30:00.123456", base64.urlsafe_b64decode(cursor).decode()
+        )
+        self.assertEqual(merger.decode_cursor(cursor), key)
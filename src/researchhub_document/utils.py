@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
 
+from django.core.cache import cache
 from django.db.models.query import QuerySet
 
 from researchhub_document.related_models.constants.document_type import (
@@ -18,7 +19,11 @@ from researchhub_document.related_models.constants.filters import (
     NEW,
     UPVOTED,
 )
-from researchhub_document.tasks import preload_trending_documents
+from researchhub_document.tasks import (
+    preload_trending_documents,
+    recalc_unified_document_hot_score,
+)
+from utils.cache import get_cache_counters, incr_cache_counter, reset_cache_counters
 from utils.sentry import log_error
 
 CACHE_DATE_RANGES = ("today", "week", "month", "year", "all")
@@ -29,6 +34,39 @@ CACHE_DOCUMENT_TYPES = [
     "hypothesis",
 ]
 
+# Invalidations of the same feed key within this window are coalesced
+# into a single rebuild
+FEED_REBUILD_DEBOUNCE_SECONDS = 30
+# Safety net in case a scheduled rebuild is lost before it runs
+FEED_REBUILD_PENDING_TIMEOUT = 60 * 10
+
+FEED_REBUILD_METRIC_SCHEDULED = "scheduled"
+FEED_REBUILD_METRIC_COALESCED = "coalesced"
+FEED_REBUILD_METRIC_EXECUTED = "executed"
+FEED_REBUILD_METRICS = (
+    FEED_REBUILD_METRIC_SCHEDULED,
+    FEED_REBUILD_METRIC_COALESCED,
+    FEED_REBUILD_METRIC_EXECUTED,
+)
+
+# A unified document is rescored at most once per interval, regardless
+# of how many votes or comments arrive in between
+HOT_SCORE_RECALC_MIN_INTERVAL_SECONDS = 60
+# Initial delay so bursts of events land in the same recalculation
+HOT_SCORE_RECALC_DEBOUNCE_SECONDS = 5
+HOT_SCORE_RECALC_PENDING_TIMEOUT = 60 * 10
+
+HOT_SCORE_RECALC_METRIC_SCHEDULED = "scheduled"
+HOT_SCORE_RECALC_METRIC_MERGED = "merged"
+HOT_SCORE_RECALC_METRIC_DROPPED = "dropped"
+HOT_SCORE_RECALC_METRIC_EXECUTED = "executed"
+HOT_SCORE_RECALC_METRICS = (
+    HOT_SCORE_RECALC_METRIC_SCHEDULED,
+    HOT_SCORE_RECALC_METRIC_MERGED,
+    HOT_SCORE_RECALC_METRIC_DROPPED,
+    HOT_SCORE_RECALC_METRIC_EXECUTED,
+)
+
 
 def get_doc_type_key(document):
     doc_type = document.document_type.lower()
@@ -59,6 +97,112 @@ def get_date_ranges_by_time_scope(time_scope):
     return (start_date, end_date)
 
 
+def get_feed_rebuild_pending_key(document_type, hub_id, filtering, time_scope):
+    return f"feed_rebuild_pending_{document_type}_{hub_id}_{filtering}_{time_scope}"
+
+
+def _get_feed_rebuild_metric_key(metric):
+    return f"feed_rebuild_metrics_{metric}"
+
+
+def incr_feed_rebuild_metric(metric, delta=1):
+    return incr_cache_counter(_get_feed_rebuild_metric_key(metric), delta)
+
+
+def get_feed_rebuild_metrics():
+    return get_cache_counters("feed_rebuild_metrics", FEED_REBUILD_METRICS)
+
+
+def reset_feed_rebuild_metrics():
+    reset_cache_counters("feed_rebuild_metrics", FEED_REBUILD_METRICS)
+
+
+def schedule_feed_rebuild(document_type, hub_id, filtering, time_scope, priority=3):
+    """
+    Marks a feed cache key as dirty and schedules a single debounced
+    rebuild for it. Invalidations arriving while a rebuild is already
+    pending for the same key are coalesced into that rebuild.
+
+    Returns True if a new rebuild was scheduled.
+    """
+    pending_key = get_feed_rebuild_pending_key(
+        document_type, hub_id, filtering, time_scope
+    )
+    if not cache.add(pending_key, True, timeout=FEED_REBUILD_PENDING_TIMEOUT):
+        incr_feed_rebuild_metric(FEED_REBUILD_METRIC_COALESCED)
+        return False
+
+    preload_trending_documents.apply_async(
+        (
+            document_type,
+            hub_id,
+            filtering,
+            time_scope,
+        ),
+        priority=priority,
+        countdown=FEED_REBUILD_DEBOUNCE_SECONDS,
+    )
+    incr_feed_rebuild_metric(FEED_REBUILD_METRIC_SCHEDULED)
+    return True
+
+
+def get_hot_score_recalc_pending_key(unified_document_id):
+    return f"hot_score_recalc_pending_{unified_document_id}"
+
+
+def get_hot_score_recalc_last_run_key(unified_document_id):
+    return f"hot_score_recalc_last_run_{unified_document_id}"
+
+
+def _get_hot_score_recalc_metric_key(metric):
+    return f"hot_score_recalc_metrics_{metric}"
+
+
+def incr_hot_score_recalc_metric(metric, delta=1):
+    return incr_cache_counter(_get_hot_score_recalc_metric_key(metric), delta)
+
+
+def get_hot_score_recalc_metrics():
+    return get_cache_counters("hot_score_recalc_metrics", HOT_SCORE_RECALC_METRICS)
+
+
+def reset_hot_score_recalc_metrics():
+    reset_cache_counters("hot_score_recalc_metrics", HOT_SCORE_RECALC_METRICS)
+
+
+def schedule_hot_score_recalc(unified_document_id, priority=2):
+    """
+    Schedules a hot score recalculation for a unified document unless one
+    is already pending. The recalculation runs no sooner than
+    HOT_SCORE_RECALC_MIN_INTERVAL_SECONDS after the previous one, so
+    events arriving in between are merged into it.
+
+    Returns True if a new recalculation was scheduled.
+    """
+    if unified_document_id is None:
+        incr_hot_score_recalc_metric(HOT_SCORE_RECALC_METRIC_DROPPED)
+        return False
+
+    pending_key = get_hot_score_recalc_pending_key(unified_document_id)
+    if not cache.add(pending_key, True, timeout=HOT_SCORE_RECALC_PENDING_TIMEOUT):
+        incr_hot_score_recalc_metric(HOT_SCORE_RECALC_METRIC_MERGED)
+        return False
+
+    countdown = HOT_SCORE_RECALC_DEBOUNCE_SECONDS
+    last_run = cache.get(get_hot_score_recalc_last_run_key(unified_document_id))
+    if last_run is not None:
+        next_run = last_run + HOT_SCORE_RECALC_MIN_INTERVAL_SECONDS
+        countdown = max(countdown, next_run - datetime.now().timestamp())
+
+    recalc_unified_document_hot_score.apply_async(
+        (unified_document_id,),
+        priority=priority,
+        countdown=countdown,
+    )
+    incr_hot_score_recalc_metric(HOT_SCORE_RECALC_METRIC_SCHEDULED)
+    return True
+
+
 def _should_cache(doc_type, flt, time_scope):
     if doc_type != BOUNTY.lower() and (flt == MOST_RSC or flt == EXPIRING_SOON):
         return False
@@ -106,15 +250,12 @@ def reset_unified_document_cache(
                     else:
                         priority = 3
 
-                    preload_trending_documents.apply_async(
-                        (
-                            doc_type,
-                            hub_id,
-                            f,
-                            time_scope,
-                        ),
+                    schedule_feed_rebuild(
+                        doc_type,
+                        hub_id,
+                        f,
+                        time_scope,
                         priority=priority,
-                        countdown=1,
                     )
 
 
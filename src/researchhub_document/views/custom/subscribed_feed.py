@@ -0,0 +1,142 @@
+import base64
+import heapq
+import json
+from datetime import datetime
+
+from dateutil import parser
+from django.db.models import Q
+
+from researchhub_document.filters import TIME_SCOPE_CHOICES
+from researchhub_document.related_models.constants.filters import (
+    DISCUSSED,
+    NEW,
+    UPVOTED,
+)
+from researchhub_document.views.custom.unified_document_pagination import (
+    UNIFIED_DOC_PAGE_SIZE,
+)
+
+
+def get_subscribed_feed_sort_field(ordering, time_scope):
+    """
+    Returns the unified document lookup the feed of `ordering` and
+    `time_scope` is ordered by, matching the cached hub feeds.
+    """
+    if time_scope not in TIME_SCOPE_CHOICES:
+        time_scope = "today"
+
+    if ordering == UPVOTED:
+        return f"document_filter__upvoted_{time_scope}"
+    elif ordering == DISCUSSED:
+        return f"document_filter__discussed_{time_scope}"
+    elif ordering == NEW:
+        return "created_date"
+    return "hot_score_v2"
+
+
+class SubscribedFeedMerger:
+    """
+    Merges the cached first pages of several hub feeds into one feed.
+
+    Every document gets a sort key of (value, id) computed once, so
+    descending key order is feed order and ties are broken consistently
+    with the database fallback. Hub pages are merged lazily with a heap.
+
+    Sort values that are not part of the serialized documents, such as
+    the document_filter columns, are looked up by id in `sort_values`.
+    """
+
+    def __init__(self, sort_field, page_size=UNIFIED_DOC_PAGE_SIZE):
+        self.sort_field = sort_field
+        self.page_size = page_size
+        self.sort_values = {}
+
+    @property
+    def is_date(self):
+        return self.sort_field == "created_date"
+
+    def get_sort_value(self, doc):
+        if self.sort_field in doc:
+            value = doc[self.sort_field]
+        else:
+            value = self.sort_values.get(doc["id"])
+
+        if self.is_date:
+            return parser.isoparse(value) if isinstance(value, str) else value
+        return value or 0
+
+    def get_sort_key(self, doc):
+        return (self.get_sort_value(doc), doc["id"])
+
+    def encode_cursor(self, key):
+        value, doc_id = key
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        payload = json.dumps({"v": value, "id": doc_id})
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, cursor):
+        """Returns the sort key encoded in a cursor, or None if it is invalid."""
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            value = payload["v"]
+            if self.is_date:
+                value = parser.isoparse(value)
+            elif not isinstance(value, (int, float)):
+                return None
+            return (value, int(payload["id"]))
+        except (ValueError, TypeError, KeyError, AttributeError):
+            return None
+
+    def get_db_keyset_filter(self, key):
+        """Matches documents that come after `key` in feed order."""
+        value, doc_id = key
+        return Q(**{f"{self.sort_field}__lt": value}) | Q(
+            **{self.sort_field: value, "id__lt": doc_id}
+        )
+
+    def merge(self, cache_hits, after_key=None):
+        """
+        Returns (results, last_key, needs_fallback) for the page following
+        `after_key`.
+
+        A hub page that has a `next` link only covers the head of that hub's
+        feed, so merged documents are emitted only down to the latest last
+        key among such pages. When the page cannot be filled within that
+        bound `needs_fallback` is True and the caller continues from the
+        database after `last_key`.
+        """
+        bound = None
+        keyed_pages = []
+        for cache_hit in cache_hits:
+            keyed = sorted(
+                ((self.get_sort_key(doc), doc) for doc in cache_hit["results"]),
+                key=lambda item: item[0],
+                reverse=True,
+            )
+            if not keyed:
+                continue
+            keyed_pages.append(keyed)
+            if cache_hit.get("next"):
+                last_key = keyed[-1][0]
+                bound = last_key if bound is None else max(bound, last_key)
+
+        results = []
+        seen_ids = set()
+        last_key = after_key
+        merged = heapq.merge(*keyed_pages, key=lambda item: item[0], reverse=True)
+        for key, doc in merged:
+            if after_key is not None and key >= after_key:
+                continue
+            if bound is not None and key < bound:
+                return results, last_key, True
+            if doc["id"] in seen_ids:
+                continue
+
+            seen_ids.add(doc["id"])
+            results.append(doc)
+            last_key = key
+            if len(results) == self.page_size:
+                return results, last_key, False
+
+        return results, last_key, bound is not None
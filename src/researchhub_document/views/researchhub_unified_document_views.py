@@ -1,8 +1,8 @@
 from time import perf_counter
 
-from dateutil import parser
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
+from django.db.models import F
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import status
 from rest_framework.decorators import action
@@ -16,6 +16,7 @@ from discussion.reaction_serializers import VoteSerializer as GrmVoteSerializer
 from hypothesis.models import Hypothesis
 from paper.models import Paper
 from paper.utils import get_cache_key
+from researchhub_document.feed_index import FeedIndexQuery, encode_feed_index_cursor
 from researchhub_document.filters import UnifiedDocumentFilter
 from researchhub_document.models import (
     FeaturedContent,
@@ -40,14 +41,29 @@ from researchhub_document.serializers import (
     ResearchhubUnifiedDocumentSerializer,
 )
 from researchhub_document.utils import get_doc_type_key, reset_unified_document_cache
+from researchhub_document.views.custom.subscribed_feed import (
+    SubscribedFeedMerger,
+    get_subscribed_feed_sort_field,
+)
 from researchhub_document.views.custom.unified_document_pagination import (
-    UNIFIED_DOC_PAGE_SIZE,
     UnifiedDocPagination,
 )
 from user.permissions import IsModerator
 from user.utils import reset_latest_acitvity_cache
 from utils.permissions import ReadOnly
 
+SUBSCRIBED_FEED_INCLUDE_FIELDS = [
+    "id",
+    "created_date",
+    "documents",
+    "document_type",
+    "hot_score",
+    "hot_score_v2",
+    "reviews",
+    "score",
+    "bounties",
+]
+
 
 class ResearchhubUnifiedDocumentViewSet(ModelViewSet):
     permission_classes = [
@@ -355,6 +371,9 @@ class ResearchhubUnifiedDocumentViewSet(ModelViewSet):
             "bounties",
             "concepts",
         ]
+        self.dynamic_serializer_class.prefetch_instances(
+            page, context, _include_fields=_include_fields
+        )
         serializer = self.dynamic_serializer_class(
             page,
             _include_fields=_include_fields,
@@ -375,6 +394,8 @@ class ResearchhubUnifiedDocumentViewSet(ModelViewSet):
 
         if subscribed_hubs == "true" and not is_anonymous:
             return self._get_subscribed_unified_documents(request)
+        elif "cursor" in query_params:
+            return self._get_indexed_unified_documents(request)
 
         document_request_type = query_params.get("type", "all")
         hub_id = query_params.get("hub_id", 0) or 0
@@ -405,20 +426,24 @@ class ResearchhubUnifiedDocumentViewSet(ModelViewSet):
         context = self._get_serializer_context()
         context["hub_id"] = hub_id
         page = self.paginate_queryset(documents)
+        _include_fields = [
+            "id",
+            "created_date",
+            "documents",
+            "document_type",
+            "hot_score",
+            "hot_score_v2",
+            "reviews",
+            "score",
+            "bounties",
+            "concepts",
+        ]
+        self.dynamic_serializer_class.prefetch_instances(
+            page, context, _include_fields=_include_fields
+        )
         serializer = self.dynamic_serializer_class(
             page,
-            _include_fields=[
-                "id",
-                "created_date",
-                "documents",
-                "document_type",
-                "hot_score",
-                "hot_score_v2",
-                "reviews",
-                "score",
-                "bounties",
-                "concepts",
-            ],
+            _include_fields=_include_fields,
             many=True,
             context=context,
         )
@@ -431,19 +456,23 @@ class ResearchhubUnifiedDocumentViewSet(ModelViewSet):
         featured_documents = self._get_featured_documents_queryset()
         context = self._get_serializer_context()
         page = self.paginate_queryset(featured_documents)
+        _include_fields = [
+            "id",
+            "created_date",
+            "documents",
+            "document_type",
+            "hot_score",
+            "hot_score_v2",
+            "reviews",
+            "score",
+            "bounties",
+        ]
+        self.dynamic_serializer_class.prefetch_instances(
+            page, context, _include_fields=_include_fields
+        )
         serializer = self.dynamic_serializer_class(
             page,
-            _include_fields=[
-                "id",
-                "created_date",
-                "documents",
-                "document_type",
-                "hot_score",
-                "hot_score_v2",
-                "reviews",
-                "score",
-                "bounties",
-            ],
+            _include_fields=_include_fields,
             many=True,
             context=context,
         )
@@ -452,13 +481,19 @@ class ResearchhubUnifiedDocumentViewSet(ModelViewSet):
         return self.get_paginated_response(serializer_data)
 
     def _cache_hit_with_latest_metadata(self, cache_hit):
-        ids = [d["id"] for d in cache_hit["results"]]
+        self._refresh_latest_metadata(cache_hit["results"])
+        return cache_hit
+
+    def _refresh_latest_metadata(self, docs):
+        ids = {d["id"] for d in docs}
         docs_in_cache = ResearchhubUnifiedDocument.all_objects.filter(
             id__in=ids
         ).values("id", "score")
         docs_to_score_map = {d["id"]: d["score"] for d in docs_in_cache}
-        for doc in cache_hit["results"]:
-            doc.score = docs_to_score_map[doc["id"]]
+        for doc in docs:
+            if doc["id"] not in docs_to_score_map:
+                continue
+            doc["score"] = docs_to_score_map[doc["id"]]
 
             if "documents" in doc:
                 documents = doc["documents"]
@@ -466,7 +501,26 @@ class ResearchhubUnifiedDocumentViewSet(ModelViewSet):
                     documents[0]["score"] = docs_to_score_map[doc["id"]]
                 elif isinstance(documents, dict):
                     documents["score"] = docs_to_score_map[doc["id"]]
-        return cache_hit
+        return docs
+
+    def _get_subscribed_cache_hits(
+        self, merger, document_type, filtering, hub_ids, time_scope
+    ):
+        cache_keys = [
+            get_cache_key("hub", f"{document_type}_{hub_id}_{filtering}_{time_scope}")
+            for hub_id in hub_ids
+        ]
+        cache_hits = [hit for hit in cache.get_many(cache_keys).values() if hit]
+        docs = [doc for cache_hit in cache_hits for doc in cache_hit["results"]]
+        self._refresh_latest_metadata(docs)
+        if docs and merger.sort_field not in docs[0]:
+            # The document_filter columns are not serialized
+            merger.sort_values = dict(
+                ResearchhubUnifiedDocument.all_objects.filter(
+                    id__in={doc["id"] for doc in docs}
+                ).values_list("id", merger.sort_field)
+            )
+        return cache_hits
 
     def _get_subscribed_unified_documents(self, request):
         hub_ids = request.user.subscribed_hubs.values_list("id", flat=True)
@@ -476,79 +530,171 @@ class ResearchhubUnifiedDocumentViewSet(ModelViewSet):
         filtering = query_params.get("ordering", HOT)
         tags = query_params.get("tags", None)
         page_number = int(query_params.get("page", 1))
+        cursor = query_params.get("cursor", None)
+
+        if page_number > 1 and not cursor:
+            # Page number links predate cursor pagination
+            return self._get_paginated_subscribed_documents()
+
+        merger = SubscribedFeedMerger(
+            get_subscribed_feed_sort_field(filtering, time_scope)
+        )
+        after_key = merger.decode_cursor(cursor) if cursor else None
 
-        all_documents = {}
+        results = []
+        needs_fallback = True
+        last_key = after_key
         if not tags:
-            for hub_id in hub_ids:
-                cache_hit = self._get_unified_document_cache_hit(
-                    document_request_type,
-                    filtering,
-                    hub_id,
-                    page_number,
-                    time_scope,
+            cache_hits = self._get_subscribed_cache_hits(
+                merger, document_request_type, filtering, hub_ids, time_scope
+            )
+            if cache_hits:
+                results, last_key, needs_fallback = merger.merge(
+                    cache_hits, after_key=after_key
                 )
+            elif not cursor:
+                return self._get_paginated_subscribed_documents()
 
-                if cache_hit:
-                    cache_hit = self._cache_hit_with_latest_metadata(cache_hit)
-                    for doc in cache_hit["results"]:
-                        if doc["id"] not in all_documents:
-                            all_documents[doc["id"]] = doc
-
-        all_documents = list(all_documents.values())
-        if len(all_documents) == 0:
-            all_documents = self.get_filtered_queryset()
-
-            context = self._get_serializer_context()
-            page = self.paginate_queryset(all_documents)
-            serializer = self.dynamic_serializer_class(
-                page,
-                _include_fields=[
-                    "id",
-                    "created_date",
-                    "documents",
-                    "document_type",
-                    "hot_score",
-                    "hot_score_v2",
-                    "reviews",
-                    "score",
-                    "bounties",
-                ],
-                many=True,
-                context=context,
+        if needs_fallback:
+            fallback_results, fallback_key = self._get_subscribed_documents_after(
+                merger, last_key, merger.page_size - len(results)
             )
-            serializer_data = serializer.data
-            return self.get_paginated_response(serializer_data)
+            results += fallback_results
+            last_key = fallback_key or last_key
 
-        else:
-            ordering = query_params.get("ordering", None)
-            if ordering == UPVOTED:
-                sort_key = "score"
-            elif ordering == DISCUSSED:
-                sort_key = "hot_score_v2"
-            elif ordering == NEW:
-                sort_key = "created_date"
-            else:
-                sort_key = "hot_score_v2"
-
-            def compare(doc):
-                if sort_key == "created_date":
-                    return -parser.parse(doc["created_date"]).timestamp()
-                else:
-                    return -doc[sort_key]
-
-            all_documents = sorted(all_documents, key=compare)
-            all_documents = all_documents[:UNIFIED_DOC_PAGE_SIZE]
-            next_page = request.build_absolute_uri()
-            if len(all_documents) < UNIFIED_DOC_PAGE_SIZE:
-                next_page = None
-            else:
-                next_page = replace_query_param(next_page, "page", 2)
-            res = {
-                "count": len(all_documents),
-                "next": next_page,
-                "results": all_documents,
-            }
-            return Response(res, status=status.HTTP_200_OK)
+        next_page = None
+        if len(results) == merger.page_size:
+            next_page = replace_query_param(
+                request.build_absolute_uri(), "cursor", merger.encode_cursor(last_key)
+            )
+        res = {
+            "count": len(results),
+            "next": next_page,
+            "results": results,
+        }
+        return Response(res, status=status.HTTP_200_OK)
+
+    def _get_indexed_unified_documents(self, request):
+        """
+        Feed page read from the FeedEntry index with keyset pagination.
+        An empty `cursor` requests the first page.
+        """
+        query_params = request.query_params
+        try:
+            hub_id = int(query_params.get("hub_id", 0) or 0)
+        except ValueError:
+            return Response(
+                {"message": "Invalid hub_id"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        feed = FeedIndexQuery(
+            self.paginator.get_page_size(request),
+            hub_id=hub_id,
+            document_type=query_params.get("type", "all"),
+            ordering=query_params.get("ordering", HOT),
+            time_scope=query_params.get("time", "today"),
+            tags=query_params.get("tags", None),
+            ignore_excluded="ignore_excluded" in query_params,
+        )
+        cursor = query_params.get("cursor")
+        after_key = feed.decode_cursor(cursor) if cursor else None
+        if cursor and after_key is None:
+            return Response(
+                {"message": "Invalid cursor"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        ids, last_key = feed.get_page(after_key)
+        documents = ResearchhubUnifiedDocument.objects.in_bulk(ids)
+        page = [documents[doc_id] for doc_id in ids if doc_id in documents]
+
+        context = self._get_serializer_context()
+        context["hub_id"] = feed.hub_id
+        _include_fields = [
+            "id",
+            "created_date",
+            "documents",
+            "document_type",
+            "hot_score",
+            "hot_score_v2",
+            "reviews",
+            "score",
+            "bounties",
+            "concepts",
+        ]
+        self.dynamic_serializer_class.prefetch_instances(
+            page, context, _include_fields=_include_fields
+        )
+        serializer = self.dynamic_serializer_class(
+            page,
+            _include_fields=_include_fields,
+            many=True,
+            context=context,
+        )
+
+        next_page = None
+        if last_key is not None:
+            next_page = replace_query_param(
+                request.build_absolute_uri(),
+                "cursor",
+                encode_feed_index_cursor(last_key),
+            )
+        res = {
+            "count": len(page),
+            "next": next_page,
+            "results": serializer.data,
+        }
+        return Response(res, status=status.HTTP_200_OK)
+
+    def _get_paginated_subscribed_documents(self):
+        documents = self.get_filtered_queryset()
+        context = self._get_serializer_context()
+        page = self.paginate_queryset(documents)
+        self.dynamic_serializer_class.prefetch_instances(
+            page, context, _include_fields=SUBSCRIBED_FEED_INCLUDE_FIELDS
+        )
+        serializer = self.dynamic_serializer_class(
+            page,
+            _include_fields=SUBSCRIBED_FEED_INCLUDE_FIELDS,
+            many=True,
+            context=context,
+        )
+        return self.get_paginated_response(serializer.data)
+
+    def _get_subscribed_documents_after(self, merger, after_key, limit):
+        """
+        Returns the serialized documents following `after_key`, ordered by
+        the merger's sort field, and the sort key of the last one.
+        """
+        if limit <= 0:
+            return [], None
+
+        documents = self.get_filtered_queryset().annotate(
+            feed_sort_value=F(merger.sort_field)
+        )
+        if after_key is not None:
+            documents = documents.filter(merger.get_db_keyset_filter(after_key))
+        documents = documents.order_by(f"-{merger.sort_field}", "-id").distinct()
+        page = list(documents[:limit])
+        if not page:
+            return [], None
+
+        last_document = page[-1]
+        merger.sort_values[last_document.id] = last_document.feed_sort_value
+        last_key = merger.get_sort_key({"id": last_document.id})
+
+        context = self._get_serializer_context()
+        page = self.dynamic_serializer_class.prefetch_instances(
+            page,
+            context,
+            _include_fields=SUBSCRIBED_FEED_INCLUDE_FIELDS,
+        )
+        serializer = self.dynamic_serializer_class(
+            page,
+            _include_fields=SUBSCRIBED_FEED_INCLUDE_FIELDS,
+            many=True,
+            context=context,
+        )
+        return list(serializer.data), last_key
 
     @action(detail=True, methods=["post"], permission_classes=[IsModerator])
     def exclude_from_feed(self, request, pk=None):
@@ -7,10 +7,19 @@ from django_elasticsearch_dsl.signals import (
 )
 
 import utils.sentry as sentry
+from search.indexing_queue import (
+    INDEX_QUEUE_UPDATE,
+    INDEX_QUEUE_UPDATE_RELATED,
+    enqueue_index_update,
+)
 
 
 class CelerySignalProcessor(RealTimeSignalProcessor):
-
+    """
+    Queues saved objects for the periodic bulk flush in
+    `search.tasks.flush_search_index_queue` instead of indexing them
+    one by one.
+    """
 
     def handle_save(self, sender, instance, **kwargs):
         pk = instance.pk
@@ -19,17 +28,14 @@ class CelerySignalProcessor(RealTimeSignalProcessor):
         model_name = model.__name__
 
         if model in registry._models:
-            self.registry_update_task.apply_async(
-                (pk, app_label, model_name),
-                countdown=30
-            )
+            enqueue_index_update(INDEX_QUEUE_UPDATE, app_label, model_name, pk)
 
         if model in registry._related_models:
-            self.registry_update_related_task.apply_async(
-                (pk, app_label, model_name),
-                countdown=30
+            enqueue_index_update(
+                INDEX_QUEUE_UPDATE_RELATED, app_label, model_name, pk
             )
 
+    # Kept so messages queued before the switch to the flush are consumed
     @shared_task(ignore_result=True)
     def registry_update_task(pk, app_label, model_name):
         try:
@@ -3,6 +3,8 @@ from django.db import models
 
 import utils.sentry as sentry
 
+DEFAULT_INDEX_BATCH_SIZE = 250
+
 
 class BaseDocument(Document):
 
@@ -13,6 +15,27 @@ class BaseDocument(Document):
     def should_remove_from_index(self, obj):
         return False
 
+    """
+    Override to load data shared by a page of objects (grouped counts,
+    prefetches) before the page is serialized
+    """
+    def prepare_batch(self, objects):
+        pass
+
+    def _get_batch_size(self):
+        return self.django.queryset_pagination or DEFAULT_INDEX_BATCH_SIZE
+
+    def _iter_batches(self, object_list):
+        batch_size = self._get_batch_size()
+        batch = []
+        for obj in object_list:
+            batch.append(obj)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
     """
     Overriding parent method to include an additional bulk
     operation for removing objects from elastic who are removed
@@ -29,28 +52,35 @@ class BaseDocument(Document):
         else:
             object_list = thing
 
-        objects_to_remove = []
-        objects_to_index = []
-        for obj in object_list:
-            if self.should_remove_from_index(obj):
-                objects_to_remove.append(obj)
-            else:
-                objects_to_index.append(obj)
-
-        try:
-            self._bulk(
-                self._get_actions(objects_to_index, action='index'),
-                parallel=parallel,
-                **kwargs
-            )
-            self._bulk(
-                self._get_actions(objects_to_remove, action='delete'),
-                parallel=parallel,
-                **kwargs
-            )
-        except ConnectionError as e:
-            sentry.log_info(e)
-        except Exception as e:
-            # The likely scenario is the result of removing objects
-            # that do not exist in elastic search - 404s
-            pass
\ No newline at end of file
+        for batch in self._iter_batches(object_list):
+            objects_to_remove = []
+            objects_to_index = []
+            for obj in batch:
+                if self.should_remove_from_index(obj):
+                    objects_to_remove.append(obj)
+                else:
+                    objects_to_index.append(obj)
+
+            try:
+                self.prepare_batch(objects_to_index)
+            except Exception as e:
+                # Fields fall back to their per-object properties
+                sentry.log_error(e)
+
+            try:
+                self._bulk(
+                    self._get_actions(objects_to_index, action='index'),
+                    parallel=parallel,
+                    **kwargs
+                )
+                self._bulk(
+                    self._get_actions(objects_to_remove, action='delete'),
+                    parallel=parallel,
+                    **kwargs
+                )
+            except ConnectionError as e:
+                sentry.log_info(e)
+            except Exception as e:
+                # The likely scenario is the result of removing objects
+                # that do not exist in elastic search - 404s
+                pass
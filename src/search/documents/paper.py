@@ -1,6 +1,11 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count, Q
 from django_elasticsearch_dsl import fields as es_fields
 from django_elasticsearch_dsl.registries import registry
 
+from discussion.models import Thread
+from discussion.reaction_models import Vote
+from hub.serializers import HubSerializer
 from paper.models import Paper
 from .base import BaseDocument
 
@@ -63,3 +68,74 @@ class PaperDocument(BaseDocument):
 
         return False
 
+    def get_queryset(self):
+        return Paper.objects.select_related("summary").prefetch_related(
+            "hubs", "authors"
+        )
+
+    def prepare_batch(self, papers):
+        """
+        Computes the aggregate fields of a page of papers with grouped
+        queries instead of a few queries per paper.
+        """
+        paper_ids = [paper.id for paper in papers]
+        if not paper_ids:
+            return
+
+        scores = self._get_scores(paper_ids)
+        discussion_counts = self._get_discussion_counts(paper_ids)
+        # Papers of a page share most of their hubs, serialize each once
+        hub_payloads = {}
+        for paper in papers:
+            paper._index_score = scores.get(paper.id, 0)
+            paper._index_discussion_count = discussion_counts.get(paper.id, 0)
+            paper._index_hubs = []
+            for hub in paper.hubs.all():
+                if hub.id not in hub_payloads:
+                    hub_payloads[hub.id] = HubSerializer(hub).data
+                paper._index_hubs.append(hub_payloads[hub.id])
+
+    def _get_scores(self, paper_ids):
+        # Mirrors AbstractGenericReactionModel.calculate_score
+        votes = (
+            Vote.objects.filter(
+                content_type=ContentType.objects.get_for_model(Paper),
+                object_id__in=paper_ids,
+                created_by__is_suspended=False,
+                created_by__probable_spammer=False,
+            )
+            .values("object_id")
+            .annotate(
+                score=Count("id", filter=Q(vote_type=Vote.UPVOTE))
+                - Count("id", filter=Q(vote_type=Vote.DOWNVOTE))
+            )
+        )
+        return {vote["object_id"]: vote["score"] for vote in votes}
+
+    def _get_discussion_counts(self, paper_ids):
+        rows = (
+            Thread.objects.filter(paper_id__in=paper_ids)
+            .values("paper_id")
+            .annotate(**Paper.get_discussion_count_aggregates())
+        )
+        return {
+            row["paper_id"]: row["thread_count"]
+            + row["comment_count"]
+            + row["reply_count"]
+            for row in rows
+        }
+
+    def prepare_score(self, instance):
+        if hasattr(instance, "_index_score"):
+            return instance._index_score
+        return instance.score_indexing
+
+    def prepare_discussion_count(self, instance):
+        if hasattr(instance, "_index_discussion_count"):
+            return instance._index_discussion_count
+        return instance.discussion_count_indexing
+
+    def prepare_hubs(self, instance):
+        if hasattr(instance, "_index_hubs"):
+            return instance._index_hubs
+        return instance.hubs_indexing
@@ -0,0 +1,174 @@
+import time
+from collections import defaultdict
+
+from django.apps import apps
+from django.core.cache import cache
+from django_elasticsearch_dsl.registries import registry
+
+import utils.sentry as sentry
+from utils.cache_queue import CacheQueue
+
+INDEX_QUEUE_UPDATE = "update"
+INDEX_QUEUE_UPDATE_RELATED = "update_related"
+
+INDEX_QUEUE_CHUNK_SIZE = 250
+INDEX_QUEUE_MAX_FLUSH_SIZE = 20000
+INDEX_QUEUE_PENDING_TIMEOUT = 60 * 10
+INDEX_QUEUE_SLOT_TIMEOUT = 60 * 60 * 24
+INDEX_QUEUE_LOCK_TIMEOUT = 60 * 5
+# Flushes an entry may fail before it is dropped
+INDEX_QUEUE_MAX_ATTEMPTS = 3
+
+INDEX_QUEUE_COUNTERS = (
+    "enqueued",
+    "coalesced",
+    "flushed",
+    "flush_runs",
+    "failed",
+    "retried",
+    "dropped",
+)
+INDEX_QUEUE_GAUGES = ("last_batch_size", "last_max_lag_seconds")
+INDEX_QUEUE_METRICS = INDEX_QUEUE_COUNTERS + INDEX_QUEUE_GAUGES
+
+index_queue = CacheQueue(
+    "search_index_queue",
+    INDEX_QUEUE_METRICS,
+    slot_timeout=INDEX_QUEUE_SLOT_TIMEOUT,
+    lock_timeout=INDEX_QUEUE_LOCK_TIMEOUT,
+)
+
+
+def _get_pending_key(kind, app_label, model_name, pk):
+    return index_queue.get_key(f"pending_{kind}_{app_label}_{model_name}_{pk}")
+
+
+def incr_index_queue_metric(metric, delta=1):
+    return index_queue.incr_metric(metric, delta)
+
+
+def get_index_queue_metrics():
+    return index_queue.get_metrics()
+
+
+def reset_index_queue_metrics():
+    index_queue.reset_metrics()
+
+
+def enqueue_index_update(kind, app_label, model_name, pk):
+    """
+    Marks an object as dirty for the next index flush. An object that is
+    already waiting to be flushed is not queued a second time, so a burst
+    of saves on the same row costs a single reindex.
+    """
+    pending_key = _get_pending_key(kind, app_label, model_name, pk)
+    if not cache.add(pending_key, 0, timeout=INDEX_QUEUE_PENDING_TIMEOUT):
+        # The marker holds the slot index once it is known. A marker whose
+        # slot the flusher has already passed belongs to a lost slot, so it
+        # must not swallow this update.
+        index = cache.get(pending_key)
+        if not index or index > index_queue.get_head():
+            incr_index_queue_metric("coalesced")
+            return False
+
+    index = index_queue.push((kind, app_label, model_name, pk, time.time()))
+    cache.set(pending_key, index, timeout=INDEX_QUEUE_PENDING_TIMEOUT)
+    incr_index_queue_metric("enqueued")
+    return True
+
+
+class IndexQueueFlusher:
+    """
+    Drains the dirty object queue filled by `enqueue_index_update`.
+
+    Entries are grouped per model and loaded with one query per chunk
+    through each document's own queryset, then written with a single bulk
+    request per document and chunk.
+    """
+
+    def __init__(self, chunk_size=INDEX_QUEUE_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+
+    def _group_entries(self, entries):
+        """
+        Returns {(kind, app_label, model_name): {pk: (enqueued_at, attempts)}}.
+        """
+        grouped = defaultdict(dict)
+        pending_keys = []
+        now = time.time()
+        max_lag = 0
+        for kind, app_label, model_name, pk, enqueued_at, *rest in entries:
+            # Entries queued before retries were counted have no attempts
+            attempts = rest[0] if rest else 0
+            pks = grouped[(kind, app_label, model_name)]
+            if pk not in pks or pks[pk][1] < attempts:
+                pks[pk] = (enqueued_at, attempts)
+            pending_keys.append(_get_pending_key(kind, app_label, model_name, pk))
+            max_lag = max(max_lag, now - enqueued_at)
+
+        # Clear the markers before loading rows so saves landing during the
+        # flush are queued again instead of being coalesced into it
+        cache.delete_many(pending_keys)
+        index_queue.set_metric("last_max_lag_seconds", int(max_lag))
+        return grouped
+
+    def _update(self, model, pks):
+        for doc in registry.get_documents([model]):
+            if doc.django.ignore_signals:
+                continue
+            doc_instance = doc()
+            for i in range(0, len(pks), self.chunk_size):
+                chunk = pks[i : i + self.chunk_size]
+                doc_instance.update(doc_instance.get_queryset().filter(pk__in=chunk))
+
+    def _update_related(self, model, pks):
+        for i in range(0, len(pks), self.chunk_size):
+            instances = model._default_manager.in_bulk(pks[i : i + self.chunk_size])
+            for instance in instances.values():
+                registry.update_related(instance)
+
+    def _retry(self, kind, app_label, model_name, pks):
+        for pk, (enqueued_at, attempts) in pks.items():
+            if attempts + 1 >= INDEX_QUEUE_MAX_ATTEMPTS:
+                incr_index_queue_metric("dropped")
+                continue
+            index_queue.push(
+                (kind, app_label, model_name, pk, enqueued_at, attempts + 1)
+            )
+            incr_index_queue_metric("retried")
+
+    def flush(self, max_size=INDEX_QUEUE_MAX_FLUSH_SIZE):
+        """
+        Indexes the next `max_size` entries. The head only moves past them
+        once they are processed, so a flush that dies part way is read
+        again by the next one. Entries of a failing model are queued again
+        until they have failed INDEX_QUEUE_MAX_ATTEMPTS times.
+        """
+        head, tail = index_queue.get_range(max_size)
+        if tail <= head:
+            return 0
+
+        entries = index_queue.read(head, tail)
+        grouped = self._group_entries(entries)
+
+        for (kind, app_label, model_name), pks in grouped.items():
+            try:
+                model = apps.get_model(app_label, model_name)
+                if kind == INDEX_QUEUE_UPDATE_RELATED:
+                    self._update_related(model, list(pks))
+                else:
+                    self._update(model, list(pks))
+            except Exception as e:
+                incr_index_queue_metric("failed", len(pks))
+                sentry.log_error(e)
+                self._retry(kind, app_label, model_name, pks)
+
+        index_queue.advance(head, tail)
+        incr_index_queue_metric("flushed", len(entries))
+        incr_index_queue_metric("flush_runs")
+        index_queue.set_metric("last_batch_size", len(entries))
+        return len(entries)
+
+
+def flush_index_queue():
+    return index_queue.run_exclusively(IndexQueueFlusher().flush)
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Max, Min
+
+from paper.models import Paper
+from search.documents.paper import PaperDocument
+from search.tasks import index_papers_range
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--shard-size",
+            type=int,
+            default=10000,
+            help="Range of paper ids indexed by one task",
+        )
+        parser.add_argument(
+            "--sync",
+            action="store_true",
+            help="Index the shards in this process instead of on the workers",
+        )
+
+    def handle(self, *args, **options):
+        shard_size = options["shard_size"]
+        bounds = Paper.objects.aggregate(min_id=Min("id"), max_id=Max("id"))
+        if bounds["min_id"] is None:
+            print("No papers to index")
+            return
+
+        shards = range(bounds["min_id"], bounds["max_id"] + 1, shard_size)
+        for start_id in shards:
+            end_id = start_id + shard_size
+            if options["sync"]:
+                index_papers_range(start_id, end_id)
+                print(f"Indexed papers {start_id} - {end_id}")
+            else:
+                index_papers_range.apply_async((start_id, end_id), priority=5)
+
+        if options["sync"]:
+            PaperDocument._index.refresh()
+            print("Done")
+        else:
+            print(f"Queued {len(shards)} shards")
@@ -0,0 +1,7 @@
+from search.indexing_queue import get_index_queue_metrics, reset_index_queue_metrics
+from utils.management import MetricsCommand
+
+
+class Command(MetricsCommand):
+    get_metrics = staticmethod(get_index_queue_metrics)
+    reset_metrics = staticmethod(reset_index_queue_metrics)
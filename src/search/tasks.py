@@ -1,7 +1,11 @@
+from celery.decorators import periodic_task
+from celery.task.schedules import crontab
+
 from oauth.utils import get_orcid_works, check_doi_in_works
 from paper.models import Paper
 from paper.utils import download_pdf
-from researchhub.celery import app
+from researchhub.celery import QUEUE_ELASTIC_SEARCH, app
+from search.indexing_queue import flush_index_queue
 from utils.orcid import orcid_api
 from user.models import Author
 from purchase.models import Wallet
@@ -105,3 +109,27 @@ def get_or_create_orcid_author(orcid_id, first_name, last_name, paper):
     )
     if paper is not None:
         paper.authors.add(author)
+
+
+@periodic_task(
+    run_every=crontab(minute="*"),
+    priority=3,
+    queue=QUEUE_ELASTIC_SEARCH,
+)
+def flush_search_index_queue():
+    flush_index_queue()
+
+
+@app.task(queue=QUEUE_ELASTIC_SEARCH)
+def index_papers_range(start_id, end_id):
+    from search.documents.paper import PaperDocument
+
+    document = PaperDocument()
+    papers = (
+        document.get_queryset()
+        .filter(id__gte=start_id, id__lt=end_id)
+        .order_by("id")
+        .iterator(chunk_size=document._get_batch_size())
+    )
+    # Refreshing once per shard would dominate a full rebuild
+    document.update(papers, refresh=False)
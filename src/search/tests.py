@@ -0,0 +1,119 @@
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+from elasticsearch_dsl.response import Response
+from rest_framework import serializers
+
+from search.indexing_queue import (
+    INDEX_QUEUE_MAX_ATTEMPTS,
+    INDEX_QUEUE_UPDATE,
+    IndexQueueFlusher,
+    enqueue_index_update,
+    flush_index_queue,
+    get_index_queue_metrics,
+)
+from search.views.combined import CombinedView
+
+
+class RecordingFlusher(IndexQueueFlusher):
+    """Records updates instead of writing to Elasticsearch."""
+
+    def __init__(self, fail=False):
+        super().__init__()
+        self.fail = fail
+        self.updated = []
+
+    def _update(self, model, pks):
+        if self.fail:
+            raise ValueError("Index unavailable")
+        self.updated.append((model.__name__, pks))
+
+
+class IndexQueueTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_flush_coalesces_and_groups_updates(self):
+        enqueue_index_update(INDEX_QUEUE_UPDATE, "paper", "Paper", 1)
+        enqueue_index_update(INDEX_QUEUE_UPDATE, "paper", "Paper", 2)
+        enqueue_index_update(INDEX_QUEUE_UPDATE, "paper", "Paper", 1)
+
+        flusher = RecordingFlusher()
+        self.assertEqual(flusher.flush(), 2)
+        self.assertEqual(flusher.updated, [("Paper", [1, 2])])
+
+        metrics = get_index_queue_metrics()
+        self.assertEqual(metrics["coalesced"], 1)
+        self.assertEqual(metrics["backlog"], 0)
+
+    def test_failed_updates_are_retried_then_dropped(self):
+        enqueue_index_update(INDEX_QUEUE_UPDATE, "paper", "Paper", 1)
+
+        flusher = RecordingFlusher(fail=True)
+        flusher.flush()
+        metrics = get_index_queue_metrics()
+        self.assertEqual(metrics["retried"], 1)
+        self.assertEqual(metrics["backlog"], 1)
+
+        for _ in range(INDEX_QUEUE_MAX_ATTEMPTS - 1):
+            flusher.flush()
+        metrics = get_index_queue_metrics()
+        self.assertEqual(metrics["failed"], INDEX_QUEUE_MAX_ATTEMPTS)
+        self.assertEqual(metrics["dropped"], 1)
+        self.assertEqual(metrics["backlog"], 0)
+
+    def test_flush_index_queue_drains_the_queue(self):
+        # No document is registered for DocumentFilter, so nothing is sent
+        enqueue_index_update(
+            INDEX_QUEUE_UPDATE, "researchhub_document", "DocumentFilter", 1
+        )
+
+        self.assertEqual(flush_index_queue(), 1)
+        self.assertEqual(get_index_queue_metrics()["backlog"], 0)
+        self.assertEqual(flush_index_queue(), 0)
+
+
+class HitSerializer(serializers.BaseSerializer):
+    def to_representation(self, obj):
+        return {"index": obj.meta.index, "id": obj.meta.id}
+
+
+class RecordingCombinedView(CombinedView):
+    """Answers every entity search with two hits instead of querying ES."""
+
+    serializer_class = HitSerializer
+    searches = []
+
+    def execute_searches(self, searches):
+        RecordingCombinedView.searches = searches
+        return [
+            Response(
+                search,
+                {
+                    "hits": {
+                        "hits": [
+                            {"_index": search._index[0], "_id": str(i), "_source": {}}
+                            for i in range(2)
+                        ]
+                    }
+                },
+            )
+            for search in searches
+        ]
+
+
+class CombinedSearchTests(TestCase):
+    def test_returns_a_slice_per_entity_from_one_multi_search(self):
+        request = RequestFactory().get("/api/search/all/", {"search": "cancer"})
+        response = RecordingCombinedView.as_view()(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.data), ["paper", "post", "person", "hub"])
+        for entity, hits in response.data.items():
+            self.assertEqual(
+                hits, [{"index": entity, "id": "0"}, {"index": entity, "id": "1"}]
+            )
+
+        for search in RecordingCombinedView.searches:
+            query = search.to_dict()
+            self.assertEqual(query["from"], 0)
+            self.assertEqual(query["size"], CombinedView.max_results_per_entity)
@@ -12,7 +12,7 @@ from django_elasticsearch_dsl_drf.filter_backends import (
     SearchFilterBackend,
     SuggesterFilterBackend,
 )
-from elasticsearch_dsl import Search
+from elasticsearch_dsl import MultiSearch, Search
 from rest_framework.generics import ListAPIView
 from rest_framework.response import Response
 
@@ -50,38 +50,29 @@ class CombinedView(ListAPIView):
     def get_queryset(self):
         return
 
+    def execute_searches(self, searches):
+        # One _msearch round trip, with the per entity limit applied in ES
+        multi_search = MultiSearch()
+        for search in searches:
+            multi_search = multi_search.add(search)
+        return multi_search.execute()
+
     def list(self, request, *args, **kwargs):
-        response = {
-            "paper": [],
-            "post": [],
-            "person": [],
-            "hub": [],
+        entity_views = {
+            "paper": self.paper_view,
+            "post": self.post_view,
+            "person": self.person_view,
+            "hub": self.hub_view,
         }
 
-        papers_es_res = self.paper_view._filter_queryset(
-            request,
-        )
-        post_es_res = self.post_view._filter_queryset(
-            request,
-        )
-        person_es_res = self.person_view._filter_queryset(
-            request,
-        )
-        hub_es_res = self.hub_view._filter_queryset(
-            request,
-        )
-
-        response["paper"] = self.get_serializer(papers_es_res, many=True).data[
-            0 : self.max_results_per_entity
-        ]
-        response["post"] = self.get_serializer(post_es_res, many=True).data[
-            0 : self.max_results_per_entity
-        ]
-        response["person"] = self.get_serializer(person_es_res, many=True).data[
-            0 : self.max_results_per_entity
-        ]
-        response["hub"] = self.get_serializer(hub_es_res, many=True).data[
-            0 : self.max_results_per_entity
+        searches = [
+            view._filter_queryset(request)[0 : self.max_results_per_entity]
+            for view in entity_views.values()
         ]
+        responses = self.execute_searches(searches)
+
+        response = {}
+        for entity, es_res in zip(entity_views.keys(), responses):
+            response[entity] = self.get_serializer(es_res, many=True).data
 
         return Response(response)
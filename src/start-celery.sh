@@ -1 +1 @@
-celery -A researchhub worker -Q default,paper_metadata,caches,hot_score,elastic_search,external_reporting,notifications,paper_misc,cermine,twitter,pull_papers,logs,purchases,contributions,author_claim,bounties -l info --prefetch-multiplier=1 -P prefork
+celery -A researchhub worker -Q default,paper_metadata,caches,hot_score,elastic_search,external_reporting,notifications,paper_misc,cermine,twitter,pull_papers,logs,purchases,contributions,author_claim,bounties,sift -l info --prefetch-multiplier=1 -P prefork
@@ -21,7 +21,7 @@ from reputation.models import Contribution
 from reputation.tasks import create_contribution
 from utils.permissions import CreateOrUpdateIfAllowed
 from utils.throttles import THROTTLE_CLASSES
-from utils.siftscience import events_api, update_user_risk_score
+from utils.siftscience import events_api
 # TODO: Add flagging actions and permissions
 
 
@@ -166,13 +166,12 @@ class SummaryViewSet(viewsets.ModelViewSet):
             created_location=created_location
         )
 
-        tracked_summary = events_api.track_content_summary(
+        events_api.track_content_summary(
             user,
             new_summary,
             request,
             update=bool(previous_summary)
         )
-        update_user_risk_score(user, tracked_summary)
 
         return new_summary
 
@@ -9,7 +9,7 @@ from django.contrib.contenttypes.models import ContentType
 
 from hub.models import Hub
 from purchase.related_models.constants.rsc_exchange_currency import COIN_GECKO, USD
-from purchase.related_models.rsc_exchange_rate_model import RscExchangeRate
+from purchase.rsc_price import get_latest_rsc_rate, record_rsc_exchange_rate
 from reputation.distributions import Distribution  # this is NOT the model
 from reputation.related_models.distribution import Distribution as DistributionModel
 from researchhub.settings import APP_ENV, MORALIS_API_KEY, WEB3_RSC_ADDRESS
@@ -95,25 +95,25 @@ def editor_daily_payout_task():
 
 
 def get_daily_rsc_payout_amount_from_coin_gecko(num_days_this_month):
-    recent_coin_gecko_rate = RscExchangeRate.objects.filter(
-        price_source=COIN_GECKO,
-        # greater than "TODAY" 2:50PM PST. Coin gecko prices are recorded every hr.
-        # Current script should run at 3:02PM PST.
-        created_date__gte=datetime.datetime.now().replace(hour=14, minute=50),
-    ).first()
-
-    if recent_coin_gecko_rate is None:
+    recent_coin_gecko_rate = get_latest_rsc_rate(USD, price_source=COIN_GECKO)
+    # greater than "TODAY" 2:50PM PST. Coin gecko prices are recorded every hr.
+    # Current script should run at 3:02PM PST.
+    recent_cutoff = datetime.datetime.now().replace(hour=14, minute=50)
+    if (
+        recent_coin_gecko_rate is None
+        or recent_coin_gecko_rate["created_date"].replace(tzinfo=None) < recent_cutoff
+    ):
         return None
 
     gecko_payout_usd_per_rsc = (
-        recent_coin_gecko_rate.real_rate
-        if recent_coin_gecko_rate.real_rate > USD_PER_RSC_PRICE_FLOOR
+        recent_coin_gecko_rate["real_rate"]
+        if recent_coin_gecko_rate["real_rate"] > USD_PER_RSC_PRICE_FLOOR
         else USD_PER_RSC_PRICE_FLOOR
     )
 
     return {
-        "rate": recent_coin_gecko_rate.rate,
-        "real_rate": recent_coin_gecko_rate.real_rate,
+        "rate": recent_coin_gecko_rate["rate"],
+        "real_rate": recent_coin_gecko_rate["real_rate"],
         "pay_amount": (
             USD_PAY_AMOUNT_PER_MONTH
             * math.pow(gecko_payout_usd_per_rsc, -1)
@@ -145,11 +145,7 @@ def get_daily_rsc_payout_amount_from_deep_index(num_days_this_month):
     }
 
     # Keeping record of exchange rate used today
-    RscExchangeRate.objects.create(
-        rate=result["rate"],
-        real_rate=result["real_rate"],
-        target_currency=USD,
-    )
+    record_rsc_exchange_rate(result["rate"], result["real_rate"], target_currency=USD)
 
     return result
 
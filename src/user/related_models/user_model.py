@@ -3,8 +3,7 @@ import uuid
 from django.contrib.auth.models import AbstractUser, UserManager
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
-from django.db.models import DecimalField, Q, Sum, Value
-from django.db.models.functions import Cast, Coalesce
+from django.db.models import Q
 from django.utils import timezone
 
 from hub.models import Hub
@@ -175,19 +174,29 @@ class User(AbstractUser):
         return balance
 
     def get_balance(self, queryset=None):
-        if queryset is None:
-            queryset = self.get_balance_qs()
-
-        balance = queryset.aggregate(
-            total_balance=Coalesce(
-                Sum(Cast("amount", DecimalField(max_digits=255, decimal_places=128))),
-                Value(0),
-                output_field=DecimalField(),
-            )
+        from purchase.related_models.balance_model import (
+            BalanceCheckpoint,
+            get_withdrawal_content_type,
+            sum_ledger_amounts,
         )
-        total_balance = balance.get("total_balance", 0) or 0
 
-        return total_balance
+        if queryset is not None:
+            return sum_ledger_amounts(queryset)
+
+        # Non-withdrawal rows come from the running checkpoint; withdrawal
+        # rows depend on the withdrawal's paid status and are summed live
+        unpaid_withdrawals = self.withdrawals.filter(
+            paid_status__in=(
+                PaidStatusModelMixin.FAILED,
+                PaidStatusModelMixin.PENDING,
+            )
+        ).values_list("id")
+        withdrawal_balances = self.balances.filter(
+            content_type=get_withdrawal_content_type()
+        ).exclude(object_id__in=unpaid_withdrawals)
+        return BalanceCheckpoint.get_balance(self.id) + sum_ledger_amounts(
+            withdrawal_balances
+        )
 
     def notify_inactivity(self, paper_count=0, comment_count=0):
         recipient = [self.email]
@@ -2,7 +2,7 @@ import json
 import requests
 
 from purchase.related_models.constants.rsc_exchange_currency import COIN_GECKO, USD
-from purchase.related_models.rsc_exchange_rate_model import RscExchangeRate
+from purchase.rsc_price import record_rsc_exchange_rate
 from utils.sentry import log_error
 
 COIN_GECKO_API_KEY = ""  # currently using free version
@@ -16,11 +16,11 @@ COIN_GECKO_LOOKUP_URI = "https://api.coingecko.com/api/v3/simple/price?ids={coin
 def rsc_exchange_rate_record_tasks():
     try:
         gecko_result = get_rsc_price_from_coin_gecko()
-        RscExchangeRate.objects.create(
-            price_source=COIN_GECKO,
-            rate=gecko_result["rate"],
-            real_rate=gecko_result["real_rate"],
+        record_rsc_exchange_rate(
+            gecko_result["rate"],
+            gecko_result["real_rate"],
             target_currency=USD,
+            price_source=COIN_GECKO,
         )
         return gecko_result
     except Exception as error:
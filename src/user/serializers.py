@@ -525,6 +525,16 @@ class DynamicUserSerializer(DynamicModelFieldSerializer):
     benefits_expire_on = SerializerMethodField()
     editor_of = SerializerMethodField()
 
+    related_method_fields = {
+        "author_profile": (
+            (
+                "author_profile",
+                "usr_dus_get_author_profile",
+                "user.serializers.DynamicAuthorSerializer",
+            ),
+        ),
+    }
+
     class Meta:
         model = User
         exclude = ("password",)
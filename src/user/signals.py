@@ -8,6 +8,7 @@ from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.utils.crypto import get_random_string
 from django.utils.text import slugify
+from rest_framework.authtoken.models import Token
 
 from bullet_point.models import BulletPoint
 from bullet_point.models import Vote as BulletPointVote
@@ -31,6 +32,7 @@ from user.tasks import (
     link_author_to_papers,
     link_paper_to_authors,
 )
+from user.utils import invalidate_websocket_token_cache
 from utils.message import send_email_message
 from utils.sentry import log_error
 from utils.siftscience import decisions_api, events_api
@@ -249,3 +251,14 @@ def create_user_organization(sender, instance, created, **kwargs):
                     )
         except Exception as e:
             log_error(e)
+
+
+@receiver(post_save, sender=User, dispatch_uid="invalidate_websocket_user_cache")
+def invalidate_websocket_user_cache(sender, instance, **kwargs):
+    # Suspension, deactivation and profile changes must reach new sockets
+    invalidate_websocket_token_cache(user_id=instance.id)
+
+
+@receiver(post_delete, sender=Token, dispatch_uid="invalidate_websocket_token_cache")
+def invalidate_websocket_token_cache_on_delete(sender, instance, **kwargs):
+    invalidate_websocket_token_cache(user_id=instance.user_id, token_key=instance.key)
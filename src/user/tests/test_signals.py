@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.test import TestCase
 
 from discussion.tests.helpers import create_rh_comment
@@ -5,7 +6,11 @@ from hub.tests.helpers import create_hub
 from paper.tests.helpers import create_paper
 from summary.models import Summary
 from summary.tests.helpers import create_summary
-from user.tests.helpers import create_random_default_user
+from user.tests.helpers import (
+    create_random_authenticated_user,
+    create_random_default_user,
+)
+from user.utils import cache_websocket_token_user, get_websocket_token_user_cache_key
 
 
 class UserSignalsTests(TestCase):
@@ -42,3 +47,23 @@ class UserSignalsTests(TestCase):
 
         action = user.actions.all()[0]
         self.assertIn(hub, action.hubs.all())
+
+    def test_user_save_evicts_websocket_token_cache(self):
+        user = create_random_authenticated_user("socket_user")
+        token_key = user.auth_token.key
+        cache_key = get_websocket_token_user_cache_key(token_key)
+        cache_websocket_token_user(token_key, user)
+        self.assertIsNotNone(cache.get(cache_key))
+
+        user.is_suspended = True
+        user.save(update_fields=["is_suspended"])
+        self.assertIsNone(cache.get(cache_key))
+
+    def test_token_delete_evicts_websocket_token_cache(self):
+        user = create_random_authenticated_user("socket_user_token")
+        token_key = user.auth_token.key
+        cache_key = get_websocket_token_user_cache_key(token_key)
+        cache_websocket_token_user(token_key, user)
+
+        user.auth_token.delete()
+        self.assertIsNone(cache.get(cache_key))
@@ -1,8 +1,45 @@
+from django.core.cache import cache
+
 from user.aggregates import TenPercentile, TwoPercentile
 from user.models import User
 from user.tasks import preload_latest_activity
 from utils.sentry import log_error
 
+# Websocket handshakes resolve tokens through this cache; entries are
+# evicted when the token is deleted or the user is saved
+WEBSOCKET_TOKEN_USER_CACHE_TIMEOUT = 60 * 5
+
+
+def get_websocket_token_user_cache_key(token_key):
+    return f"ws_token_user_{token_key}"
+
+
+def get_websocket_user_token_cache_key(user_id):
+    return f"ws_user_token_{user_id}"
+
+
+def cache_websocket_token_user(token_key, user):
+    cache.set_many(
+        {
+            get_websocket_token_user_cache_key(token_key): user,
+            get_websocket_user_token_cache_key(user.id): token_key,
+        },
+        timeout=WEBSOCKET_TOKEN_USER_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_websocket_token_cache(user_id=None, token_key=None):
+    if token_key is None and user_id is not None:
+        token_key = cache.get(get_websocket_user_token_cache_key(user_id))
+
+    keys = []
+    if token_key is not None:
+        keys.append(get_websocket_token_user_cache_key(token_key))
+    if user_id is not None:
+        keys.append(get_websocket_user_token_cache_key(user_id))
+    if keys:
+        cache.delete_many(keys)
+
 
 def move_paper_to_author(target_paper, target_author, source_author=None):
     target_paper.authors.add(target_author)
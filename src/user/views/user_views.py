@@ -7,7 +7,6 @@ from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.db import IntegrityError, models
 from django.db.models import F, Q, Sum
-from django.db.models.functions import Coalesce
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.utils.decorators import method_decorator
@@ -336,66 +335,26 @@ class UserViewSet(viewsets.ModelViewSet):
             )
 
             if hub_id != 0 and hub_id:
-                items = items.annotate(
-                    hub_rep=Coalesce(
-                        Sum(
-                            "reputation_records__reputation_amount",
-                            filter=Q(
-                                **time_filter,
-                                reputation_records__hubs__in=[hub_id],
-                            )
-                            & ~Q(
-                                reputation_records__distribution_type__in=[
-                                    "REFERRAL",
-                                    "PURCHASE",
-                                    "REWARD",
-                                    "EDITOR_COMPENSATION",
-                                    "EDITOR_PAYOUT",
-                                    "MOD_PAYOUT",
-                                    "CREATE_BULLET_POINT",
-                                    "CREATE_SUMMARY",
-                                    "SUMMARY_UPVOTED",
-                                    "BULLET_POINT_UPVOTED",
-                                    "CREATE_FIRST_SUMMARY",
-                                    "REFERRAL_APPROVED",
-                                    "BOUNTY_DAO_FEE",
-                                ]
-                            ),
-                        ),
-                        0,
+                items = (
+                    items.filter(
+                        leaderboard_entries__hub_id=hub_id,
+                        leaderboard_entries__timeframe=timeframe,
                     )
-                ).order_by(F("hub_rep").desc(nulls_last=True), "-reputation")
+                    .annotate(hub_rep=F("leaderboard_entries__reputation"))
+                    .order_by(F("hub_rep").desc(nulls_last=True), "-reputation")
+                )
             else:
                 if timeframe == "all_time":
                     items = items.order_by("-reputation")
                 else:
-                    items = items.annotate(
-                        time_rep=Coalesce(
-                            Sum(
-                                "reputation_records__reputation_amount",
-                                filter=Q(
-                                    **time_filter,
-                                )
-                                & ~Q(
-                                    reputation_records__distribution_type__in=[
-                                        "REFERRAL",
-                                        "PURCHASE",
-                                        "REWARD",
-                                        "EDITOR_COMPENSATION",
-                                        "EDITOR_PAYOUT",
-                                        "MOD_PAYOUT",
-                                        "CREATE_BULLET_POINT",
-                                        "CREATE_SUMMARY",
-                                        "SUMMARY_UPVOTED",
-                                        "BULLET_POINT_UPVOTED",
-                                        "CREATE_FIRST_SUMMARY",
-                                        "REFERRAL_APPROVED",
-                                    ]
-                                ),
-                            ),
-                            0,
+                    items = (
+                        items.filter(
+                            leaderboard_entries__hub__isnull=True,
+                            leaderboard_entries__timeframe=timeframe,
                         )
-                    ).order_by(F("time_rep").desc(nulls_last=True), "-reputation")
+                        .annotate(time_rep=F("leaderboard_entries__reputation"))
+                        .order_by(F("time_rep").desc(nulls_last=True), "-reputation")
+                    )
         elif leaderboard_type == "authors":
             serializerClass = AuthorSerializer
             items = Author.objects.filter(user__is_suspended=False).order_by(
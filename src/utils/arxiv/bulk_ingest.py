@@ -0,0 +1,281 @@
+import json
+import os
+import time
+
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils.crypto import get_random_string
+from django.utils.text import slugify
+
+from hub.models import Hub
+from paper.models import Paper
+from researchhub_document.feed_index import refresh_feed_entries
+from researchhub_document.models import DocumentFilter, ResearchhubUnifiedDocument
+from researchhub_document.related_models.constants.document_type import (
+    PAPER as PAPER_DOC_TYPE,
+)
+from researchhub_document.tasks import recalc_hot_scores_batch
+from search.indexing_queue import INDEX_QUEUE_UPDATE, enqueue_index_update
+from utils.arxiv.metadata_parser import iter_arxiv_metadata
+
+
+class PaperInsertQuerySet(QuerySet):
+    """
+    bulk_create counterpart of Paper._do_insert, which skips the generated
+    search vector columns. Postgres rejects explicit values for them.
+    """
+
+    def _batched_insert(self, objs, fields, *args, **kwargs):
+        fields = [
+            field for field in fields if field.attname not in Paper.FIELDS_TO_EXCLUDE
+        ]
+        return super()._batched_insert(objs, fields, *args, **kwargs)
+
+
+class ArxivBulkIngestor:
+    """
+    Streams arXiv metadata files into papers in bulk_create batches.
+
+    Existing url/pdf_url/doi values are indexed once up front and hubs
+    are resolved from a preloaded name map, so a batch costs a fixed
+    number of queries regardless of its size. Progress is written to an
+    optional checkpoint file after every batch so an interrupted run
+    resumes where it stopped.
+
+    bulk_create skips the post_save handlers, so every batch enqueues the
+    search index updates, refreshes the feed entries and schedules the
+    hot score recalculation of the documents it touched.
+    """
+
+    def __init__(self, batch_size=500, checkpoint_path=None):
+        self.batch_size = batch_size
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint = self._load_checkpoint()
+
+        self.stats = {"read": 0, "created": 0, "existing": 0, "failed": 0}
+        self.started_at = None
+
+        self.paper_ids_by_key = {}
+        self.hub_ids_by_name = {}
+        self.pending_papers = []
+        self.pending_hub_ids = []
+        self.pending_existing_hubs = []
+
+    def _load_checkpoint(self):
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path) as checkpoint_file:
+                return json.load(checkpoint_file)
+        return {"completed": [], "positions": {}}
+
+    def _save_checkpoint(self):
+        if not self.checkpoint_path:
+            return
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w") as checkpoint_file:
+            json.dump(self.checkpoint, checkpoint_file)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _load_indexes(self):
+        papers = Paper.objects.values_list("id", "url", "pdf_url", "doi")
+        for paper_id, url, pdf_url, doi in papers.iterator(chunk_size=10000):
+            for key in (url, pdf_url, doi):
+                if key:
+                    self.paper_ids_by_key[key] = paper_id
+
+        self.hub_ids_by_name = dict(Hub.objects.values_list("name", "id"))
+
+    def _get_hub_id(self, name):
+        # Called outside of the batch transaction, so a cached id never
+        # refers to a hub that was rolled back
+        hub_id = self.hub_ids_by_name.get(name)
+        if hub_id is None:
+            hub, _ = Hub.objects.get_or_create(name=name)
+            hub_id = self.hub_ids_by_name[name] = hub.id
+        return hub_id
+
+    def _find_existing(self, record):
+        for key in (record.arxiv_url, record.pdf_url, record.raw_doi):
+            if key and key in self.paper_ids_by_key:
+                return self.paper_ids_by_key[key]
+        return None
+
+    def _build_paper(self, record):
+        slug = slugify(record.raw_title) or get_random_string(length=32)
+        return Paper(
+            doi=record.raw_doi,
+            abstract=record.raw_abstract,
+            is_public=True,
+            paper_publish_date=record.raw_date,
+            paper_title=record.raw_title,
+            title=record.raw_title,
+            pdf_url=record.pdf_url,
+            raw_authors=record.raw_authors,
+            retrieved_from_external_source=True,
+            external_source="arxiv",
+            url=record.arxiv_url,
+            slug=slug,
+        )
+
+    def _add(self, record):
+        existing_id = self._find_existing(record)
+        if existing_id is not None:
+            self.stats["existing"] += 1
+            self.pending_existing_hubs.extend(
+                (existing_id, self._get_hub_id(name)) for name in record.hub_names
+            )
+            return
+
+        paper = self._build_paper(record)
+        self.pending_papers.append(paper)
+        self.pending_hub_ids.append(
+            [self._get_hub_id(name) for name in record.hub_names]
+        )
+        # Index right away so duplicates later in the stream are caught
+        for key in (paper.url, paper.pdf_url, paper.doi):
+            if key:
+                self.paper_ids_by_key[key] = paper
+
+    def _flush(self):
+        papers = self.pending_papers
+        hub_ids = self.pending_hub_ids
+        # Existing pairs may point at papers of this batch, so resolve them
+        # after the batch has ids
+        existing_hubs = self.pending_existing_hubs
+        with transaction.atomic():
+            document_filters = DocumentFilter.objects.bulk_create(
+                [DocumentFilter() for _ in papers], batch_size=self.batch_size
+            )
+            unified_documents = ResearchhubUnifiedDocument.objects.bulk_create(
+                [
+                    ResearchhubUnifiedDocument(
+                        document_type=PAPER_DOC_TYPE,
+                        document_filter=document_filter,
+                        hot_score=0,
+                        score=0,
+                    )
+                    for document_filter in document_filters
+                ],
+                batch_size=self.batch_size,
+            )
+            for paper, unified_document in zip(papers, unified_documents):
+                paper.unified_document = unified_document
+            PaperInsertQuerySet(Paper).bulk_create(papers, batch_size=self.batch_size)
+
+            paper_hubs = []
+            unified_document_hubs = []
+            for paper, paper_hub_ids in zip(papers, hub_ids):
+                for hub_id in paper_hub_ids:
+                    paper_hubs.append((paper.id, hub_id))
+                    unified_document_hubs.append((paper.unified_document_id, hub_id))
+
+            existing_hubs = [
+                (getattr(paper_id, "id", paper_id), hub_id)
+                for paper_id, hub_id in existing_hubs
+            ]
+            unified_document_ids_by_paper = dict(
+                Paper.objects.filter(
+                    id__in={paper_id for paper_id, _ in existing_hubs}
+                ).values_list("id", "unified_document_id")
+            )
+            for paper_id, hub_id in existing_hubs:
+                paper_hubs.append((paper_id, hub_id))
+                unified_document_id = unified_document_ids_by_paper.get(paper_id)
+                if unified_document_id is not None:
+                    unified_document_hubs.append((unified_document_id, hub_id))
+
+            Paper.hubs.through.objects.bulk_create(
+                [
+                    Paper.hubs.through(paper_id=paper_id, hub_id=hub_id)
+                    for paper_id, hub_id in paper_hubs
+                ],
+                batch_size=self.batch_size,
+                ignore_conflicts=True,
+            )
+            ResearchhubUnifiedDocument.hubs.through.objects.bulk_create(
+                [
+                    ResearchhubUnifiedDocument.hubs.through(
+                        researchhubunifieddocument_id=unified_document_id,
+                        hub_id=hub_id,
+                    )
+                    for unified_document_id, hub_id in unified_document_hubs
+                ],
+                batch_size=self.batch_size,
+                ignore_conflicts=True,
+            )
+
+        for paper in papers:
+            for key in (paper.url, paper.pdf_url, paper.doi):
+                if key:
+                    self.paper_ids_by_key[key] = paper.id
+
+        self._update_derived_data(
+            {paper_id for paper_id, _ in paper_hubs},
+            {unified_document_id for unified_document_id, _ in unified_document_hubs}
+            | {paper.unified_document_id for paper in papers},
+        )
+
+        self.stats["created"] += len(papers)
+        self.pending_papers = []
+        self.pending_hub_ids = []
+        self.pending_existing_hubs = []
+
+    def _update_derived_data(self, paper_ids, unified_document_ids):
+        for paper_id in paper_ids:
+            enqueue_index_update(INDEX_QUEUE_UPDATE, "paper", "Paper", paper_id)
+        if not unified_document_ids:
+            return
+
+        refresh_feed_entries(unified_document_ids)
+        recalc_hot_scores_batch.apply_async(
+            (list(unified_document_ids),),
+            priority=5,
+        )
+
+    def _print_stats(self, path):
+        elapsed = max(time.monotonic() - self.started_at, 1e-6)
+        print(
+            f"{path}: read {self.stats['read']}"
+            f" created {self.stats['created']}"
+            f" existing {self.stats['existing']}"
+            f" failed {self.stats['failed']}"
+            f" ({self.stats['read'] / elapsed:.0f} records/s)"
+        )
+
+    def ingest_file(self, path):
+        if path in self.checkpoint["completed"]:
+            print(f"Skipping {path}, already ingested")
+            return
+
+        resume_from = self.checkpoint["positions"].get(path, 0)
+        position = 0
+        for record in iter_arxiv_metadata(path):
+            position += 1
+            if position <= resume_from:
+                continue
+
+            self.stats["read"] += 1
+            if record is None:
+                self.stats["failed"] += 1
+            else:
+                self._add(record)
+
+            if len(self.pending_papers) + len(self.pending_existing_hubs) >= (
+                self.batch_size
+            ):
+                self._flush()
+                self.checkpoint["positions"][path] = position
+                self._save_checkpoint()
+                self._print_stats(path)
+
+        self._flush()
+        self.checkpoint["positions"].pop(path, None)
+        self.checkpoint["completed"].append(path)
+        self._save_checkpoint()
+        self._print_stats(path)
+
+    def ingest(self, paths):
+        self.started_at = time.monotonic()
+        self._load_indexes()
+        for path in paths:
+            self.ingest_file(path)
+        return self.stats
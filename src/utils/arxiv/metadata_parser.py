@@ -1,6 +1,7 @@
 import gzip
 import os
 import shutil
+import xml.etree.ElementTree as ElementTree
 import xmltodict
 
 from django.db.models import Q
@@ -33,8 +34,15 @@ class ArxivMetadata:
         self.raw_title = title
 
         self.arxiv_url = self._build_arxiv_url()
-        self.hubs = self._convert_categories_to_hubs()
+        self.hub_names = [name.lower() for name in self.raw_category_names]
         self.pdf_url = self._build_pdf_url()
+        self._hubs = None
+
+    @property
+    def hubs(self):
+        if self._hubs is None:
+            self._hubs = self._convert_categories_to_hubs()
+        return self._hubs
 
     def create_paper(self):
         paper = None
@@ -74,8 +82,8 @@ class ArxivMetadata:
 
     def _convert_categories_to_hubs(self):
         hubs = []
-        for category in self.raw_category_names:
-            hub, created = Hub.objects.get_or_create(name=category.lower())
+        for hub_name in self.hub_names:
+            hub, created = Hub.objects.get_or_create(name=hub_name)
             hubs.append(hub)
         return hubs
 
@@ -133,6 +141,72 @@ def parse_arxiv_metadata(path_to_file):
     return records
 
 
+def _strip_namespace(tag):
+    return tag.rsplit('}', 1)[-1]
+
+
+def _element_to_dict(element):
+    """
+    Converts an element into the same shape xmltodict produces, so the
+    parse_* functions work on streamed records too.
+    """
+    children = list(element)
+    if not children and not element.attrib:
+        return element.text
+
+    result = {f'@{key}': value for key, value in element.attrib.items()}
+    for child in children:
+        tag = _strip_namespace(child.tag)
+        value = _element_to_dict(child)
+        if tag in result:
+            if not isinstance(result[tag], list):
+                result[tag] = [result[tag]]
+            result[tag].append(value)
+        else:
+            result[tag] = value
+    if element.text and element.text.strip() and not children:
+        result['#text'] = element.text
+    return result
+
+
+def iter_arxiv_metadata(path_to_file):
+    """
+    Streams ArxivMetadata records from an OAI-PMH .xml or .xml.gz file
+    without extracting it or loading the whole document into memory.
+    Records that fail to parse are yielded as None so callers can keep
+    an accurate position in the file.
+    """
+    opener = gzip.open if path_to_file.endswith('.gz') else open
+    with opener(path_to_file, 'rb') as file:
+        context = ElementTree.iterparse(file, events=('start', 'end'))
+        _, container = next(context)
+        for event, element in context:
+            tag = _strip_namespace(element.tag)
+            if event == 'start':
+                if tag == 'ListRecords':
+                    container = element
+                continue
+            if tag != 'record':
+                continue
+
+            parsed = None
+            try:
+                metadata = {
+                    _strip_namespace(child.tag): _element_to_dict(child)
+                    for child in element.find('{*}metadata')
+                }
+                if 'arXivRaw' in metadata:
+                    parsed = parse_arXivRaw_format(metadata['arXivRaw'])
+                else:
+                    parsed = parse_arXiv_format(metadata['arXiv'])
+            except Exception as e:
+                print(path_to_file, e)
+
+            yield parsed
+            # Drop parsed records so memory stays flat across the file
+            container.clear()
+
+
 def parse_arXiv_format(metadata):
     abstract = metadata['abstract']
     arxiv_id = metadata['id']
@@ -0,0 +1,25 @@
+from django.core.cache import cache
+
+
+def incr_cache_counter(key, delta=1, timeout=None):
+    """
+    Adds `delta` to the integer stored at `key`, creating it if needed,
+    and returns the new value.
+    """
+    cache.add(key, 0, timeout=timeout)
+    try:
+        return cache.incr(key, delta)
+    except ValueError:
+        # Key was evicted between add and incr
+        cache.set(key, delta, timeout=timeout)
+        return delta
+
+
+def get_cache_counters(prefix, names):
+    keys = {f"{prefix}_{name}": name for name in names}
+    values = cache.get_many(keys.keys())
+    return {name: values.get(key, 0) for key, name in keys.items()}
+
+
+def reset_cache_counters(prefix, names):
+    cache.delete_many([f"{prefix}_{name}" for name in names])
@@ -0,0 +1,107 @@
+import time
+
+from django.core.cache import cache
+
+from utils.cache import get_cache_counters, incr_cache_counter, reset_cache_counters
+
+# Counted by every queue in addition to its own metrics
+CACHE_QUEUE_METRICS = ("lost", "resets")
+
+
+class CacheQueue:
+    """
+    FIFO queue kept in the shared cache. Producers take an index from the
+    tail counter and write their value to that slot; a single consumer,
+    guarded by `run_exclusively`, reads slots from head + 1 to the tail
+    and then advances the head.
+
+    Cache eviction is handled rather than prevented: missing slots are
+    counted as "lost", and a tail that restarted below the head resets
+    the head with it.
+    """
+
+    def __init__(self, prefix, metrics, slot_timeout, lock_timeout):
+        self.prefix = prefix
+        self.metrics = tuple(dict.fromkeys((*metrics, *CACHE_QUEUE_METRICS)))
+        self.slot_timeout = slot_timeout
+        self.lock_timeout = lock_timeout
+
+    def get_key(self, name):
+        return f"{self.prefix}_{name}"
+
+    def get_slot_key(self, index):
+        return self.get_key(f"slot_{index}")
+
+    def incr_metric(self, metric, delta=1):
+        return incr_cache_counter(self.get_key(f"metrics_{metric}"), delta)
+
+    def set_metric(self, metric, value):
+        cache.set(self.get_key(f"metrics_{metric}"), value, timeout=None)
+
+    def get_metrics(self):
+        metrics = get_cache_counters(self.get_key("metrics"), self.metrics)
+        metrics["backlog"] = self.size()
+        return metrics
+
+    def reset_metrics(self):
+        reset_cache_counters(self.get_key("metrics"), self.metrics)
+
+    def get_head(self):
+        return cache.get(self.get_key("head"), 0)
+
+    def size(self):
+        return max(cache.get(self.get_key("tail"), 0) - self.get_head(), 0)
+
+    def push(self, value):
+        """Appends `value` and returns its slot index."""
+        index = incr_cache_counter(self.get_key("tail"))
+        cache.set(self.get_slot_key(index), value, timeout=self.slot_timeout)
+        return index
+
+    def get_range(self, max_size):
+        """Returns (head, tail) of the next at most `max_size` slots."""
+        head = self.get_head()
+        tail = cache.get(self.get_key("tail"), 0)
+        if tail < head:
+            # The tail was evicted and restarted from zero, restart the head
+            # with it or the queue would stall until the tail caught up
+            self.incr_metric("resets")
+            head = 0
+            cache.set(self.get_key("head"), head, timeout=None)
+        return head, min(tail, head + max_size)
+
+    def read(self, head, tail):
+        """
+        Returns the values of the slots after `head` up to `tail`, in queue
+        order. Slots that are missing are counted as lost.
+        """
+        slot_keys = [self.get_slot_key(index) for index in range(head + 1, tail + 1)]
+        slots = cache.get_many(slot_keys)
+        missing = [key for key in slot_keys if key not in slots]
+        if missing:
+            # A producer may have bumped the tail without writing its slot
+            # yet, give it one more look before giving up on it
+            time.sleep(0.5)
+            slots.update(cache.get_many(missing))
+            lost = len(slot_keys) - len(slots)
+            if lost:
+                self.incr_metric("lost", lost)
+        return [slots[key] for key in slot_keys if key in slots]
+
+    def advance(self, head, tail):
+        """Moves the head to `tail` and deletes the slots it passed."""
+        cache.set(self.get_key("head"), tail, timeout=None)
+        cache.delete_many(
+            [self.get_slot_key(index) for index in range(head + 1, tail + 1)]
+        )
+
+    def run_exclusively(self, func):
+        """Runs `func` unless another consumer holds the lock, then returns 0."""
+        lock_key = self.get_key("lock")
+        if not cache.add(lock_key, True, timeout=self.lock_timeout):
+            return 0
+
+        try:
+            return func()
+        finally:
+            cache.delete(lock_key)
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+
+class MetricsCommand(BaseCommand):
+    """
+    Prints a set of counters and optionally resets them. Subclasses set
+    `get_metrics` and `reset_metrics` to the functions of their module.
+    """
+
+    get_metrics = None
+    reset_metrics = None
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Reset the counters after printing them",
+        )
+
+    def handle(self, *args, **options):
+        for metric, value in self.get_metrics().items():
+            self.stdout.write(f"{metric}: {value}")
+
+        if options["reset"]:
+            self.reset_metrics()
@@ -4,8 +4,9 @@ import sift.client
 from ipware import get_client_ip
 
 from django.apps import apps
+from django.core.cache import cache
 
-from researchhub.celery import app
+from researchhub.celery import QUEUE_SIFT, app
 from researchhub.settings import SIFT_ACCOUNT_ID, SIFT_REST_API_KEY
 from utils import sentry
 
@@ -13,6 +14,9 @@ from utils import sentry
 
 client = sift.Client(api_key=SIFT_REST_API_KEY, account_id=SIFT_ACCOUNT_ID)
 
+SIFT_SUSPENSION_RISK_SCORE = 90
+SIFT_RISK_SCORE_CACHE_TIMEOUT = 60 * 60 * 24
+
 
 def get_user_score(user_id):
     try:
@@ -51,57 +55,107 @@ def unlabel_user(user_id):
         print(e.api_error_message)
 
 
-def get_tracked_content_score(tracked_content):
-    score_response = tracked_content.get('score_response', None)
-    if score_response:
-        score = score_response['scores']['content_abuse']['score']
-        score = round(score * 100, 1)
-        return score
-    return None
+def get_user_risk_score_cache_key(user_id):
+    return f'sift_risk_score_{user_id}'
+
+
+def get_cached_user_risk_score(user):
+    """
+    Latest Sift risk score of `user` from the cache or the user row.
+    Never calls Sift, scores are stored by the account and login tasks.
+    """
+    score = cache.get(get_user_risk_score_cache_key(user.id))
+    if score is None:
+        score = user.sift_risk_score
+        if score is not None:
+            cache.set(
+                get_user_risk_score_cache_key(user.id),
+                score,
+                timeout=SIFT_RISK_SCORE_CACHE_TIMEOUT,
+            )
+    return score
+
 
+def store_user_risk_score(user, response_body):
+    """
+    Records the user's content abuse score from a Sift track response.
+    Only the score is stored, suspending stays a separate decision.
+    """
+    score_response = (response_body or {}).get('score_response')
+    if not score_response:
+        return None
 
-def update_user_risk_score(user, tracked_content):
-    if tracked_content:
-        content_risk_score = get_tracked_content_score(tracked_content)
-        if content_risk_score:
-            user.sift_risk_score = content_risk_score
-            user.save(update_fields=['sift_risk_score'])
-            check_user_risk(user)
+    score = round(score_response['scores']['content_abuse']['score'] * 100, 1)
+    user.sift_risk_score = score
+    user.save(update_fields=['sift_risk_score'])
+    cache.set(
+        get_user_risk_score_cache_key(user.id),
+        score,
+        timeout=SIFT_RISK_SCORE_CACHE_TIMEOUT,
+    )
+    return score
 
 
 def check_user_risk(user):
-    sift_risk_score = user.sift_risk_score
-    if sift_risk_score and sift_risk_score > 90:
+    sift_risk_score = get_cached_user_risk_score(user)
+    if sift_risk_score and sift_risk_score > SIFT_SUSPENSION_RISK_SCORE:
         user.set_suspended(is_manual=False)
 
 
 class DecisionsApi:
     def apply_bad_user_decision(self, content_creator, source='AUTOMATED_RULE', reporter=None):
+        self.celery_apply_bad_user_decision.apply_async(
+            (
+                content_creator.id,
+                source,
+                reporter.email if reporter else None,
+            ),
+            priority=4,
+            queue=QUEUE_SIFT,
+        )
+
+    @staticmethod
+    @app.task
+    def celery_apply_bad_user_decision(user_id, source, reporter_email):
         applyDecisionRequest = {
             'decision_id': 'looks_bad_content_abuse',
             'source': source,
-            'analyst': reporter.email if reporter else 'analyst@researchhub.com',
+            'analyst': reporter_email or 'analyst@researchhub.com',
             'description': 'User looks risky for content abuse',
             'reason': 'User looks risky for content abuse',
         }
 
         try:
-            client.apply_user_decision(str(content_creator.id), applyDecisionRequest)
+            client.apply_user_decision(str(user_id), applyDecisionRequest)
         except sift.client.ApiException as e:
             sentry.log_error(e)
             print(e)
 
     def apply_bad_content_decision(self, content_creator, content_id, source='AUTOMATED_RULE', reporter=None):
+        self.celery_apply_bad_content_decision.apply_async(
+            (
+                content_creator.id,
+                content_id,
+                source,
+                reporter.email if reporter else None,
+            ),
+            priority=4,
+            queue=QUEUE_SIFT,
+        )
+
+    @staticmethod
+    @app.task
+    def celery_apply_bad_content_decision(user_id, content_id, source, reporter_email):
         applyDecisionRequest = {
             'decision_id': 'content_looks_bad_content_abuse',
             'source': source,
-            'analyst': reporter.email if reporter else 'analyst@researchhub.com',
+            'analyst': reporter_email or 'analyst@researchhub.com',
             'description': 'Auto flag of moderator-removed content',
             'reason': 'Auto flag of moderator-removed content',
         }
 
         try:
-            client.apply_content_decision(str(content_creator.id), content_id, applyDecisionRequest)
+            client.apply_content_decision(str(user_id), content_id, applyDecisionRequest)
         except sift.client.ApiException as e:
             sentry.log_error(e)
             print(e)
@@ -140,8 +194,14 @@ class EventsApi:
         track_type = '$update_account' if update else '$create_account'
 
         try:
-            response = client.track(track_type, properties, return_score=False)
+            response = client.track(
+                track_type,
+                properties,
+                return_score=True,
+                abuse_types=['content_abuse'],
+            )
             print(response.body)
+            store_user_risk_score(user, response.body)
             return response.body
         except sift.client.ApiException as e:
             sentry.log_error(e)
@@ -149,24 +209,22 @@ class EventsApi:
 
     def track_account(self, user, request, update=False):
         meta = self.create_meta_properties(request, exclude_ip=True)
-        celery_response = self.celery_track_account.apply(
-                (user.id, meta, update),
-                priority=4,
-                countdown=10,
-            )
-        tracked_account = celery_response.get()
-        return tracked_account
+        self.celery_track_account.apply_async(
+            (user.id, meta, update),
+            priority=4,
+            countdown=10,
+            queue=QUEUE_SIFT,
+        )
 
     def track_login(self, user, login_status, request):
         # https://sift.com/developers/docs/python/events-api/reserved-events/login
         meta = self.create_meta_properties(request)
-        celery_response = self.celery_track_login.apply(
+        self.celery_track_login.apply_async(
             (user.id, meta, login_status),
             priority=4,
-            countdown=10
+            countdown=10,
+            queue=QUEUE_SIFT,
         )
-        tracked_login = celery_response.get()
-        return tracked_login
 
     @staticmethod
     @app.task
@@ -182,8 +240,14 @@ class EventsApi:
         }
 
         try:
-            response = client.track('$login', properties, return_score=False)
+            response = client.track(
+                '$login',
+                properties,
+                return_score=True,
+                abuse_types=['content_abuse'],
+            )
             print(response.body)
+            store_user_risk_score(user, response.body)
             return response.body
         except sift.client.ApiException as e:
             sentry.log_error(e)
@@ -198,7 +262,7 @@ class EventsApi:
         update=False
     ):
         meta = self.create_meta_properties(request)
-        celery_response = self.celery_track_content_comment.apply(
+        self.celery_track_content_comment.apply_async(
             (
                 user.id,
                 comment.id,
@@ -208,10 +272,9 @@ class EventsApi:
                 update
             ),
             priority=4,
-            countdown=10
+            countdown=10,
+            queue=QUEUE_SIFT,
         )
-        tracked_comment = celery_response.get()
-        return tracked_comment
 
     @staticmethod
     @app.task
@@ -267,13 +330,12 @@ class EventsApi:
 
     def track_content_paper(self, user, paper, request, update=False):
         meta = self.create_meta_properties(request)
-        celery_response = self.celery_track_content_paper.apply(
+        self.celery_track_content_paper.apply_async(
             (user.id, paper.id, meta, update),
             priority=4,
             countdown=10,
+            queue=QUEUE_SIFT,
         )
-        tracked_paper = celery_response.get()
-        return tracked_paper
 
     @staticmethod
     @app.task
@@ -312,16 +374,15 @@ class EventsApi:
         except sift.client.ApiException as e:
             sentry.log_error(e)
             print(e.api_error_message)
-    
+
     def track_content_summary(self, user, summary, request, update=False):
         meta = self.create_meta_properties(request)
-        celery_response = self.celery_track_content_summary.apply(
+        self.celery_track_content_summary.apply_async(
             (user.id, summary.id, meta, update),
             priority=4,
             countdown=10,
+            queue=QUEUE_SIFT,
         )
-        tracked_summary = celery_response.get()
-        return tracked_summary
 
     @staticmethod
     @app.task
@@ -366,13 +427,12 @@ class EventsApi:
 
     def track_content_bullet_point(self, user, bullet_point, request, update=False):
         meta = self.create_meta_properties(request)
-        celery_response = self.celery_track_content_bullet_point.apply(
+        self.celery_track_content_bullet_point.apply_async(
             (user.id, bullet_point.id, meta, update),
             priority=4,
             countdown=10,
+            queue=QUEUE_SIFT,
         )
-        tracked_bullet_point = celery_response.get()
-        return tracked_bullet_point
 
     @staticmethod
     @app.task
@@ -418,7 +478,7 @@ class EventsApi:
     def track_content_vote(self, user, vote, request, update=False):
         meta = self.create_meta_properties(request)
         vote_type = vote.__module__.split('.')[0]
-        celery_response =self.celery_track_content_vote.apply(
+        self.celery_track_content_vote.apply_async(
             (
                 user.id,
                 vote.id,
@@ -427,10 +487,9 @@ class EventsApi:
                 update
             ),
             priority=4,
-            countdown=10
+            countdown=10,
+            queue=QUEUE_SIFT,
         )
-        tracked_vote = celery_response.get()
-        return tracked_vote
 
     @staticmethod
     @app.task
@@ -472,8 +531,17 @@ class EventsApi:
         # https://sift.com/developers/docs/curl/events-api/reserved-events/flag-content
         if not user:
             return None
+        self.celery_track_flag_content.apply_async(
+            (user.id, content_id, referer_id),
+            priority=4,
+            queue=QUEUE_SIFT,
+        )
+
+    @staticmethod
+    @app.task
+    def celery_track_flag_content(user_id, content_id, referer_id):
         properties = {
-            '$user_id': str(user.id),
+            '$user_id': str(user_id),
             '$content_id': content_id,
             '$flagged_by': str(referer_id),
         }
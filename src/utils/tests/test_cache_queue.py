@@ -0,0 +1,49 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from utils.cache_queue import CacheQueue
+
+
+class CacheQueueTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.queue = CacheQueue("test_queue", ("pushed",), 60, 60)
+
+    def test_reads_slots_in_order_until_advanced(self):
+        for value in ("a", "b", "c"):
+            self.queue.push(value)
+
+        head, tail = self.queue.get_range(2)
+        self.assertEqual((head, tail), (0, 2))
+        self.assertEqual(self.queue.read(head, tail), ["a", "b"])
+        # Reading does not consume, only advancing does
+        self.assertEqual(self.queue.get_range(2), (0, 2))
+
+        self.queue.advance(head, tail)
+        self.assertEqual(self.queue.size(), 1)
+        self.assertIsNone(cache.get(self.queue.get_slot_key(1)))
+        self.assertEqual(self.queue.read(*self.queue.get_range(2)), ["c"])
+
+    def test_missing_slots_are_counted_as_lost(self):
+        for value in ("a", "b", "c"):
+            self.queue.push(value)
+        cache.delete(self.queue.get_slot_key(2))
+
+        self.assertEqual(self.queue.read(0, 3), ["a", "c"])
+        self.assertEqual(self.queue.get_metrics()["lost"], 1)
+
+    def test_head_resets_when_the_tail_restarts(self):
+        self.queue.push("a")
+        self.queue.push("b")
+        self.queue.advance(0, 2)
+        cache.delete(self.queue.get_key("tail"))
+        self.queue.push("c")
+
+        self.assertEqual(self.queue.get_range(10), (0, 1))
+        self.assertEqual(self.queue.get_metrics()["resets"], 1)
+
+    def test_run_exclusively_skips_while_locked(self):
+        self.assertEqual(self.queue.run_exclusively(lambda: 1), 1)
+
+        cache.add(self.queue.get_key("lock"), True)
+        self.assertEqual(self.queue.run_exclusively(lambda: 1), 0)
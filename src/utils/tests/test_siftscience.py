@@ -0,0 +1,98 @@
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+
+from discussion.reaction_models import Vote
+from discussion.tests.helpers import create_rh_comment, create_vote
+from paper.tests.helpers import create_paper
+from researchhub.celery import QUEUE_SIFT
+from user.tests.helpers import create_random_default_user
+from utils.siftscience import (
+    EventsApi,
+    get_cached_user_risk_score,
+    store_user_risk_score,
+)
+
+
+class FakeResult:
+    def get(self, *args, **kwargs):
+        raise AssertionError("Request handlers must not wait on Sift")
+
+
+class FakeTask:
+    """Records what is enqueued instead of sending it to Sift."""
+
+    def __init__(self):
+        self.calls = []
+
+    def apply_async(self, args, **kwargs):
+        self.calls.append((args, kwargs))
+        return FakeResult()
+
+    def apply(self, *args, **kwargs):
+        raise AssertionError("Tracking must not run in the request")
+
+
+class SiftTrackingTests(TestCase):
+    def setUp(self):
+        self.user = create_random_default_user("sift_user")
+        self.paper = create_paper(uploaded_by=self.user)
+        self.request = RequestFactory().post("/", HTTP_USER_AGENT="test")
+        self.events_api = EventsApi()
+
+    def _fake_task(self, name):
+        task = FakeTask()
+        setattr(self.events_api, name, task)
+        return task
+
+    def _assert_enqueued_on_sift(self, task):
+        self.assertEqual(len(task.calls), 1)
+        _, kwargs = task.calls[0]
+        self.assertEqual(kwargs["queue"], QUEUE_SIFT)
+
+    def test_account_and_login_tracking_are_enqueued(self):
+        account_task = self._fake_task("celery_track_account")
+        login_task = self._fake_task("celery_track_login")
+
+        self.events_api.track_account(self.user, self.request)
+        self.events_api.track_login(self.user, "$success", self.request)
+
+        self._assert_enqueued_on_sift(account_task)
+        self._assert_enqueued_on_sift(login_task)
+
+    def test_content_tracking_is_enqueued(self):
+        comment_task = self._fake_task("celery_track_content_comment")
+        paper_task = self._fake_task("celery_track_content_paper")
+        vote_task = self._fake_task("celery_track_content_vote")
+        comment = create_rh_comment(paper=self.paper, created_by=self.user)
+        vote = create_vote(self.user, self.paper, Vote.UPVOTE)
+
+        self.events_api.track_content_comment(self.user, comment, self.request)
+        self.events_api.track_content_paper(self.user, self.paper, self.request)
+        self.events_api.track_content_vote(self.user, vote, self.request)
+
+        self._assert_enqueued_on_sift(comment_task)
+        self._assert_enqueued_on_sift(paper_task)
+        self._assert_enqueued_on_sift(vote_task)
+
+
+class SiftRiskScoreTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = create_random_default_user("sift_risk_user")
+
+    def test_cached_score_falls_back_to_the_user(self):
+        self.assertIsNone(get_cached_user_risk_score(self.user))
+
+        self.user.sift_risk_score = 12.5
+        self.assertEqual(get_cached_user_risk_score(self.user), 12.5)
+
+    def test_stored_score_is_cached_without_suspending(self):
+        body = {"score_response": {"scores": {"content_abuse": {"score": 0.95}}}}
+
+        self.assertEqual(store_user_risk_score(self.user, body), 95.0)
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.sift_risk_score, 95.0)
+        self.assertFalse(self.user.is_suspended)
+        self.user.sift_risk_score = None
+        self.assertEqual(get_cached_user_risk_score(self.user), 95.0)